@@ -0,0 +1,101 @@
+"""
+消息分批基准测试
+
+用 output/ 下的样例快照构造约 5000 条标题的报告，对比逐条拼接并整体重新编码的旧分批实现
+（从 git 历史读取）与 BatchBuilder 的耗时，并校验各渠道、各模式下的分批结果逐字节一致。
+
+用法（项目根目录下）：
+    python benchmarks/batch_builder_bench.py [--titles 5000] [--rounds 3] [--rev 6db57b8^]
+"""
+
+import argparse
+import sys
+import time
+
+from bench_utils import build_sample_report, load_baseline, main
+
+FORMATS = ("feishu", "dingtalk", "wework", "telegram", "ntfy")
+UPDATE_INFO = {"remote_version": "9.9.9", "current_version": main.VERSION}
+
+
+def split_all(split, report_data, formats, max_bytes=None, update_info=None, mode="daily"):
+    """对每个格式分批一次"""
+    return {
+        format_type: split(report_data, format_type, update_info, max_bytes, mode)
+        for format_type in formats
+    }
+
+
+def timed(func, rounds: int):
+    """返回 (最短耗时, 最后一次结果)；新实现每轮前清空标题渲染缓存，测的是单份报告的冷启动"""
+    best = None
+    for _ in range(rounds):
+        main._title_fragments.clear()
+        start = time.perf_counter()
+        result = func()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def main_bench():
+    arg_parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    arg_parser.add_argument("--titles", type=int, default=5000)
+    arg_parser.add_argument("--rounds", type=int, default=3)
+    arg_parser.add_argument("--rev", default="6db57b8^", help="单次拼接分批之前的提交")
+    args = arg_parser.parse_args()
+
+    baseline = load_baseline(args.rev, ["split_content_into_batches"])
+    # 页眉页脚含当前时间，两种实现使用同一时刻
+    now = main.get_beijing_time()
+    main.get_beijing_time = baseline["get_beijing_time"] = lambda: now
+    old_split = baseline["split_content_into_batches"]
+    new_split = main.split_content_into_batches
+
+    report_data, _ = build_sample_report(args.titles)
+    stat_titles = sum(len(stat["titles"]) for stat in report_data["stats"])
+    print(
+        f"报告：词组 {len(report_data['stats'])} 个共 {stat_titles} 条标题，"
+        f"新增新闻 {report_data['total_new_count']} 条"
+    )
+
+    # 结果一致性：各格式 × 批次大小 × 模式 × 是否带版本更新信息
+    # （旧实现单批越大越慢，一致性只校验到 20000 字节，1MB 单批在测时时比对）
+    cases = 0
+    for max_bytes in (None, 1000, 4000, 20000):
+        for mode in ("daily", "current", "incremental"):
+            for update_info in (None, UPDATE_INFO):
+                expected = split_all(old_split, report_data, FORMATS, max_bytes, update_info, mode)
+                actual = split_all(new_split, report_data, FORMATS, max_bytes, update_info, mode)
+                for format_type in FORMATS:
+                    cases += 1
+                    if expected[format_type] != actual[format_type]:
+                        print(f"结果不一致：{format_type} max_bytes={max_bytes} mode={mode}")
+                        return 1
+    print(f"分批结果逐字节一致（{cases} 种组合）")
+
+    scenarios = [
+        ("5 个渠道，默认批次大小", FORMATS, None),
+        ("飞书单批 max_bytes=1MB", ("feishu",), 1_000_000),
+    ]
+    for name, formats, max_bytes in scenarios:
+        old_time, old_batches = timed(
+            lambda: split_all(old_split, report_data, formats, max_bytes), args.rounds
+        )
+        new_time, new_batches = timed(
+            lambda: split_all(new_split, report_data, formats, max_bytes), args.rounds
+        )
+        if new_batches != old_batches:
+            print(f"结果不一致：{name}")
+            return 1
+        batch_count = sum(len(batches) for batches in new_batches.values())
+        print(
+            f"{name:<24} 旧实现 {old_time:7.3f} s  BatchBuilder {new_time:7.3f} s"
+            f"  批次 {batch_count}"
+        )
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main_bench())
@@ -0,0 +1,116 @@
+"""
+基准测试共用工具
+
+- load_baseline: 从 git 历史中读取优化前 main.py 里的函数，用于与当前实现对比。
+  旧实现只在基准测试中使用，不保留在源码里；读取的函数在 main 模块全局变量的副本中执行，
+  未读取的名称仍引用当前实现，不会影响 main 模块本身。
+- load_sample_titles / build_sample_report: 用 output/ 下的样例快照（只读，不写索引文件）
+  构造指定标题数的报告数据。
+"""
+
+import ast
+import contextlib
+import io
+import os
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict, Iterable, List, Tuple
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+os.chdir(ROOT)
+
+import main  # noqa: E402
+
+
+def load_baseline(rev: str, names: Iterable[str]) -> Dict:
+    """
+    读取指定提交中 main.py 的顶层函数/类
+
+    Args:
+        rev: git 提交（如 "6db57b8^"）
+        names: 要读取的函数或类名
+
+    Returns:
+        执行后的命名空间（main 全局变量的副本，names 中的名称替换为旧实现）
+    """
+    names = set(names)
+    source = subprocess.run(
+        ["git", "show", f"{rev}:main.py"],
+        cwd=ROOT,
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    nodes = [
+        node
+        for node in ast.parse(source).body
+        if isinstance(node, (ast.FunctionDef, ast.ClassDef)) and node.name in names
+    ]
+    missing = names - {node.name for node in nodes}
+    if missing:
+        raise LookupError(f"{rev}:main.py 中没有 {', '.join(sorted(missing))}")
+
+    namespace = dict(vars(main))
+    code = compile(ast.Module(body=nodes, type_ignores=[]), f"{rev}:main.py", "exec")
+    exec(code, namespace)
+    return namespace
+
+
+def sample_txt_files() -> List[Path]:
+    """output/ 下全部 txt 快照，按日期、时间排序"""
+    return sorted((ROOT / "output").glob("*/txt/*.txt"))
+
+
+def load_sample_titles(title_count: int) -> Tuple[Dict, Dict, Dict, Dict]:
+    """
+    按日期顺序合并样例快照，直到标题数达到 title_count
+
+    Returns:
+        (results, id_to_name, title_info, new_titles)，new_titles 为最后一个快照中的标题
+    """
+    results, id_to_name, title_info = {}, {}, {}
+    new_titles = {}
+    for txt_file in sample_txt_files():
+        titles_by_id, names = main.parse_file_titles(txt_file)
+        id_to_name.update(names)
+        for source_id, title_data in titles_by_id.items():
+            main.process_source_data(
+                source_id, title_data, txt_file.stem, results, title_info
+            )
+        new_titles = titles_by_id
+        if sum(len(titles) for titles in results.values()) >= title_count:
+            break
+    return results, id_to_name, title_info, new_titles
+
+
+def build_sample_report(title_count: int, group_size: int = 100, mode: str = "daily") -> Tuple[Dict, int]:
+    """
+    构造包含 title_count 条标题的报告数据
+
+    全部标题按 count_word_frequency 的“全部新闻”排序后每 group_size 条作为一个词组，
+    新增新闻区域取最后一个快照中的标题，另加一个获取失败的平台。
+
+    Returns:
+        (report_data, 标题总数)
+    """
+    results, id_to_name, title_info, new_titles = load_sample_titles(title_count)
+    with contextlib.redirect_stdout(io.StringIO()):
+        stats, total_titles = main.count_word_frequency(
+            results, [], [], id_to_name, title_info, mode=mode
+        )
+        titles = stats[0]["titles"][:title_count]
+        groups = [
+            {
+                "word": f"示例词组{index // group_size + 1}",
+                "count": len(titles[index:index + group_size]),
+                "titles": titles[index:index + group_size],
+                "percentage": 0,
+            }
+            for index in range(0, len(titles), group_size)
+        ]
+        report_data = main.prepare_report_data(
+            groups, ["example-platform"], new_titles, id_to_name, mode, [], []
+        )
+    return report_data, total_titles
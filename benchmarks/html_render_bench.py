@@ -0,0 +1,140 @@
+"""
+HTML 报告渲染基准测试
+
+用 output/ 下的样例快照构造约 3000 条标题的当日汇总，对比整页拼接字符串的旧渲染器
+（从 git 历史读取，汇总文件和 index.html 各完整写一次）与 iter_html_content + write_html_file
+（分段写入，index.html 为硬链接）的耗时和渲染并写出时的内存峰值，并校验输出逐字节一致。
+
+用法（项目根目录下）：
+    python benchmarks/html_render_bench.py [--titles 3000] [--rounds 20] [--rev 70bdc44^]
+"""
+
+import argparse
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+from bench_utils import build_sample_report, load_baseline, main
+
+UPDATE_INFO = {"remote_version": "9.9.9", "current_version": main.VERSION}
+
+
+def old_generate(render, report_data, total_titles, file_path: Path, index_path: Path) -> None:
+    """旧 generate_html_report 的渲染和写文件部分"""
+    html_content = render(report_data, total_titles, True, "daily", None)
+    with open(file_path, "w", encoding="utf-8") as f:
+        f.write(html_content)
+    with open(index_path, "w", encoding="utf-8") as f:
+        f.write(html_content)
+
+
+def new_generate(report_data, total_titles, file_path: Path, index_path: Path) -> None:
+    """当前 generate_html_report 的渲染和写文件部分"""
+    chunks = tuple(main.iter_html_content(report_data, total_titles, True, "daily", None))
+    main.write_html_file(chunks, file_path, [index_path])
+
+
+def best_time(func, rounds: int) -> float:
+    """多轮中的最短耗时（秒）"""
+    best = None
+    for _ in range(rounds):
+        start = time.perf_counter()
+        func()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def traced_peak(func) -> float:
+    """执行期间 tracemalloc 记录的内存峰值（MB）"""
+    tracemalloc.start()
+    try:
+        func()
+        return tracemalloc.get_traced_memory()[1] / 1024 / 1024
+    finally:
+        tracemalloc.stop()
+
+
+def main_bench():
+    arg_parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    arg_parser.add_argument("--titles", type=int, default=3000)
+    arg_parser.add_argument("--rounds", type=int, default=20)
+    arg_parser.add_argument("--rev", default="70bdc44^", help="分段渲染之前的提交")
+    args = arg_parser.parse_args()
+
+    baseline = load_baseline(args.rev, ["render_html_content"])
+    # 页面中含当前时间，两种实现使用同一时刻
+    now = main.get_beijing_time()
+    main.get_beijing_time = baseline["get_beijing_time"] = lambda: now
+    old_render = baseline["render_html_content"]
+    new_render = main.render_html_content
+
+    report_data, total_titles = build_sample_report(args.titles)
+    stat_titles = sum(len(stat["titles"]) for stat in report_data["stats"])
+    print(
+        f"报告：词组 {len(report_data['stats'])} 个共 {stat_titles} 条标题，"
+        f"新增新闻 {report_data['total_new_count']} 条"
+    )
+
+    # 渲染结果一致性：模式 × 是否当日汇总 × 是否带版本更新信息
+    cases = 0
+    for mode in ("daily", "current", "incremental"):
+        for is_daily_summary in (False, True):
+            for update_info in (None, UPDATE_INFO):
+                cases += 1
+                render_args = (report_data, total_titles, is_daily_summary, mode, update_info)
+                if old_render(*render_args) != new_render(*render_args):
+                    print(f"渲染结果不一致：mode={mode} is_daily_summary={is_daily_summary}")
+                    return 1
+
+    html_size = len(new_render(report_data, total_titles, True).encode("utf-8"))
+
+    with tempfile.TemporaryDirectory() as tmp:
+        old_dir = Path(tmp) / "old"
+        new_dir = Path(tmp) / "new"
+        old_dir.mkdir()
+        new_dir.mkdir()
+
+        def run_old():
+            old_generate(
+                old_render, report_data, total_titles, old_dir / "当日汇总.html", old_dir / "index.html"
+            )
+
+        def run_new():
+            new_generate(
+                report_data, total_titles, new_dir / "当日汇总.html", new_dir / "index.html"
+            )
+
+        run_old()
+        run_new()
+        for name in ("当日汇总.html", "index.html"):
+            if (old_dir / name).read_bytes() != (new_dir / name).read_bytes():
+                print(f"写出的 {name} 不一致")
+                return 1
+        linked = (new_dir / "index.html").stat().st_ino == (new_dir / "当日汇总.html").stat().st_ino
+        print(
+            f"渲染结果逐字节一致（{cases} 种组合），写出的汇总文件和 index.html 一致，"
+            f"页面 {html_size / 1024:.0f} KB"
+        )
+        print(f"当前实现的 index.html {'为硬链接' if linked else '为复制的文件'}")
+
+        render_args = (report_data, total_titles, True, "daily", None)
+        old_time = best_time(lambda: old_render(*render_args), args.rounds)
+        new_time = best_time(lambda: new_render(*render_args), args.rounds)
+        print(f"渲染为字符串            旧实现 {old_time * 1000:7.1f} ms  当前 {new_time * 1000:7.1f} ms")
+
+        old_time = best_time(run_old, args.rounds)
+        new_time = best_time(run_new, args.rounds)
+        print(f"渲染并写出两个文件      旧实现 {old_time * 1000:7.1f} ms  当前 {new_time * 1000:7.1f} ms")
+
+        old_peak = traced_peak(run_old)
+        new_peak = traced_peak(run_new)
+        print(f"渲染并写出时内存峰值    旧实现 {old_peak:7.1f} MB  当前 {new_peak:7.1f} MB")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main_bench())
@@ -0,0 +1,121 @@
+"""
+频率词匹配基准测试
+
+用 output/ 下的样例标题，对比逐词子串匹配（原 matches_word_groups 的实现）与
+KeywordMatcher 的耗时，并校验两者对每条标题的匹配结果完全一致。
+词组分别取 config/frequency_words.txt 和由样例标题构造的多词组配置。
+
+用法（项目根目录下）：
+    python benchmarks/keyword_matcher_bench.py [--groups 134]
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+os.chdir(ROOT)
+
+import main  # noqa: E402
+
+
+def substring_matches(title: str, word_groups: list, filter_words: list) -> bool:
+    """逐词子串匹配（KeywordMatcher 之前的实现）"""
+    if not word_groups:
+        return True
+
+    title_lower = title.lower()
+    if any(filter_word.lower() in title_lower for filter_word in filter_words):
+        return False
+
+    for group in word_groups:
+        required_words = group["required"]
+        normal_words = group["normal"]
+        if required_words and not all(word.lower() in title_lower for word in required_words):
+            continue
+        if normal_words and not any(word.lower() in title_lower for word in normal_words):
+            continue
+        return True
+    return False
+
+
+def load_sample_titles() -> list:
+    """读取 output/ 下全部快照中的标题（保留重复，与实际运行时的调用次数一致）"""
+    titles = []
+    for txt_file in sorted((ROOT / "output").glob("*/txt/*.txt")):
+        titles_by_id, _ = main.parse_file_titles(txt_file)
+        for platform_titles in titles_by_id.values():
+            titles.extend(platform_titles)
+    return titles
+
+
+def synthetic_groups(titles: list, count: int, rng: random.Random) -> tuple:
+    """从样例标题中截取片段构造词组，部分词组带必须词，另加少量过滤词"""
+    def fragment():
+        title = rng.choice(titles)
+        start = rng.randrange(max(1, len(title) - 2))
+        return title[start:start + rng.randint(2, 4)]
+
+    word_groups = []
+    for index in range(count):
+        word_groups.append({
+            "required": [fragment()] if index % 5 == 0 else [],
+            "normal": [fragment() for _ in range(rng.randint(1, 6))],
+            "group_key": f"group{index}",
+        })
+    return word_groups, [fragment() for _ in range(5)]
+
+
+def run(name: str, titles: list, word_groups: list, filter_words: list) -> bool:
+    """测时并比对结果"""
+    start = time.perf_counter()
+    expected = [substring_matches(title, word_groups, filter_words) for title in titles]
+    substring_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    actual = [main.matches_word_groups(title, word_groups, filter_words) for title in titles]
+    matcher_time = time.perf_counter() - start
+
+    mismatches = sum(a != e for a, e in zip(actual, expected))
+    print(
+        f"{name:<24} 子串匹配 {substring_time:7.3f} s  KeywordMatcher {matcher_time:7.3f} s"
+        f"  命中 {sum(actual)}  不一致 {mismatches}"
+    )
+    return mismatches == 0
+
+
+def main_bench():
+    arg_parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    arg_parser.add_argument("--groups", type=int, default=134)
+    arg_parser.add_argument("--seed", type=int, default=20251115)
+    args = arg_parser.parse_args()
+
+    titles = load_sample_titles()
+    if not titles:
+        print("output/ 下没有样例数据")
+        return 1
+    print(f"标题 {len(titles)} 条")
+
+    ok = True
+    word_groups, filter_words = main.load_frequency_words()
+    ok &= run(f"frequency_words.txt({len(word_groups)})", titles, word_groups, filter_words)
+
+    word_groups, filter_words = synthetic_groups(titles, args.groups, random.Random(args.seed))
+    ok &= run(f"构造词组({len(word_groups)})", titles, word_groups, filter_words)
+
+    # 未配置词组时的“全部新闻”兜底词组：每次调用都是新列表，应按内容复用同一个匹配器
+    start = time.perf_counter()
+    for title in titles:
+        main.matches_word_groups(title, [{"required": [], "normal": [], "group_key": "全部新闻"}], [])
+    print(f"{'全部新闻兜底词组':<24} KeywordMatcher {time.perf_counter() - start:7.3f} s"
+          f"  已编译匹配器 {len(main._keyword_matchers)} 个")
+
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main_bench())
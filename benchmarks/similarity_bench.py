@@ -0,0 +1,117 @@
+"""
+标题相似度基准测试
+
+用 output/ 下的样例标题（不足时加入随机改写的副本）构造约 5 万条标题的语料，
+对比逐条调用 SequenceMatcher 与 SimilarityIndex 的查询耗时，并校验两者结果完全一致。
+
+用法（项目根目录下）：
+    python benchmarks/similarity_bench.py [--titles 50000] [--queries 50]
+"""
+
+import argparse
+import random
+import sys
+import time
+from difflib import SequenceMatcher
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from mcp_server.services.parser_service import ParserService  # noqa: E402
+from mcp_server.services.similarity import SimilarityIndex  # noqa: E402
+
+
+def load_sample_titles(project_root: Path) -> list:
+    """读取 output/ 下全部快照中的去重标题"""
+    parser = ParserService(str(project_root))
+    titles = {}
+    for txt_file in sorted((project_root / "output").glob("*/txt/*.txt")):
+        titles_by_id, _ = parser.parse_txt_file(txt_file)
+        for platform_titles in titles_by_id.values():
+            titles.update(dict.fromkeys(platform_titles))
+    return list(titles)
+
+
+def perturb(title: str, rng: random.Random) -> str:
+    """随机删除、替换或交换标题中的少量字符"""
+    chars = list(title)
+    for _ in range(rng.randint(1, 3)):
+        if len(chars) < 2:
+            break
+        i = rng.randrange(len(chars))
+        op = rng.random()
+        if op < 0.4:
+            del chars[i]
+        elif op < 0.8:
+            chars[i] = rng.choice(chars)
+        else:
+            j = rng.randrange(len(chars))
+            chars[i], chars[j] = chars[j], chars[i]
+    return "".join(chars)
+
+
+def build_corpus(samples: list, size: int, rng: random.Random) -> list:
+    """样例标题加上随机改写的副本，凑足 size 条"""
+    corpus = list(samples[:size])
+    while len(corpus) < size:
+        corpus.append(perturb(rng.choice(samples), rng))
+    return corpus
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    arg_parser.add_argument("--titles", type=int, default=50000)
+    arg_parser.add_argument("--queries", type=int, default=50)
+    arg_parser.add_argument("--seed", type=int, default=20251115)
+    args = arg_parser.parse_args()
+
+    rng = random.Random(args.seed)
+    samples = load_sample_titles(Path(__file__).resolve().parent.parent)
+    if not samples:
+        print("output/ 下没有样例数据")
+        return 1
+
+    corpus = build_corpus(samples, args.titles, rng)
+    queries = [perturb(rng.choice(samples), rng) for _ in range(args.queries)]
+    corpus_lower = [title.lower() for title in corpus]
+    print(f"语料 {len(corpus)} 条（样例 {len(samples)} 条），查询 {len(queries)} 条")
+
+    start = time.perf_counter()
+    index = SimilarityIndex(corpus)
+    print(f"建立索引                {time.perf_counter() - start:8.2f} s")
+
+    # 逐条计算耗时较长，只用前 10 条查询测时
+    scan_queries = queries[:10]
+    start = time.perf_counter()
+    for query in scan_queries:
+        query_lower = query.lower()
+        for title in corpus_lower:
+            SequenceMatcher(None, query_lower, title).ratio()
+    scan_ms = (time.perf_counter() - start) * 1000 / len(scan_queries)
+    print(f"SequenceMatcher 逐条    {scan_ms:8.1f} ms/查询")
+
+    for threshold in (0.3, 0.5, 0.6, 0.8):
+        start = time.perf_counter()
+        results = [index.query(query, threshold) for query in queries]
+        index_ms = (time.perf_counter() - start) * 1000 / len(queries)
+
+        # 与逐条计算的结果逐一比对
+        for query, result in zip(scan_queries, results):
+            query_lower = query.lower()
+            expected = {}
+            for text_id, title in enumerate(corpus_lower):
+                score = SequenceMatcher(None, query_lower, title).ratio()
+                if score >= threshold:
+                    expected[text_id] = score
+            if result != expected:
+                print(f"阈值 {threshold} 结果不一致：{query}")
+                return 1
+
+        matches = sum(len(result) for result in results) / len(results)
+        print(f"索引查询 阈值 {threshold}      {index_ms:8.1f} ms/查询，平均命中 {matches:.1f} 条（结果一致）")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
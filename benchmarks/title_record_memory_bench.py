@@ -0,0 +1,135 @@
+"""
+标题记录内存基准测试
+
+对某一天的全部快照执行 解析 -> 合并 -> 词频统计 -> 报告准备，用 tracemalloc 对比
+嵌套字典的旧实现（从 git 历史读取）与 TitleRecord / ReportTitle 的常驻内存和峰值，
+并校验两者合并后的数据和渲染出的 HTML 完全一致。
+
+用法（项目根目录下）：
+    python benchmarks/title_record_memory_bench.py [--date 2025年11月15日] [--rev 91f9746^]
+"""
+
+import argparse
+import contextlib
+import gc
+import io
+import sys
+import time
+import tracemalloc
+
+from bench_utils import ROOT, load_baseline, main
+
+PIPELINE_FUNCTIONS = (
+    "load_compact_snapshot",
+    "parse_file_titles",
+    "process_source_data",
+    "count_word_frequency",
+    "prepare_report_data",
+)
+
+
+def run_pipeline(namespace, txt_files, word_groups, filter_words):
+    """按 NewsAnalyzer 的顺序处理一天的快照，返回需要常驻到报告生成的全部数据"""
+    all_results, title_info, id_to_name = {}, {}, {}
+    for txt_file in txt_files:
+        titles_by_id, names = namespace["parse_file_titles"](txt_file)
+        id_to_name.update(names)
+        for source_id, title_data in titles_by_id.items():
+            namespace["process_source_data"](
+                source_id, title_data, txt_file.stem, all_results, title_info
+            )
+
+    # 以最后一个快照中的标题作为新增标题
+    new_titles, _ = namespace["parse_file_titles"](txt_files[-1])
+    stats, total_titles = namespace["count_word_frequency"](
+        all_results, word_groups, filter_words, id_to_name, title_info,
+        new_titles=new_titles, mode="daily",
+    )
+    report_data = namespace["prepare_report_data"](
+        stats, [], new_titles, id_to_name, "daily", word_groups, filter_words
+    )
+    return all_results, title_info, id_to_name, report_data, total_titles
+
+
+def measure(namespace, txt_files, word_groups, filter_words):
+    """返回 (常驻 MB, 峰值 MB, 耗时 s, 结果)"""
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        result = run_pipeline(namespace, txt_files, word_groups, filter_words)
+    elapsed = time.perf_counter() - start
+    gc.collect()
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return current / 1024 / 1024, peak / 1024 / 1024, elapsed, result
+
+
+def normalized_title_info(title_info):
+    """合并后的 title_info 转为可比较的普通字典"""
+    return {
+        source_id: {
+            title: {
+                "ranks": list(info["ranks"]),
+                "url": info["url"],
+                "mobileUrl": info["mobileUrl"],
+                "first_time": info["first_time"],
+                "last_time": info["last_time"],
+                "count": info["count"],
+            }
+            for title, info in titles.items()
+        }
+        for source_id, titles in title_info.items()
+    }
+
+
+def main_bench():
+    arg_parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    arg_parser.add_argument("--date", default="2025年11月15日")
+    arg_parser.add_argument("--rev", default="91f9746^", help="引入 TitleRecord 之前的提交")
+    args = arg_parser.parse_args()
+
+    txt_files = sorted((ROOT / "output" / args.date / "txt").glob("*.txt"))
+    if not txt_files:
+        print(f"output/{args.date}/txt 下没有快照")
+        return 1
+
+    baseline = load_baseline(args.rev, PIPELINE_FUNCTIONS)
+    now = main.get_beijing_time()
+    main.get_beijing_time = baseline["get_beijing_time"] = lambda: now
+    print(f"{args.date}：{len(txt_files)} 个快照")
+
+    word_groups, filter_words = main.load_frequency_words()
+    scenarios = [
+        (f"关注词组（{len(word_groups)} 组）", word_groups, filter_words),
+        ("全部新闻（无词组）", [], []),
+    ]
+    for name, groups, filters in scenarios:
+        # 预热一次，避免匹配器、渲染缓存等一次性分配计入先测的一方
+        for namespace in (baseline, vars(main)):
+            with contextlib.redirect_stdout(io.StringIO()):
+                run_pipeline(namespace, txt_files, groups, filters)
+
+        old_current, old_peak, old_time, old_result = measure(baseline, txt_files, groups, filters)
+        old_html = main.render_html_content(old_result[3], old_result[4])
+        old_info = normalized_title_info(old_result[1])
+        del old_result
+
+        new_current, new_peak, new_time, new_result = measure(vars(main), txt_files, groups, filters)
+        new_html = main.render_html_content(new_result[3], new_result[4])
+        if normalized_title_info(new_result[1]) != old_info or new_html != old_html:
+            print(f"{name}：结果不一致")
+            return 1
+
+        title_count = sum(len(titles) for titles in new_result[0].values())
+        del new_result
+        print(f"{name}，标题 {title_count} 条，合并数据与 HTML 一致")
+        print(f"  常驻内存  旧实现 {old_current:6.2f} MB  当前 {new_current:6.2f} MB")
+        print(f"  内存峰值  旧实现 {old_peak:6.2f} MB  当前 {new_peak:6.2f} MB")
+        print(f"  耗时      旧实现 {old_time:6.3f} s   当前 {new_time:6.3f} s")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main_bench())
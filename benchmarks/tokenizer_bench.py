@@ -0,0 +1,121 @@
+"""
+关键词提取基准测试
+
+用 output/ 下的样例标题，对比分词器之前的两种关键词提取（analytics 按标点切分、
+search_tools 按 [\\w]+ 切分）与当前基于 Tokenizer.segment 的提取：
+词表大小、关键词复现情况，以及未缓存（去重标题）和已缓存（全部标题）时的吞吐量。
+
+用法（项目根目录下）：
+    python benchmarks/tokenizer_bench.py
+"""
+
+import re
+import sys
+import time
+from collections import Counter
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from mcp_server.services.parser_service import ParserService  # noqa: E402
+from mcp_server.services.tokenizer import Tokenizer, get_tokenizer  # noqa: E402
+from mcp_server.tools.analytics import AnalyticsTools  # noqa: E402
+from mcp_server.tools.search_tools import SearchTools  # noqa: E402
+
+ANALYTICS_STOPWORDS = {
+    '的', '了', '在', '是', '我', '有', '和', '就', '不', '人', '都', '一', '一个', '上', '也', '很',
+    '到', '说', '要', '去', '你', '会', '着', '没有', '看', '好', '自己', '这'
+}
+
+
+def old_analytics_keywords(title: str, min_length: int = 2) -> list:
+    """分词器之前的 AnalyticsTools._extract_keywords：去掉标点后按空白和中文标点切分"""
+    title = re.sub(r'http[s]?://\S+', '', title)
+    title = re.sub(r'[^\w\s]', ' ', title)
+    words = re.split(r'[\s，。！？、]+', title)
+    return [
+        word.strip() for word in words
+        if word.strip() and len(word.strip()) >= min_length and word.strip() not in ANALYTICS_STOPWORDS
+    ]
+
+
+def old_search_keywords(text: str, stopwords: set, min_length: int = 2) -> list:
+    """分词器之前的 SearchTools._extract_keywords：按 [\\w]+ 切分"""
+    text = re.sub(r'http[s]?://\S+', '', text)
+    text = re.sub(r'\[.*?\]', '', text)
+    words = re.findall(r'[\w]+', text)
+    return [word for word in words if word and len(word) >= min_length and word not in stopwords]
+
+
+def load_sample_titles() -> list:
+    """读取 output/ 下全部快照中的标题（按平台和日期去重，与分析工具看到的标题一致）"""
+    parser = ParserService(str(ROOT))
+    titles = []
+    for date_dir in sorted((ROOT / "output").glob("*/txt")):
+        seen = set()
+        for txt_file in sorted(date_dir.glob("*.txt")):
+            titles_by_id, _ = parser.parse_txt_file(txt_file)
+            for platform_id, platform_titles in titles_by_id.items():
+                for title in platform_titles:
+                    if (platform_id, title) not in seen:
+                        seen.add((platform_id, title))
+                        titles.append(title)
+    return titles
+
+
+def vocabulary_stats(name: str, keyword_lists: list) -> None:
+    """输出词表大小和关键词复现情况"""
+    counts = Counter(word for keywords in keyword_lists for word in keywords)
+    occurrences = sum(counts.values())
+    recurring = {word for word, count in counts.items() if count >= 3}
+    singletons = sum(1 for count in counts.values() if count == 1)
+    covered = sum(1 for keywords in keyword_lists if any(word in recurring for word in keywords))
+    print(
+        f"{name:<14} 词表 {len(counts):>6}  每条 {occurrences / len(keyword_lists):4.2f} 个"
+        f"  仅出现 1 次 {singletons / len(counts):4.0%}  出现≥3 次 {len(recurring):>5} 个"
+        f"（占出现次数 {sum(counts[word] for word in recurring) / occurrences:4.0%}）"
+        f"  含复现关键词的标题 {covered / len(keyword_lists):4.0%}"
+    )
+
+
+def throughput(extract, titles: list) -> float:
+    """每秒处理的标题数"""
+    start = time.perf_counter()
+    for title in titles:
+        extract(title)
+    return len(titles) / (time.perf_counter() - start)
+
+
+def main():
+    titles = load_sample_titles()
+    if not titles:
+        print("output/ 下没有样例数据")
+        return 1
+    unique_titles = list(dict.fromkeys(titles))
+    print(f"标题 {len(titles)} 条（去重 {len(unique_titles)} 条）")
+
+    analytics = AnalyticsTools(str(ROOT))
+    search = SearchTools(str(ROOT))
+    tokenizer = get_tokenizer(str(ROOT))
+    print(f"分词器 {tokenizer.version}，词典 {len(tokenizer.words)} 词")
+
+    vocabulary_stats("旧 analytics", [old_analytics_keywords(title) for title in titles])
+    vocabulary_stats("旧 search", [old_search_keywords(title, search.stopwords) for title in titles])
+    vocabulary_stats("当前 analytics", [analytics._extract_keywords(title) for title in titles])
+    vocabulary_stats("当前 search", [search._extract_keywords(title) for title in titles])
+
+    # 未缓存：换一个同词典的新分词器，对去重标题各切分一次
+    analytics.tokenizer = search.tokenizer = Tokenizer(tokenizer.words)
+    cold = throughput(analytics._extract_keywords, unique_titles)
+    cached = throughput(analytics._extract_keywords, titles)
+    print(
+        f"吞吐量（条/秒）  旧 analytics {throughput(old_analytics_keywords, titles):>9,.0f}"
+        f"  旧 search {throughput(lambda title: old_search_keywords(title, search.stopwords), titles):>9,.0f}"
+        f"  分词器未缓存 {cold:>9,.0f}  已缓存 {cached:>9,.0f}"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,23 +1,32 @@
 # coding=utf-8
 
+import gzip
+import hashlib
 import json
 import os
 import random
 import re
+import shutil
 import time
 import webbrowser
 import smtplib
+import sys
+import threading
+from array import array
+from concurrent.futures import ThreadPoolExecutor
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 from email.header import Header
-from email.utils import formataddr, formatdate, make_msgid
+from email.utils import formataddr, formatdate, make_msgid, parsedate_to_datetime
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Tuple, Optional, Union
+from typing import Callable, Dict, Iterable, Iterator, List, Tuple, Optional, Union
+from urllib.parse import urlparse
 
 import pytz
 import requests
 import yaml
+from requests.adapters import HTTPAdapter
 
 
 VERSION = "3.1.0"
@@ -71,6 +80,13 @@ def load_config():
         "VERSION_CHECK_URL": config_data["app"]["version_check_url"],
         "SHOW_VERSION_UPDATE": config_data["app"]["show_version_update"],
         "REQUEST_INTERVAL": config_data["crawler"]["request_interval"],
+        "MAX_WORKERS": config_data["crawler"].get("max_workers", 1),
+        "HOST_INTERVAL": config_data["crawler"].get(
+            "host_interval", config_data["crawler"]["request_interval"]
+        ),
+        "HTTP_POOL_SIZE": config_data["crawler"].get("http_pool_size", 10),
+        "HTTP_TIMEOUT": config_data["crawler"].get("http_timeout", 10),
+        "COMPACT_SNAPSHOT": config_data["crawler"].get("compact_snapshot", False),
         "REPORT_MODE": os.environ.get("REPORT_MODE", "").strip()
         or config_data["report"]["mode"],
         "RANK_THRESHOLD": config_data["report"]["rank_threshold"],
@@ -90,6 +106,7 @@ def load_config():
         ),
         "FEISHU_BATCH_SIZE": config_data["notification"].get("feishu_batch_size", 29000),
         "BATCH_SEND_INTERVAL": config_data["notification"]["batch_send_interval"],
+        "SEND_DEADLINE": config_data["notification"].get("send_deadline", 300),
         "FEISHU_MESSAGE_SEPARATOR": config_data["notification"][
             "feishu_message_separator"
         ],
@@ -125,6 +142,15 @@ def load_config():
             .get("push_window", {})
             .get("push_record_retention_days", 7),
         },
+        "OUTBOX": {
+            "ENABLED": config_data["notification"].get("outbox", {}).get("enabled", True),
+            "MAX_RETRIES": config_data["notification"].get("outbox", {}).get("max_retries", 3),
+            "BASE_DELAY": config_data["notification"].get("outbox", {}).get("base_delay", 2),
+            "MAX_DELAY": config_data["notification"].get("outbox", {}).get("max_delay", 60),
+            "MAX_AGE_HOURS": config_data["notification"]
+            .get("outbox", {})
+            .get("max_age_hours", 24),
+        },
         "WEIGHT_CONFIG": {
             "RANK_WEIGHT": config_data["weight"]["rank_weight"],
             "FREQUENCY_WEIGHT": config_data["weight"]["frequency_weight"],
@@ -277,7 +303,7 @@ def check_version_update(
             "Cache-Control": "no-cache",
         }
 
-        response = requests.get(
+        response = get_http_client().get(
             version_url, proxies=proxies, headers=headers, timeout=10
         )
         response.raise_for_status()
@@ -332,6 +358,112 @@ def html_escape(text: str) -> str:
     )
 
 
+# === HTTP 会话管理 ===
+class HttpClient:
+    """共享 HTTP 会话：复用连接池和 keep-alive 连接，并按主机统计请求情况"""
+
+    def __init__(
+        self,
+        pool_size: int = CONFIG["HTTP_POOL_SIZE"],
+        timeout: float = CONFIG["HTTP_TIMEOUT"],
+        proxy_url: Optional[str] = None,
+    ):
+        self.timeout = timeout
+        self.session = requests.Session()
+        self.adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session.mount("http://", self.adapter)
+        self.session.mount("https://", self.adapter)
+        if proxy_url:
+            self.session.proxies.update({"http": proxy_url, "https": proxy_url})
+
+        self._stats = {}
+        self._stats_lock = threading.Lock()
+
+    def request(self, method: str, url: str, **kwargs) -> requests.Response:
+        """发送请求，未指定 timeout 时使用默认超时"""
+        kwargs.setdefault("timeout", self.timeout)
+        host = urlparse(url).hostname or ""
+        start_time = time.monotonic()
+        try:
+            response = self.session.request(method, url, **kwargs)
+        except Exception:
+            self._record(host, time.monotonic() - start_time, failed=True)
+            raise
+        self._record(host, time.monotonic() - start_time, failed=False)
+        return response
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url: str, **kwargs) -> requests.Response:
+        return self.request("POST", url, **kwargs)
+
+    def _record(self, host: str, elapsed: float, failed: bool) -> None:
+        with self._stats_lock:
+            stats = self._stats.setdefault(
+                host, {"requests": 0, "failures": 0, "total_time": 0.0}
+            )
+            stats["requests"] += 1
+            stats["total_time"] += elapsed
+            if failed:
+                stats["failures"] += 1
+
+    def get_pool_stats(self) -> Dict[str, Dict]:
+        """获取各主机的请求数、失败数、平均耗时和新建连接数"""
+        connections = {}
+        pools = self.adapter.poolmanager.pools
+        for pool_key in pools.keys():
+            pool = pools.get(pool_key)
+            if pool is None:
+                continue
+            connections[pool_key.key_host] = (
+                connections.get(pool_key.key_host, 0) + pool.num_connections
+            )
+
+        with self._stats_lock:
+            return {
+                host: {
+                    "requests": stats["requests"],
+                    "failures": stats["failures"],
+                    "avg_ms": round(stats["total_time"] / stats["requests"] * 1000, 1),
+                    "connections": connections.get(host, 0),
+                }
+                for host, stats in self._stats.items()
+            }
+
+    def print_pool_stats(self) -> None:
+        """打印连接池统计"""
+        pool_stats = self.get_pool_stats()
+        if not pool_stats:
+            return
+        print("HTTP 连接统计:")
+        for host, stats in pool_stats.items():
+            print(
+                f"  {host}: 请求 {stats['requests']} 次, 失败 {stats['failures']} 次, "
+                f"新建连接 {stats['connections']} 个, 平均耗时 {stats['avg_ms']} 毫秒"
+            )
+
+
+_http_client = None
+_http_client_lock = threading.Lock()
+
+
+def get_http_client() -> HttpClient:
+    """获取进程内共享的 HTTP 会话"""
+    global _http_client
+    if _http_client is None:
+        with _http_client_lock:
+            if _http_client is None:
+                proxy_url = None
+                if CONFIG["USE_PROXY"] and os.environ.get("GITHUB_ACTIONS") != "true":
+                    proxy_url = CONFIG["DEFAULT_PROXY"]
+                _http_client = HttpClient(
+                    pool_size=max(CONFIG["HTTP_POOL_SIZE"], CONFIG["MAX_WORKERS"]),
+                    proxy_url=proxy_url,
+                )
+    return _http_client
+
+
 # === 推送记录管理 ===
 class PushRecordManager:
     """推送记录管理器"""
@@ -435,12 +567,395 @@ class PushRecordManager:
         return result
 
 
+# === 通知发件箱 ===
+NOTIFICATION_CHANNEL_NAMES = {
+    "feishu": "飞书",
+    "dingtalk": "钉钉",
+    "wework": "企业微信",
+    "telegram": "Telegram",
+    "ntfy": "ntfy",
+}
+
+# 各平台表示触发频率限制的业务错误码（HTTP 状态码仍为 200）
+RATE_LIMIT_ERROR_CODES = {
+    "feishu": {11232},
+    "dingtalk": {130101},
+    "wework": {45009},
+}
+
+
+def get_channel_endpoint(channel: str) -> Tuple[Optional[str], Dict]:
+    """根据当前配置生成渠道的请求地址和鉴权请求头，敏感信息只在发送时读取，不写入发件箱"""
+    if channel == "feishu":
+        return CONFIG["FEISHU_WEBHOOK_URL"] or None, {}
+    if channel == "dingtalk":
+        return CONFIG["DINGTALK_WEBHOOK_URL"] or None, {}
+    if channel == "wework":
+        return CONFIG["WEWORK_WEBHOOK_URL"] or None, {}
+    if channel == "telegram":
+        if CONFIG["TELEGRAM_BOT_TOKEN"] and CONFIG["TELEGRAM_CHAT_ID"]:
+            return (
+                f"https://api.telegram.org/bot{CONFIG['TELEGRAM_BOT_TOKEN']}/sendMessage",
+                {},
+            )
+        return None, {}
+    if channel == "ntfy":
+        server_url = CONFIG["NTFY_SERVER_URL"]
+        topic = CONFIG["NTFY_TOPIC"]
+        if not (server_url and topic):
+            return None, {}
+        base_url = server_url.rstrip("/")
+        if not base_url.startswith(("http://", "https://")):
+            base_url = f"https://{base_url}"
+        token = CONFIG.get("NTFY_TOKEN", "")
+        return f"{base_url}/{topic}", {"Authorization": f"Bearer {token}"} if token else {}
+    return None, {}
+
+
+def get_channel_payload_fields(channel: str) -> Dict:
+    """根据当前配置生成发送时合并到 JSON 消息体中的字段（如 Telegram 的 chat_id），不写入发件箱"""
+    if channel == "telegram" and CONFIG["TELEGRAM_CHAT_ID"]:
+        return {"chat_id": CONFIG["TELEGRAM_CHAT_ID"]}
+    return {}
+
+
+def get_batch_interval(channel: str) -> float:
+    """获取渠道批次之间的发送间隔（秒）"""
+    if channel == "ntfy":
+        # 公共服务器建议 2-3 秒，自托管可以更短
+        return 2 if "ntfy.sh" in CONFIG["NTFY_SERVER_URL"] else 1
+    return CONFIG["BATCH_SEND_INTERVAL"]
+
+
+def parse_retry_after(response) -> Optional[float]:
+    """解析 Retry-After 响应头（秒数或 HTTP 日期）"""
+    value = response.headers.get("Retry-After")
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+        return max(0.0, retry_at.timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+def check_channel_response(channel: str, response) -> Tuple[str, Optional[float], str]:
+    """判断渠道响应，返回 (状态, 建议等待秒数, 错误信息)，状态为 ok / retry / fail"""
+    status_code = response.status_code
+
+    if status_code == 429:
+        retry_after = parse_retry_after(response)
+        if retry_after is None and channel == "telegram":
+            try:
+                retry_after = response.json().get("parameters", {}).get("retry_after")
+            except ValueError:
+                pass
+        return "retry", retry_after, "速率限制"
+    if status_code == 408 or status_code >= 500:
+        return "retry", None, f"状态码：{status_code}"
+    if status_code != 200:
+        return "fail", None, f"状态码：{status_code}"
+    if channel == "ntfy":
+        return "ok", None, ""
+
+    try:
+        result = response.json()
+    except ValueError:
+        return "fail", None, "响应解析失败"
+
+    if channel == "feishu":
+        if result.get("StatusCode") == 0 or result.get("code") == 0:
+            return "ok", None, ""
+        error_code = result.get("code")
+        error_msg = result.get("msg") or result.get("StatusMessage", "未知错误")
+    elif channel == "telegram":
+        if result.get("ok"):
+            return "ok", None, ""
+        error_code = result.get("error_code")
+        error_msg = result.get("description")
+    else:
+        if result.get("errcode") == 0:
+            return "ok", None, ""
+        error_code = result.get("errcode")
+        error_msg = result.get("errmsg")
+
+    if error_code in RATE_LIMIT_ERROR_CODES.get(channel, ()):
+        return "retry", None, f"速率限制：{error_msg}"
+    return "fail", None, f"错误：{error_msg}"
+
+
+class NotificationOutbox:
+    """通知发件箱：渲染好的批次先落盘，逐条发送并记录进度，未发完的报告在下次运行时续发"""
+
+    def __init__(self):
+        self.outbox_dir = Path("output") / ".outbox"
+        self.enabled = CONFIG["OUTBOX"]["ENABLED"]
+        self._channel_locks = {channel: threading.Lock() for channel in NOTIFICATION_CHANNEL_NAMES}
+        # 本次运行已尝试发送过的渠道，flush 不再重复续发
+        self._attempted = set()
+
+    def _job_path(self, job: Dict) -> Path:
+        return self.outbox_dir / f"{job['id']}.json"
+
+    def _save(self, job: Dict) -> None:
+        """保存任务进度（先写临时文件再替换，避免中途退出留下损坏的文件）"""
+        if not self.enabled:
+            return
+        self.outbox_dir.mkdir(parents=True, exist_ok=True)
+        job_path = self._job_path(job)
+        tmp_path = job_path.with_suffix(".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(job, f, ensure_ascii=False)
+        os.replace(tmp_path, job_path)
+
+    def _remove(self, job: Dict) -> None:
+        if self.enabled:
+            self._job_path(job).unlink(missing_ok=True)
+
+    def _pending_jobs(self, channel: str) -> List[Dict]:
+        """读取渠道未完成的任务（按创建顺序），过期或损坏的任务直接清理"""
+        if not self.enabled or not self.outbox_dir.exists():
+            return []
+
+        max_age = CONFIG["OUTBOX"]["MAX_AGE_HOURS"] * 3600
+        jobs = []
+        for job_path in sorted(self.outbox_dir.glob(f"*_{channel}.json")):
+            try:
+                with open(job_path, "r", encoding="utf-8") as f:
+                    job = json.load(f)
+            except (OSError, ValueError) as e:
+                print(f"发件箱任务读取失败，已删除 {job_path.name}: {e}")
+                job_path.unlink(missing_ok=True)
+                continue
+
+            if time.time() - job["created_at"] > max_age:
+                print(
+                    f"发件箱任务已过期，丢弃 {NOTIFICATION_CHANNEL_NAMES[channel]} [{job['report_type']}]"
+                    f"（已发送 {job['next_index']}/{len(job['messages'])} 批次）"
+                )
+                job_path.unlink(missing_ok=True)
+                continue
+            jobs.append(job)
+        return jobs
+
+    def has_pending(self) -> bool:
+        """是否存在未完成的任务"""
+        return self.enabled and self.outbox_dir.exists() and any(self.outbox_dir.glob("*.json"))
+
+    def send(
+        self,
+        channel: str,
+        report_type: str,
+        messages: List[Dict],
+        proxy_url: Optional[str] = None,
+        endpoint: Optional[Tuple[str, Dict]] = None,
+        skip_failed: bool = False,
+        payload_fields: Optional[Dict] = None,
+    ) -> bool:
+        """先续发该渠道之前未完成的报告，再发送本次报告；渠道仍不可用时本次报告直接排入发件箱"""
+        with self._channel_locks[channel]:
+            self._attempted.add(channel)
+            drained = self._drain(channel, proxy_url)
+
+            job = {
+                "id": f"{get_beijing_time().strftime('%Y%m%d%H%M%S%f')}_{channel}",
+                "channel": channel,
+                "report_type": report_type,
+                "created_at": time.time(),
+                "skip_failed": skip_failed,
+                "messages": messages,
+                "next_index": 0,
+                "sent": 0,
+                "retries": 0,
+                "last_error": "",
+            }
+            self._save(job)
+            if not drained:
+                if self.enabled:
+                    print(
+                        f"{NOTIFICATION_CHANNEL_NAMES[channel]}仍有未发完的报告，"
+                        f"本次报告 [{report_type}] 已保存到发件箱，下次运行时按顺序发送"
+                    )
+                return False
+            return self._deliver(job, proxy_url, endpoint, payload_fields=payload_fields)
+
+    def flush(self, proxy_url: Optional[str] = None) -> None:
+        """续发其余渠道未完成的报告（跳过本次运行已尝试过或正在发送中的渠道），总耗时受 send_deadline 限制"""
+        if not self.has_pending():
+            return
+        deadline = time.monotonic() + CONFIG["SEND_DEADLINE"]
+        for channel, lock in self._channel_locks.items():
+            if channel in self._attempted:
+                continue
+            if time.monotonic() >= deadline:
+                print("续发未完成的报告已达到截止时间，剩余报告留待下次运行")
+                return
+            if not lock.acquire(blocking=False):
+                continue
+            try:
+                self._attempted.add(channel)
+                self._drain(channel, proxy_url, deadline)
+            finally:
+                lock.release()
+
+    def _drain(self, channel: str, proxy_url: Optional[str], deadline: Optional[float] = None) -> bool:
+        """按顺序续发渠道未完成的报告，遇到仍未发完的报告即停止，返回是否已全部发完"""
+        for job in self._pending_jobs(channel):
+            if deadline is not None and time.monotonic() >= deadline:
+                return False
+            print(
+                f"续发{NOTIFICATION_CHANNEL_NAMES[channel]}未完成的报告 [{job['report_type']}]"
+                f"，从第 {job['next_index'] + 1}/{len(job['messages'])} 批次开始"
+            )
+            self._deliver(job, proxy_url, deadline=deadline)
+            if self._job_path(job).exists():
+                return False
+        return True
+
+    def _deliver(
+        self,
+        job: Dict,
+        proxy_url: Optional[str] = None,
+        endpoint: Optional[Tuple[str, Dict]] = None,
+        deadline: Optional[float] = None,
+        payload_fields: Optional[Dict] = None,
+    ) -> bool:
+        """按顺序发送任务中剩余的批次，临时失败按指数退避重试，超过本次重试次数或截止时间则留待下次运行"""
+        channel = job["channel"]
+        name = NOTIFICATION_CHANNEL_NAMES[channel]
+        report_type = job["report_type"]
+        messages = job["messages"]
+        total = len(messages)
+
+        url, auth_headers = endpoint or get_channel_endpoint(channel)
+        if payload_fields is None:
+            payload_fields = get_channel_payload_fields(channel)
+        if not url:
+            print(f"{name}渠道已不再配置，丢弃未发送的报告 [{report_type}]")
+            self._remove(job)
+            return False
+
+        proxies = {"http": proxy_url, "https": proxy_url} if proxy_url else None
+        outbox_config = CONFIG["OUTBOX"]
+        retries_this_run = 0
+
+        while job["next_index"] < total:
+            message = messages[job["next_index"]]
+            label = message["label"]
+            print(f"发送{name}{label}，大小：{message['size']} 字节 [{report_type}]")
+
+            kwargs = {"headers": {**message["headers"], **auth_headers}}
+            if "json" in message:
+                kwargs["json"] = {**message["json"], **payload_fields}
+            else:
+                kwargs["data"] = message["data"].encode("utf-8")
+
+            try:
+                response = get_http_client().post(url, proxies=proxies, timeout=30, **kwargs)
+                status, retry_after, error = check_channel_response(channel, response)
+            except Exception as e:
+                status, retry_after, error = "retry", None, f"请求出错：{e}"
+
+            if status == "ok":
+                print(f"{name}{label}发送成功 [{report_type}]")
+                job["next_index"] += 1
+                job["sent"] += 1
+                job["retries"] = 0
+                self._save(job)
+                # 批次间间隔
+                if job["next_index"] < total:
+                    time.sleep(get_batch_interval(channel))
+                continue
+
+            job["last_error"] = error
+
+            if status == "fail":
+                print(f"{name}{label}发送失败 [{report_type}]，{error}")
+                if job["skip_failed"]:
+                    job["next_index"] += 1
+                    self._save(job)
+                    continue
+                self._remove(job)
+                return False
+
+            # 临时失败：指数退避，速率限制时优先使用服务端给出的等待时间
+            job["retries"] += 1
+            retries_this_run += 1
+            if retry_after is None:
+                retry_after = outbox_config["BASE_DELAY"] * 2 ** (job["retries"] - 1)
+            delay = min(retry_after, outbox_config["MAX_DELAY"])
+
+            if retries_this_run > outbox_config["MAX_RETRIES"] or (
+                deadline is not None and time.monotonic() + delay >= deadline
+            ):
+                self._save(job)
+                if self.enabled:
+                    print(f"{name}{label}发送失败 [{report_type}]，{error}，剩余批次已保存到发件箱，下次运行时继续发送")
+                else:
+                    print(f"{name}{label}发送失败 [{report_type}]，{error}")
+                return False
+
+            print(f"{name}{label}发送失败 [{report_type}]，{error}，{delay:.0f} 秒后重试")
+            time.sleep(delay)
+
+        self._remove(job)
+        if job["sent"] == total:
+            print(f"{name}所有 {total} 批次发送完成 [{report_type}]")
+            return True
+        if job["sent"] > 0:
+            print(f"{name}部分发送成功：{job['sent']}/{total} 批次 [{report_type}]")
+            return True  # 部分成功也视为成功
+        print(f"{name}发送完全失败 [{report_type}]")
+        return False
+
+
+_notification_outbox = None
+_notification_outbox_lock = threading.Lock()
+
+
+def get_notification_outbox() -> NotificationOutbox:
+    """获取全局通知发件箱"""
+    global _notification_outbox
+    with _notification_outbox_lock:
+        if _notification_outbox is None:
+            _notification_outbox = NotificationOutbox()
+        return _notification_outbox
+
+
 # === 数据获取 ===
 class DataFetcher:
     """数据获取器"""
 
-    def __init__(self, proxy_url: Optional[str] = None):
+    def __init__(
+        self,
+        proxy_url: Optional[str] = None,
+        max_workers: int = CONFIG["MAX_WORKERS"],
+        host_interval: int = CONFIG["HOST_INTERVAL"],
+    ):
         self.proxy_url = proxy_url
+        self.max_workers = max(1, int(max_workers or 1))
+        self.host_interval = max(0, int(host_interval or 0))
+        self._host_lock = threading.Lock()
+        self._host_next_time = {}
+        self._polite = False
+
+    def _wait_for_host(self, url: str) -> None:
+        """并发模式下按主机限速：为每次请求预约发送时间，保证同一主机的请求间隔"""
+        if not self._polite or self.host_interval <= 0:
+            return
+
+        host = urlparse(url).netloc
+        with self._host_lock:
+            now = time.monotonic()
+            scheduled = max(now, self._host_next_time.get(host, 0.0))
+            self._host_next_time[host] = scheduled + self.host_interval / 1000
+
+        if scheduled > now:
+            time.sleep(scheduled - now)
 
     def fetch_data(
         self,
@@ -473,7 +988,8 @@ class DataFetcher:
         retries = 0
         while retries <= max_retries:
             try:
-                response = requests.get(
+                self._wait_for_host(url)
+                response = get_http_client().get(
                     url, proxies=proxies, headers=headers, timeout=10
                 )
                 response.raise_for_status()
@@ -502,62 +1018,274 @@ class DataFetcher:
                     return None, id_value, alias
         return None, id_value, alias
 
+    def _process_response(
+        self,
+        id_value: str,
+        response: Optional[str],
+        results: Dict,
+        failed_ids: List,
+    ) -> None:
+        """解析单个平台的响应并写入结果"""
+        if not response:
+            failed_ids.append(id_value)
+            return
+
+        try:
+            data = json.loads(response)
+            results[id_value] = {}
+            for index, item in enumerate(data.get("items", []), 1):
+                title = item["title"]
+                url = item.get("url", "")
+                mobile_url = item.get("mobileUrl", "")
+
+                if title in results[id_value]:
+                    results[id_value][title]["ranks"].append(index)
+                else:
+                    results[id_value][title] = {
+                        "ranks": [index],
+                        "url": url,
+                        "mobileUrl": mobile_url,
+                    }
+        except json.JSONDecodeError:
+            print(f"解析 {id_value} 响应失败")
+            failed_ids.append(id_value)
+        except Exception as e:
+            print(f"处理 {id_value} 数据出错: {e}")
+            failed_ids.append(id_value)
+
     def crawl_websites(
         self,
         ids_list: List[Union[str, Tuple[str, str]]],
         request_interval: int = CONFIG["REQUEST_INTERVAL"],
+        max_workers: Optional[int] = None,
     ) -> Tuple[Dict, Dict, List]:
-        """爬取多个网站数据"""
+        """爬取多个网站数据
+
+        max_workers 大于 1 时并发请求，同一主机的请求间隔由 host_interval 控制
+        （未配置时等于 request_interval，所有平台同属一个主机，并发只重叠等待时间，不提高请求频率）；
+        无论是否并发，结果均按 ids_list 的平台顺序组装。
+        """
+        workers = self.max_workers if max_workers is None else max(1, max_workers)
+        workers = min(workers, len(ids_list)) if ids_list else 1
+
         results = {}
         id_to_name = {}
         failed_ids = []
 
-        for i, id_info in enumerate(ids_list):
+        for id_info in ids_list:
             if isinstance(id_info, tuple):
                 id_value, name = id_info
             else:
                 id_value = id_info
                 name = id_value
-
             id_to_name[id_value] = name
-            response, _, _ = self.fetch_data(id_info)
-
-            if response:
-                try:
-                    data = json.loads(response)
-                    results[id_value] = {}
-                    for index, item in enumerate(data.get("items", []), 1):
-                        title = item["title"]
-                        url = item.get("url", "")
-                        mobile_url = item.get("mobileUrl", "")
-
-                        if title in results[id_value]:
-                            results[id_value][title]["ranks"].append(index)
-                        else:
-                            results[id_value][title] = {
-                                "ranks": [index],
-                                "url": url,
-                                "mobileUrl": mobile_url,
-                            }
-                except json.JSONDecodeError:
-                    print(f"解析 {id_value} 响应失败")
-                    failed_ids.append(id_value)
-                except Exception as e:
-                    print(f"处理 {id_value} 数据出错: {e}")
-                    failed_ids.append(id_value)
-            else:
-                failed_ids.append(id_value)
 
-            if i < len(ids_list) - 1:
-                actual_interval = request_interval + random.randint(-10, 20)
-                actual_interval = max(50, actual_interval)
-                time.sleep(actual_interval / 1000)
+        if workers > 1:
+            print(f"并发爬取: {workers} 个线程，同主机间隔 {self.host_interval} 毫秒")
+            self._polite = True
+            try:
+                with ThreadPoolExecutor(max_workers=workers) as executor:
+                    responses = list(executor.map(self.fetch_data, ids_list))
+            finally:
+                self._polite = False
+                self._host_next_time.clear()
+
+            for response, id_value, _ in responses:
+                self._process_response(id_value, response, results, failed_ids)
+        else:
+            for i, id_info in enumerate(ids_list):
+                response, id_value, _ = self.fetch_data(id_info)
+                self._process_response(id_value, response, results, failed_ids)
+
+                if i < len(ids_list) - 1:
+                    actual_interval = request_interval + random.randint(-10, 20)
+                    actual_interval = max(50, actual_interval)
+                    time.sleep(actual_interval / 1000)
 
         print(f"成功: {list(results.keys())}, 失败: {failed_ids}")
         return results, id_to_name, failed_ids
 
 
 # === 数据处理 ===
+# 进程内文件读取计数，用于输出每次运行的 I/O 调试信息
+IO_STATS = {"files_parsed": 0, "bytes_read": 0, "frequency_loads": 0}
+
+
+def make_ranks(values) -> array:
+    """将排名列表转为紧凑的 array('H')，超出范围时退回 array('l')"""
+    try:
+        return array("H", values)
+    except OverflowError:
+        return array("l", values)
+
+
+class SlotRecord:
+    """__slots__ 记录基类：按字典键名提供读取和赋值，兼容原先以字典传递数据的调用方"""
+
+    __slots__ = ()
+    # 字典形式的键名（顺序即 copy() 的输出顺序）及与属性名不同的键
+    KEYS = ()
+    KEY_ALIASES = {}
+
+    def __getitem__(self, key: str):
+        if key not in self.KEYS and key not in self.KEY_ALIASES:
+            raise KeyError(key)
+        return getattr(self, self.KEY_ALIASES.get(key, key))
+
+    def __setitem__(self, key: str, value) -> None:
+        if key not in self.KEYS and key not in self.KEY_ALIASES:
+            raise KeyError(key)
+        setattr(self, self.KEY_ALIASES.get(key, key), value)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.KEYS or key in self.KEY_ALIASES
+
+    def get(self, key: str, default=None):
+        if key not in self.KEYS and key not in self.KEY_ALIASES:
+            return default
+        return getattr(self, self.KEY_ALIASES.get(key, key))
+
+    def keys(self) -> Tuple[str, ...]:
+        return self.KEYS
+
+    def copy(self) -> Dict:
+        """返回等价的普通字典（排名转为列表）"""
+        data = {key: self[key] for key in self.KEYS}
+        if "ranks" in data:
+            data["ranks"] = list(data["ranks"])
+        return data
+
+
+class TitleRecord(SlotRecord):
+    """当日单条标题的合并记录
+
+    同一对象同时作为 all_results 和 title_info 中的条目，标题与平台ID已驻留（sys.intern），
+    链接只保存一份，排名存为 array('H')（出现超出范围的排名时整体转为 array('l')）。
+    排名较多时用排名集合判断是否已出现，同时维护最高/最低排名，出现次数即 count。
+    """
+
+    __slots__ = (
+        "ranks",
+        "url",
+        "mobile_url",
+        "first_time",
+        "last_time",
+        "count",
+        "rank_set",
+        "min_rank",
+        "max_rank",
+    )
+    KEYS = ("ranks", "url", "mobileUrl", "first_time", "last_time", "count")
+    KEY_ALIASES = {"mobileUrl": "mobile_url"}
+    # 排名数少于该值时直接扫描排名数组，比建立集合更快也更省内存
+    RANK_SET_THRESHOLD = 8
+
+    def __init__(
+        self,
+        ranks,
+        url: str = "",
+        mobile_url: str = "",
+        first_time: str = "",
+        last_time: str = "",
+        count: int = 1,
+    ):
+        self.ranks = make_ranks(ranks)
+        self.url = url
+        self.mobile_url = mobile_url
+        self.first_time = first_time
+        self.last_time = last_time
+        self.count = count
+        # 排名集合在排名数达到 RANK_SET_THRESHOLD 时才建立，排名较少的标题不额外占用内存
+        self.rank_set = None
+        self.min_rank = min(self.ranks) if self.ranks else None
+        self.max_rank = max(self.ranks) if self.ranks else None
+
+    def merge_ranks(self, ranks) -> None:
+        """合并新快照的排名：未出现过的排名按出现顺序追加，并更新最高/最低排名"""
+        for rank in ranks:
+            rank_set = self.rank_set
+            if rank_set is not None:
+                if rank in rank_set:
+                    continue
+                rank_set.add(rank)
+            elif rank in self.ranks:
+                continue
+            self.append_rank(rank)
+            if rank_set is None and len(self.ranks) >= self.RANK_SET_THRESHOLD:
+                self.rank_set = set(self.ranks)
+            if self.min_rank is None or rank < self.min_rank:
+                self.min_rank = rank
+            if self.max_rank is None or rank > self.max_rank:
+                self.max_rank = rank
+
+    def append_rank(self, rank: int) -> None:
+        """追加排名，超出 array('H') 范围时整体转为 array('l')"""
+        try:
+            self.ranks.append(rank)
+        except OverflowError:
+            self.ranks = array("l", self.ranks)
+            self.ranks.append(rank)
+
+
+class ReportTitle(SlotRecord):
+    """统计结果和报告中的单条新闻，报告准备阶段直接复用，不再逐条复制为字典"""
+
+    __slots__ = (
+        "title",
+        "source_name",
+        "first_time",
+        "last_time",
+        "time_display",
+        "count",
+        "ranks",
+        "rank_threshold",
+        "url",
+        "mobile_url",
+        "is_new",
+    )
+    KEYS = (
+        "title",
+        "source_name",
+        "first_time",
+        "last_time",
+        "time_display",
+        "count",
+        "ranks",
+        "rank_threshold",
+        "url",
+        "mobile_url",
+        "is_new",
+    )
+    # 统计阶段沿用 mobileUrl 键名，报告阶段使用 mobile_url
+    KEY_ALIASES = {"mobileUrl": "mobile_url"}
+
+    def __init__(
+        self,
+        title: str,
+        source_name: str,
+        first_time: str,
+        last_time: str,
+        time_display: str,
+        count: int,
+        ranks,
+        rank_threshold: int,
+        url: str,
+        mobile_url: str,
+        is_new: bool,
+    ):
+        self.title = title
+        self.source_name = source_name
+        self.first_time = first_time
+        self.last_time = last_time
+        self.time_display = time_display
+        self.count = count
+        self.ranks = ranks
+        self.rank_threshold = rank_threshold
+        self.url = url
+        self.mobile_url = mobile_url
+        self.is_new = is_new
+
+
 def save_titles_to_file(results: Dict, id_to_name: Dict, failed_ids: List) -> str:
     """保存标题到文件"""
     file_path = get_output_path("txt", f"{format_time_filename()}.txt")
@@ -575,7 +1303,7 @@ def save_titles_to_file(results: Dict, id_to_name: Dict, failed_ids: List) -> st
             sorted_titles = []
             for title, info in title_data.items():
                 cleaned_title = clean_title(title)
-                if isinstance(info, dict):
+                if isinstance(info, (dict, SlotRecord)):
                     ranks = info.get("ranks", [])
                     url = info.get("url", "")
                     mobile_url = info.get("mobileUrl", "")
@@ -605,6 +1333,14 @@ def save_titles_to_file(results: Dict, id_to_name: Dict, failed_ids: List) -> st
             for id_value in failed_ids:
                 f.write(f"{id_value}\n")
 
+    if CONFIG["COMPACT_SNAPSHOT"]:
+        save_compact_snapshot(file_path, results, id_to_name, failed_ids)
+
+    try:
+        get_title_index().sync()
+    except Exception as e:
+        print(f"标题索引更新失败: {e}")
+
     return file_path
 
 
@@ -624,6 +1360,9 @@ def load_frequency_words(
     with open(frequency_path, "r", encoding="utf-8") as f:
         content = f.read()
 
+    IO_STATS["frequency_loads"] += 1
+    IO_STATS["bytes_read"] += frequency_path.stat().st_size
+
     word_groups = [group.strip() for group in content.split("\n\n") if group.strip()]
 
     processed_groups = []
@@ -659,17 +1398,132 @@ def load_frequency_words(
                 }
             )
 
+    # 预先编译匹配器，供 matches_word_groups / count_word_frequency 复用
+    get_keyword_matcher(processed_groups, filter_words)
+
     return processed_groups, filter_words
 
 
+def get_compact_snapshot_path(file_path: Union[str, Path]) -> Path:
+    """获取 txt 快照对应的紧凑快照路径（同目录，.snap 后缀）"""
+    return Path(file_path).with_suffix(".snap")
+
+
+def save_compact_snapshot(
+    file_path: Union[str, Path], results: Dict, id_to_name: Dict, failed_ids: List
+) -> None:
+    """在 txt 旁写入紧凑快照：gzip 压缩的 JSON，平台ID、标题和链接统一放入字符串表
+
+    内容与 txt 中写入的数据一致（清理后的标题、首个排名、按排名排序），
+    解析结果与 parse_file_titles 读取 txt 相同。
+    """
+    strings = [""]
+    string_ids = {"": 0}
+
+    def intern_string(value: str) -> int:
+        string_id = string_ids.get(value)
+        if string_id is None:
+            string_id = len(strings)
+            string_ids[value] = string_id
+            strings.append(value)
+        return string_id
+
+    sources = []
+    for id_value, title_data in results.items():
+        source_id = str(id_value).strip()
+        name = id_to_name.get(id_value)
+        name = name.strip() if name and name != id_value else source_id
+
+        items = []
+        for title, info in title_data.items():
+            if isinstance(info, (dict, SlotRecord)):
+                ranks = info.get("ranks", [])
+                url = info.get("url", "")
+                mobile_url = info.get("mobileUrl", "")
+            else:
+                ranks = info if isinstance(info, list) else []
+                url = ""
+                mobile_url = ""
+
+            items.append(
+                [
+                    ranks[0] if ranks else 1,
+                    intern_string(clean_title(title)),
+                    intern_string(url or ""),
+                    intern_string(mobile_url or ""),
+                ]
+            )
+        items.sort(key=lambda x: x[0])
+
+        sources.append([intern_string(source_id), intern_string(name), items])
+
+    data = {
+        "version": 1,
+        "strings": strings,
+        "sources": sources,
+        "failed": [intern_string(str(id_value)) for id_value in failed_ids],
+    }
+
+    snapshot_path = get_compact_snapshot_path(file_path)
+    tmp_path = snapshot_path.with_suffix(".snap.tmp")
+    try:
+        with gzip.open(tmp_path, "wt", encoding="utf-8", compresslevel=6) as f:
+            json.dump(data, f, ensure_ascii=False, separators=(",", ":"))
+        os.replace(tmp_path, snapshot_path)
+    except OSError as e:
+        print(f"紧凑快照保存失败: {e}")
+
+
+def load_compact_snapshot(file_path: Path) -> Optional[Tuple[Dict, Dict]]:
+    """读取 txt 对应的紧凑快照，不存在、早于 txt 或损坏时返回 None"""
+    snapshot_path = get_compact_snapshot_path(file_path)
+    try:
+        if snapshot_path.stat().st_mtime_ns < Path(file_path).stat().st_mtime_ns:
+            return None
+        raw = snapshot_path.read_bytes()
+        data = json.loads(gzip.decompress(raw))
+        if data.get("version") != 1:
+            return None
+
+        strings = data["strings"]
+        titles_by_id = {}
+        id_to_name = {}
+        for source_index, name_index, items in data["sources"]:
+            if not items:
+                continue
+
+            source_id = sys.intern(strings[source_index])
+            id_to_name[source_id] = strings[name_index]
+            titles = titles_by_id[source_id] = {}
+            for rank, title_index, url_index, mobile_index in items:
+                titles[sys.intern(strings[title_index])] = TitleRecord(
+                    (rank,), strings[url_index], strings[mobile_index]
+                )
+    except FileNotFoundError:
+        return None
+    except (OSError, EOFError, ValueError, KeyError, TypeError, IndexError) as e:
+        print(f"紧凑快照读取失败，改为解析 txt: {snapshot_path}, 错误: {e}")
+        return None
+
+    IO_STATS["files_parsed"] += 1
+    IO_STATS["bytes_read"] += len(raw)
+    return titles_by_id, id_to_name
+
+
 def parse_file_titles(file_path: Path) -> Tuple[Dict, Dict]:
-    """解析单个txt文件的标题数据，返回(titles_by_id, id_to_name)"""
+    """解析单个txt文件的标题数据，返回(titles_by_id, id_to_name)，优先读取紧凑快照"""
+    snapshot = load_compact_snapshot(file_path)
+    if snapshot is not None:
+        return snapshot
+
     titles_by_id = {}
     id_to_name = {}
 
     with open(file_path, "r", encoding="utf-8") as f:
         content = f.read()
         sections = content.split("\n\n")
+        IO_STATS["files_parsed"] += 1
+        IO_STATS["bytes_read"] += os.path.getsize(file_path)
 
         for section in sections:
             if not section.strip() or "==== 以下ID请求失败 ====" in section:
@@ -683,11 +1537,11 @@ def parse_file_titles(file_path: Path) -> Tuple[Dict, Dict]:
             header_line = lines[0].strip()
             if " | " in header_line:
                 parts = header_line.split(" | ", 1)
-                source_id = parts[0].strip()
+                source_id = sys.intern(parts[0].strip())
                 name = parts[1].strip()
                 id_to_name[source_id] = name
             else:
-                source_id = header_line
+                source_id = sys.intern(header_line)
                 id_to_name[source_id] = source_id
 
             titles_by_id[source_id] = {}
@@ -717,14 +1571,12 @@ def parse_file_titles(file_path: Path) -> Tuple[Dict, Dict]:
                             if url_part.endswith("]"):
                                 url = url_part[:-1]
 
-                        title = clean_title(title_part.strip())
-                        ranks = [rank] if rank is not None else [1]
+                        title = sys.intern(clean_title(title_part.strip()))
+                        ranks = (rank,) if rank is not None else (1,)
 
-                        titles_by_id[source_id][title] = {
-                            "ranks": ranks,
-                            "url": url,
-                            "mobileUrl": mobile_url,
-                        }
+                        titles_by_id[source_id][title] = TitleRecord(
+                            ranks, url, mobile_url
+                        )
 
                     except Exception as e:
                         print(f"解析标题行出错: {line}, 错误: {e}")
@@ -735,45 +1587,10 @@ def parse_file_titles(file_path: Path) -> Tuple[Dict, Dict]:
 def read_all_today_titles(
     current_platform_ids: Optional[List[str]] = None,
 ) -> Tuple[Dict, Dict, Dict]:
-    """读取当天所有标题文件，支持按当前监控平台过滤"""
-    date_folder = format_date_folder()
-    txt_dir = Path("output") / date_folder / "txt"
-
-    if not txt_dir.exists():
-        return {}, {}, {}
-
-    all_results = {}
-    final_id_to_name = {}
-    title_info = {}
-
-    files = sorted([f for f in txt_dir.iterdir() if f.suffix == ".txt"])
-
-    for file_path in files:
-        time_info = file_path.stem
-
-        titles_by_id, file_id_to_name = parse_file_titles(file_path)
-
-        if current_platform_ids is not None:
-            filtered_titles_by_id = {}
-            filtered_id_to_name = {}
-
-            for source_id, title_data in titles_by_id.items():
-                if source_id in current_platform_ids:
-                    filtered_titles_by_id[source_id] = title_data
-                    if source_id in file_id_to_name:
-                        filtered_id_to_name[source_id] = file_id_to_name[source_id]
-
-            titles_by_id = filtered_titles_by_id
-            file_id_to_name = filtered_id_to_name
-
-        final_id_to_name.update(file_id_to_name)
-
-        for source_id, title_data in titles_by_id.items():
-            process_source_data(
-                source_id, title_data, time_info, all_results, title_info
-            )
-
-    return all_results, final_id_to_name, title_info
+    """读取当天所有标题数据（基于增量索引），支持按当前监控平台过滤"""
+    title_index = get_title_index()
+    title_index.sync()
+    return title_index.get_titles(current_platform_ids)
 
 
 def process_source_data(
@@ -783,206 +1600,452 @@ def process_source_data(
     all_results: Dict,
     title_info: Dict,
 ) -> None:
-    """处理来源数据，合并重复标题"""
-    if source_id not in all_results:
-        all_results[source_id] = title_data
-
-        if source_id not in title_info:
-            title_info[source_id] = {}
-
-        for title, data in title_data.items():
-            ranks = data.get("ranks", [])
-            url = data.get("url", "")
-            mobile_url = data.get("mobileUrl", "")
-
-            title_info[source_id][title] = {
-                "first_time": time_info,
-                "last_time": time_info,
-                "count": 1,
-                "ranks": ranks,
-                "url": url,
-                "mobileUrl": mobile_url,
-            }
-    else:
-        for title, data in title_data.items():
-            ranks = data.get("ranks", [])
-            url = data.get("url", "")
-            mobile_url = data.get("mobileUrl", "")
-
-            if title not in all_results[source_id]:
-                all_results[source_id][title] = {
-                    "ranks": ranks,
-                    "url": url,
-                    "mobileUrl": mobile_url,
-                }
-                title_info[source_id][title] = {
-                    "first_time": time_info,
-                    "last_time": time_info,
-                    "count": 1,
-                    "ranks": ranks,
-                    "url": url,
-                    "mobileUrl": mobile_url,
-                }
-            else:
-                existing_data = all_results[source_id][title]
-                existing_ranks = existing_data.get("ranks", [])
-                existing_url = existing_data.get("url", "")
-                existing_mobile_url = existing_data.get("mobileUrl", "")
-
-                merged_ranks = existing_ranks.copy()
-                for rank in ranks:
-                    if rank not in merged_ranks:
-                        merged_ranks.append(rank)
-
-                all_results[source_id][title] = {
-                    "ranks": merged_ranks,
-                    "url": existing_url or url,
-                    "mobileUrl": existing_mobile_url or mobile_url,
-                }
+    """处理来源数据，合并重复标题
 
-                title_info[source_id][title]["last_time"] = time_info
-                title_info[source_id][title]["ranks"] = merged_ranks
-                title_info[source_id][title]["count"] += 1
-                if not title_info[source_id][title].get("url"):
-                    title_info[source_id][title]["url"] = url
-                if not title_info[source_id][title].get("mobileUrl"):
-                    title_info[source_id][title]["mobileUrl"] = mobile_url
+    title_data 的值为 parse_file_titles 产生的 TitleRecord，
+    同一条记录同时放入 all_results 和 title_info，合并时原地更新。
+    """
+    if source_id not in all_results:
+        all_results[source_id] = {}
+    if source_id not in title_info:
+        title_info[source_id] = {}
+    source_results = all_results[source_id]
+    source_info = title_info[source_id]
+
+    for title, data in title_data.items():
+        record = source_info.get(title)
+        if record is None:
+            data.first_time = time_info
+            data.last_time = time_info
+            data.count = 1
+            source_results[title] = data
+            source_info[title] = data
+        else:
+            record.merge_ranks(data.ranks)
+            record.last_time = time_info
+            record.count += 1
+            if not record.url:
+                record.url = data.url
+            if not record.mobile_url:
+                record.mobile_url = data.mobile_url
 
 
 def detect_latest_new_titles(current_platform_ids: Optional[List[str]] = None) -> Dict:
     """检测当日最新批次的新增标题，支持按当前监控平台过滤"""
-    date_folder = format_date_folder()
-    txt_dir = Path("output") / date_folder / "txt"
+    title_index = get_title_index()
+    title_index.sync()
+    return title_index.get_latest_new_titles(current_platform_ids)
 
-    if not txt_dir.exists():
-        return {}
 
-    files = sorted([f for f in txt_dir.iterdir() if f.suffix == ".txt"])
-    if len(files) < 2:
-        return {}
-
-    # 解析最新文件
-    latest_file = files[-1]
-    latest_titles, _ = parse_file_titles(latest_file)
-
-    # 如果指定了当前平台列表，过滤最新文件数据
-    if current_platform_ids is not None:
-        filtered_latest_titles = {}
-        for source_id, title_data in latest_titles.items():
-            if source_id in current_platform_ids:
-                filtered_latest_titles[source_id] = title_data
-        latest_titles = filtered_latest_titles
-
-    # 汇总历史标题（按平台过滤）
-    historical_titles = {}
-    for file_path in files[:-1]:
-        historical_data, _ = parse_file_titles(file_path)
-
-        # 过滤历史数据
-        if current_platform_ids is not None:
-            filtered_historical_data = {}
-            for source_id, title_data in historical_data.items():
-                if source_id in current_platform_ids:
-                    filtered_historical_data[source_id] = title_data
-            historical_data = filtered_historical_data
-
-        for source_id, titles_data in historical_data.items():
-            if source_id not in historical_titles:
-                historical_titles[source_id] = set()
-            for title in titles_data.keys():
-                historical_titles[source_id].add(title)
-
-    # 找出新增标题
-    new_titles = {}
-    for source_id, latest_source_titles in latest_titles.items():
-        historical_set = historical_titles.get(source_id, set())
-        source_new_titles = {}
-
-        for title, title_data in latest_source_titles.items():
-            if title not in historical_set:
-                source_new_titles[title] = title_data
-
-        if source_new_titles:
-            new_titles[source_id] = source_new_titles
-
-    return new_titles
+# === 当日标题索引 ===
+class TitleIndex:
+    """当日标题增量索引
 
+    txt 快照仍是唯一数据源，索引只持久化合并后的 title_info。新快照写入后仅解析新增文件，
+    索引缺失、损坏或与 txt 文件列表不一致时自动全量重建。
+    """
 
-# === 统计和分析 ===
-def calculate_news_weight(
-    title_data: Dict, rank_threshold: int = CONFIG["RANK_THRESHOLD"]
-) -> float:
-    """计算新闻权重，用于排序"""
-    ranks = title_data.get("ranks", [])
-    if not ranks:
-        return 0.0
+    VERSION = 1
+
+    def __init__(self, date_folder: str):
+        self.date_folder = date_folder
+        self.txt_dir = Path("output") / date_folder / "txt"
+        self.index_file = Path("output") / date_folder / "index" / "titles.json"
+        self._loaded = False
+        self._reset()
+
+    def _reset(self) -> None:
+        self.files = []
+        self.id_to_name = {}
+        self.title_info = {}
+        self.all_results = {}
+        self.latest_sources = []
+
+    def _list_files(self) -> List[List]:
+        """列出 txt 快照及其 mtime/size，用于判断索引是否过期"""
+        if not self.txt_dir.exists():
+            return []
+
+        entries = []
+        for file_path in sorted(f for f in self.txt_dir.iterdir() if f.suffix == ".txt"):
+            stat = file_path.stat()
+            entries.append([file_path.name, stat.st_mtime_ns, stat.st_size])
+        return entries
+
+    def _load(self) -> None:
+        """从磁盘加载索引，格式不符时视为缺失"""
+        self._loaded = True
+        if not self.index_file.exists():
+            return
 
-    count = title_data.get("count", len(ranks))
-    weight_config = CONFIG["WEIGHT_CONFIG"]
+        try:
+            with open(self.index_file, "r", encoding="utf-8") as f:
+                data = json.load(f)
+
+            if data.get("version") != self.VERSION:
+                return
+
+            title_info = {}
+            all_results = {}
+            for source_id, titles in data["title_info"].items():
+                source_id = sys.intern(source_id)
+                source_info = title_info[source_id] = {}
+                for title, (first_time, last_time, count, ranks, url, mobile_url) in titles.items():
+                    source_info[sys.intern(title)] = TitleRecord(
+                        ranks,
+                        url,
+                        mobile_url,
+                        sys.intern(first_time),
+                        sys.intern(last_time),
+                        count,
+                    )
+                all_results[source_id] = dict(source_info)
+
+            self.files = data["files"]
+            self.id_to_name = data["id_to_name"]
+            self.latest_sources = data["latest_sources"]
+            self.title_info = title_info
+            self.all_results = all_results
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            print(f"标题索引读取失败，将重建: {e}")
+            self._reset()
+
+    def _save(self) -> None:
+        """原子写入索引文件"""
+        data = {
+            "version": self.VERSION,
+            "files": self.files,
+            "id_to_name": self.id_to_name,
+            "latest_sources": self.latest_sources,
+            "title_info": {
+                source_id: {
+                    title: [
+                        info.first_time,
+                        info.last_time,
+                        info.count,
+                        info.ranks.tolist(),
+                        info.url,
+                        info.mobile_url,
+                    ]
+                    for title, info in titles.items()
+                }
+                for source_id, titles in self.title_info.items()
+            },
+        }
 
-    # 排名权重：Σ(11 - min(rank, 10)) / 出现次数
-    rank_scores = []
-    for rank in ranks:
-        score = 11 - min(rank, 10)
-        rank_scores.append(score)
+        try:
+            ensure_directory_exists(str(self.index_file.parent))
+            tmp_file = self.index_file.with_suffix(".tmp")
+            with open(tmp_file, "w", encoding="utf-8") as f:
+                json.dump(data, f, ensure_ascii=False, separators=(",", ":"))
+            os.replace(tmp_file, self.index_file)
+        except OSError as e:
+            print(f"标题索引保存失败: {e}")
+
+    def _apply_file(self, file_name: str) -> None:
+        """合并单个快照文件"""
+        file_path = self.txt_dir / file_name
+        titles_by_id, file_id_to_name = parse_file_titles(file_path)
 
-    rank_weight = sum(rank_scores) / len(ranks) if ranks else 0
+        self.id_to_name.update(file_id_to_name)
+        for source_id, title_data in titles_by_id.items():
+            process_source_data(
+                source_id, title_data, file_path.stem, self.all_results, self.title_info
+            )
+        self.latest_sources = list(titles_by_id.keys())
 
-    # 频次权重：min(出现次数, 10) × 10
-    frequency_weight = min(count, 10) * 10
+    def sync(self) -> None:
+        """与 txt 文件同步：只合并新增快照，文件列表不一致时重建"""
+        if not self._loaded:
+            self._load()
 
-    # 热度加成：高排名次数 / 总出现次数 × 100
-    high_rank_count = sum(1 for rank in ranks if rank <= rank_threshold)
-    hotness_ratio = high_rank_count / len(ranks) if ranks else 0
-    hotness_weight = hotness_ratio * 100
+        current_files = self._list_files()
+        if current_files == self.files:
+            return
 
-    total_weight = (
-        rank_weight * weight_config["RANK_WEIGHT"]
-        + frequency_weight * weight_config["FREQUENCY_WEIGHT"]
-        + hotness_weight * weight_config["HOTNESS_WEIGHT"]
-    )
+        applied = len(self.files)
+        if current_files[:applied] != self.files:
+            if self.files:
+                print("标题索引与 txt 文件不一致，重建索引")
+            self._reset()
+            applied = 0
 
-    return total_weight
+        for file_name, _, _ in current_files[applied:]:
+            self._apply_file(file_name)
 
+        self.files = current_files
+        self._save()
 
-def matches_word_groups(
-    title: str, word_groups: List[Dict], filter_words: List[str]
-) -> bool:
-    """检查标题是否匹配词组规则"""
-    # 如果没有配置词组，则匹配所有标题（支持显示全部新闻）
-    if not word_groups:
-        return True
+    def get_titles(
+        self, current_platform_ids: Optional[List[str]] = None
+    ) -> Tuple[Dict, Dict, Dict]:
+        """返回 (all_results, id_to_name, title_info)，与逐个解析 txt 的结果一致
 
-    title_lower = title.lower()
+        返回的 TitleRecord 与索引共享（all_results 和 title_info 中为同一对象），调用方只读使用。
+        """
+        all_results = {}
+        title_info = {}
+        for source_id, titles in self.title_info.items():
+            if current_platform_ids is not None and source_id not in current_platform_ids:
+                continue
 
-    # 过滤词检查
-    if any(filter_word.lower() in title_lower for filter_word in filter_words):
-        return False
+            all_results[source_id] = dict(titles)
+            title_info[source_id] = dict(titles)
 
-    # 词组匹配检查
-    for group in word_groups:
-        required_words = group["required"]
-        normal_words = group["normal"]
+        id_to_name = {
+            source_id: name
+            for source_id, name in self.id_to_name.items()
+            if current_platform_ids is None or source_id in current_platform_ids
+        }
+        return all_results, id_to_name, title_info
 
-        # 必须词检查
-        if required_words:
-            all_required_present = all(
-                req_word.lower() in title_lower for req_word in required_words
-            )
-            if not all_required_present:
+    def get_latest_new_titles(
+        self, current_platform_ids: Optional[List[str]] = None
+    ) -> Dict:
+        """返回最新快照中首次出现的标题"""
+        if len(self.files) < 2:
+            return {}
+
+        latest_time = Path(self.files[-1][0]).stem
+        new_titles = {}
+        for source_id in self.latest_sources:
+            if current_platform_ids is not None and source_id not in current_platform_ids:
                 continue
 
-        # 普通词检查
-        if normal_words:
-            any_normal_present = any(
-                normal_word.lower() in title_lower for normal_word in normal_words
-            )
-            if not any_normal_present:
+            source_new_titles = {
+                title: info
+                for title, info in self.title_info.get(source_id, {}).items()
+                if info.first_time == latest_time
+            }
+
+            if source_new_titles:
+                new_titles[source_id] = source_new_titles
+
+        return new_titles
+
+
+_title_indexes = {}
+
+
+def get_title_index() -> TitleIndex:
+    """获取当日标题索引（按日期切换）"""
+    date_folder = format_date_folder()
+    if date_folder not in _title_indexes:
+        _title_indexes.clear()
+        _title_indexes[date_folder] = TitleIndex(date_folder)
+    return _title_indexes[date_folder]
+
+
+# === 统计和分析 ===
+def calculate_news_weights(
+    titles: List[Dict], rank_threshold: int = CONFIG["RANK_THRESHOLD"]
+) -> List[float]:
+    """批量计算新闻权重，配置只读取一次，结果与逐条计算完全一致"""
+    weight_config = CONFIG["WEIGHT_CONFIG"]
+    rank_factor = weight_config["RANK_WEIGHT"]
+    frequency_factor = weight_config["FREQUENCY_WEIGHT"]
+    hotness_factor = weight_config["HOTNESS_WEIGHT"]
+
+    # 频次权重只有 min(出现次数, 10) 这几种取值，预先算好加权结果
+    frequency_terms = [min(count, 10) * 10 * frequency_factor for count in range(11)]
+
+    weights = []
+    for title_data in titles:
+        ranks = title_data.get("ranks", [])
+        total = len(ranks)
+        if not total:
+            weights.append(0.0)
+            continue
+
+        count = title_data.get("count", total)
+
+        # 排名权重：Σ(11 - min(rank, 10)) / 出现次数，整数求和后再做一次除法
+        rank_weight = (
+            11 * total - sum([rank if rank < 10 else 10 for rank in ranks])
+        ) / total
+
+        # 频次权重：min(出现次数, 10) × 10
+        if 0 <= count <= 10:
+            frequency_term = frequency_terms[count]
+        else:
+            frequency_term = min(count, 10) * 10 * frequency_factor
+
+        # 热度加成：高排名次数 / 总出现次数 × 100
+        high_rank_count = len([rank for rank in ranks if rank <= rank_threshold])
+        hotness_weight = high_rank_count / total * 100
+
+        weights.append(
+            rank_weight * rank_factor + frequency_term + hotness_weight * hotness_factor
+        )
+
+    return weights
+
+
+def calculate_news_weight(
+    title_data: Dict, rank_threshold: int = CONFIG["RANK_THRESHOLD"]
+) -> float:
+    """计算新闻权重，用于排序"""
+    return calculate_news_weights([title_data], rank_threshold)[0]
+
+
+def sort_titles_by_weight(titles: List[Dict], rank_threshold: int) -> List[Dict]:
+    """按权重降序、最高排名、出现次数排序标题，权重批量计算"""
+    weights = calculate_news_weights(titles, rank_threshold)
+    sort_keys = [
+        (-weight, min(title["ranks"]) if title["ranks"] else 999, -title["count"])
+        for weight, title in zip(weights, titles)
+    ]
+    order = sorted(range(len(titles)), key=sort_keys.__getitem__)
+    return [titles[i] for i in order]
+
+
+class KeywordMatcher:
+    """频率词匹配器：将过滤词、必须词、普通词编译为 Aho-Corasick 自动机，对小写标题单次扫描
+
+    匹配语义与逐词 `word.lower() in title.lower()` 完全一致。
+    """
+
+    def __init__(self, word_groups: List[Dict], filter_words: List[str]):
+        self._goto = [{}]
+        self._fail = [0]
+        self._output = [()]
+        self._pattern_ids = {}
+        self._empty_ids = set()
+
+        self._filter_ids = {self._add_pattern(word) for word in filter_words}
+        self._groups = []
+        self._always_groups = []
+        pattern_groups = {}
+        for index, group in enumerate(word_groups):
+            required_ids = frozenset(self._add_pattern(w) for w in group["required"])
+            normal_ids = frozenset(self._add_pattern(w) for w in group["normal"])
+            self._groups.append((required_ids, normal_ids))
+            if not required_ids and not normal_ids:
+                self._always_groups.append(index)
+            for pattern_id in required_ids | normal_ids:
+                pattern_groups.setdefault(pattern_id, []).append(index)
+
+        self._pattern_groups = pattern_groups
+        self._build_failure_links()
+
+    def _add_pattern(self, word: str) -> int:
+        """插入模式串（小写），返回模式 ID，相同的词共用一个 ID"""
+        word = word.lower()
+        if word in self._pattern_ids:
+            return self._pattern_ids[word]
+
+        pattern_id = len(self._pattern_ids)
+        self._pattern_ids[word] = pattern_id
+        if not word:
+            # 空串在任何标题中都视为存在
+            self._empty_ids.add(pattern_id)
+            return pattern_id
+
+        node = 0
+        for char in word:
+            next_node = self._goto[node].get(char)
+            if next_node is None:
+                next_node = len(self._goto)
+                self._goto[node][char] = next_node
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append(())
+            node = next_node
+        self._output[node] = self._output[node] + (pattern_id,)
+        return pattern_id
+
+    def _build_failure_links(self) -> None:
+        """按广度优先构建失配指针，并把后缀节点的输出合并到当前节点"""
+        queue = list(self._goto[0].values())
+        head = 0
+        while head < len(queue):
+            node = queue[head]
+            head += 1
+            for char, child in self._goto[node].items():
+                fallback = self._fail[node]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(char, 0)
+                self._fail[child] = target if target != child else 0
+                self._output[child] = self._output[child] + self._output[self._fail[child]]
+                queue.append(child)
+
+    def find_patterns(self, title: str) -> set:
+        """返回标题（小写后）中出现的全部模式 ID"""
+        goto = self._goto
+        fail = self._fail
+        output = self._output
+        found = set(self._empty_ids)
+        node = 0
+        for char in title.lower():
+            while node and char not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(char, 0)
+            if output[node]:
+                found.update(output[node])
+        return found
+
+    def match_group(self, title: str) -> Optional[int]:
+        """返回第一个匹配的词组下标；命中过滤词或无匹配时返回 None"""
+        found = self.find_patterns(title)
+        if found & self._filter_ids:
+            return None
+
+        candidates = set(self._always_groups)
+        for pattern_id in found:
+            candidates.update(self._pattern_groups.get(pattern_id, ()))
+
+        for index in sorted(candidates):
+            required_ids, normal_ids = self._groups[index]
+            if required_ids and not required_ids <= found:
+                continue
+            if normal_ids and not normal_ids & found:
                 continue
+            return index
+        return None
+
+
+# 按词组内容缓存编译结果，内容相同的词组（如每次新建的“全部新闻”兜底词组）共用同一个匹配器
+_keyword_matchers = {}
+# 按词组对象记录对应的匹配器，同一列表重复调用时无需重新计算内容键；缓存项持有原列表引用，保证 id 不会被复用
+_keyword_matcher_ids = {}
+
+
+def get_keyword_matcher(
+    word_groups: List[Dict], filter_words: List[str]
+) -> KeywordMatcher:
+    """获取（必要时编译）词组对应的匹配器，词组列表加载后不应再被修改"""
+    id_key = (id(word_groups), id(filter_words))
+    cached = _keyword_matcher_ids.get(id_key)
+    if cached is not None:
+        return cached[2]
 
+    key = (
+        tuple((tuple(group["required"]), tuple(group["normal"])) for group in word_groups),
+        tuple(filter_words),
+    )
+    matcher = _keyword_matchers.get(key)
+    if matcher is None:
+        if len(_keyword_matchers) >= 8:
+            _keyword_matchers.clear()
+        matcher = KeywordMatcher(word_groups, filter_words)
+        _keyword_matchers[key] = matcher
+
+    if len(_keyword_matcher_ids) >= 32:
+        _keyword_matcher_ids.clear()
+    _keyword_matcher_ids[id_key] = (word_groups, filter_words, matcher)
+    return matcher
+
+
+def matches_word_groups(
+    title: str, word_groups: List[Dict], filter_words: List[str]
+) -> bool:
+    """检查标题是否匹配词组规则"""
+    # 如果没有配置词组，则匹配所有标题（支持显示全部新闻）
+    if not word_groups:
         return True
 
-    return False
+    return get_keyword_matcher(word_groups, filter_words).match_group(title) is not None
 
 
 def format_time_display(first_time: str, last_time: str) -> str:
@@ -1124,6 +2187,8 @@ def count_word_frequency(
         group_key = group["group_key"]
         word_stats[group_key] = {"count": 0, "titles": {}}
 
+    matcher = get_keyword_matcher(word_groups, filter_words)
+
     for source_id, titles_data in results_to_process.items():
         total_titles += len(titles_data)
 
@@ -1134,12 +2199,9 @@ def count_word_frequency(
             if title in processed_titles.get(source_id, {}):
                 continue
 
-            # 使用统一的匹配逻辑
-            matches_frequency_words = matches_word_groups(
-                title, word_groups, filter_words
-            )
-
-            if not matches_frequency_words:
+            # 使用统一的匹配逻辑：单次扫描得到第一个匹配的词组
+            group_index = matcher.match_group(title)
+            if group_index is None:
                 continue
 
             # 如果是增量模式或 current 模式第一次，统计匹配的新增新闻数量
@@ -1152,115 +2214,64 @@ def count_word_frequency(
             source_url = title_data.get("url", "")
             source_mobile_url = title_data.get("mobileUrl", "")
 
-            # 找到匹配的词组
-            title_lower = title.lower()
-            for group in word_groups:
-                required_words = group["required"]
-                normal_words = group["normal"]
-
-                # 如果是"全部新闻"模式，所有标题都匹配第一个（唯一的）词组
-                if len(word_groups) == 1 and word_groups[0]["group_key"] == "全部新闻":
-                    group_key = group["group_key"]
-                    word_stats[group_key]["count"] += 1
-                    if source_id not in word_stats[group_key]["titles"]:
-                        word_stats[group_key]["titles"][source_id] = []
-                else:
-                    # 原有的匹配逻辑
-                    if required_words:
-                        all_required_present = all(
-                            req_word.lower() in title_lower
-                            for req_word in required_words
-                        )
-                        if not all_required_present:
-                            continue
-
-                    if normal_words:
-                        any_normal_present = any(
-                            normal_word.lower() in title_lower
-                            for normal_word in normal_words
-                        )
-                        if not any_normal_present:
-                            continue
-
-                    group_key = group["group_key"]
-                    word_stats[group_key]["count"] += 1
-                    if source_id not in word_stats[group_key]["titles"]:
-                        word_stats[group_key]["titles"][source_id] = []
-
-                first_time = ""
-                last_time = ""
-                count_info = 1
-                ranks = source_ranks if source_ranks else []
-                url = source_url
-                mobile_url = source_mobile_url
-
-                # 对于 current 模式，从历史统计信息中获取完整数据
-                if (
-                    mode == "current"
-                    and title_info
-                    and source_id in title_info
-                    and title in title_info[source_id]
-                ):
-                    info = title_info[source_id][title]
-                    first_time = info.get("first_time", "")
-                    last_time = info.get("last_time", "")
-                    count_info = info.get("count", 1)
-                    if "ranks" in info and info["ranks"]:
-                        ranks = info["ranks"]
-                    url = info.get("url", source_url)
-                    mobile_url = info.get("mobileUrl", source_mobile_url)
-                elif (
-                    title_info
-                    and source_id in title_info
-                    and title in title_info[source_id]
-                ):
-                    info = title_info[source_id][title]
-                    first_time = info.get("first_time", "")
-                    last_time = info.get("last_time", "")
-                    count_info = info.get("count", 1)
-                    if "ranks" in info and info["ranks"]:
-                        ranks = info["ranks"]
-                    url = info.get("url", source_url)
-                    mobile_url = info.get("mobileUrl", source_mobile_url)
-
-                if not ranks:
-                    ranks = [99]
-
-                time_display = format_time_display(first_time, last_time)
-
-                source_name = id_to_name.get(source_id, source_id)
-
-                # 判断是否为新增
-                is_new = False
-                if all_news_are_new:
-                    # 增量模式下所有处理的新闻都是新增，或者当天第一次的所有新闻都是新增
-                    is_new = True
-                elif new_titles and source_id in new_titles:
-                    # 检查是否在新增列表中
-                    new_titles_for_source = new_titles[source_id]
-                    is_new = title in new_titles_for_source
-
-                word_stats[group_key]["titles"][source_id].append(
-                    {
-                        "title": title,
-                        "source_name": source_name,
-                        "first_time": first_time,
-                        "last_time": last_time,
-                        "time_display": time_display,
-                        "count": count_info,
-                        "ranks": ranks,
-                        "rank_threshold": rank_threshold,
-                        "url": url,
-                        "mobileUrl": mobile_url,
-                        "is_new": is_new,
-                    }
+            group_key = word_groups[group_index]["group_key"]
+            word_stats[group_key]["count"] += 1
+            if source_id not in word_stats[group_key]["titles"]:
+                word_stats[group_key]["titles"][source_id] = []
+
+            first_time = ""
+            last_time = ""
+            count_info = 1
+            ranks = source_ranks if source_ranks else []
+            url = source_url
+            mobile_url = source_mobile_url
+
+            # 从历史统计信息中获取完整数据（current 模式及其他模式一致）
+            if title_info and source_id in title_info and title in title_info[source_id]:
+                info = title_info[source_id][title]
+                first_time = info.get("first_time", "")
+                last_time = info.get("last_time", "")
+                count_info = info.get("count", 1)
+                if "ranks" in info and info["ranks"]:
+                    ranks = info["ranks"]
+                url = info.get("url", source_url)
+                mobile_url = info.get("mobileUrl", source_mobile_url)
+
+            if not ranks:
+                ranks = [99]
+
+            time_display = format_time_display(first_time, last_time)
+
+            source_name = id_to_name.get(source_id, source_id)
+
+            # 判断是否为新增
+            is_new = False
+            if all_news_are_new:
+                # 增量模式下所有处理的新闻都是新增，或者当天第一次的所有新闻都是新增
+                is_new = True
+            elif new_titles and source_id in new_titles:
+                # 检查是否在新增列表中
+                new_titles_for_source = new_titles[source_id]
+                is_new = title in new_titles_for_source
+
+            word_stats[group_key]["titles"][source_id].append(
+                ReportTitle(
+                    title,
+                    source_name,
+                    first_time,
+                    last_time,
+                    time_display,
+                    count_info,
+                    ranks,
+                    rank_threshold,
+                    url,
+                    mobile_url,
+                    is_new,
                 )
+            )
 
-                if source_id not in processed_titles:
-                    processed_titles[source_id] = {}
-                processed_titles[source_id][title] = True
+            processed_titles[source_id][title] = True
 
-                break
 
     # 最后统一打印汇总信息
     if mode == "incremental":
@@ -1319,14 +2330,7 @@ def count_word_frequency(
             all_titles.extend(title_list)
 
         # 按权重排序
-        sorted_titles = sorted(
-            all_titles,
-            key=lambda x: (
-                -calculate_news_weight(x, rank_threshold),
-                min(x["ranks"]) if x["ranks"] else 999,
-                -x["count"],
-            ),
-        )
+        sorted_titles = sort_titles_by_weight(all_titles, rank_threshold)
 
         stats.append(
             {
@@ -1346,14 +2350,86 @@ def count_word_frequency(
 
 
 # === 报告生成 ===
+class ReportArtifactCache:
+    """报告产物缓存：同一份报告数据的每种格式只渲染一次，供文件、index.html、邮件和各通知渠道复用"""
+
+    def __init__(self, max_entries: int = 32):
+        self.max_entries = max_entries
+        self._artifacts = {}
+        self._fingerprints = {}
+        self._files = {}
+        # 各通知渠道在不同线程中读取产物；可重入，get 内部会调用 fingerprint
+        self._lock = threading.RLock()
+
+    def fingerprint(self, report_data: Dict) -> str:
+        """计算报告数据的内容指纹（同一对象只计算一次）"""
+        with self._lock:
+            return self._fingerprint(report_data)
+
+    def _fingerprint(self, report_data: Dict) -> str:
+        """fingerprint 的实现（调用方需持有锁）"""
+        cached = self._fingerprints.get(id(report_data))
+        if cached is not None and cached[0] is report_data:
+            return cached[1]
+
+        digest = hashlib.sha1(
+            json.dumps(
+                report_data,
+                ensure_ascii=False,
+                sort_keys=True,
+                default=lambda value: (
+                    value.copy() if isinstance(value, SlotRecord) else list(value)
+                ),
+            ).encode("utf-8")
+        ).hexdigest()
+        if len(self._fingerprints) >= self.max_entries:
+            self._fingerprints.clear()
+        # 缓存项持有原对象引用，保证 id 不会被复用
+        self._fingerprints[id(report_data)] = (report_data, digest)
+        return digest
+
+    def get(
+        self, report_data: Dict, format_type: str, options: Tuple, build: Callable[[], object]
+    ):
+        """按 (报告指纹, 格式, 渲染选项) 获取产物，未命中时调用 build 生成（持锁生成，同一产物只生成一次）"""
+        with self._lock:
+            key = (self._fingerprint(report_data), format_type, options)
+            if key not in self._artifacts:
+                if len(self._artifacts) >= self.max_entries:
+                    self._artifacts.pop(next(iter(self._artifacts)))
+                self._artifacts[key] = build()
+            return self._artifacts[key]
+
+    def remember_file(self, file_path: Union[str, Path], chunks: Iterable[str]) -> None:
+        """记录已写入文件的内容片段，之后读取同一文件时无需访问磁盘"""
+        chunks = tuple(chunks)
+        with self._lock:
+            if len(self._files) >= self.max_entries:
+                self._files.pop(next(iter(self._files)))
+            self._files[str(file_path)] = chunks
+
+    def file_content(self, file_path: Optional[Union[str, Path]]) -> Optional[str]:
+        """获取本次运行写入过的文件内容，未记录时返回 None"""
+        if not file_path:
+            return None
+        with self._lock:
+            chunks = self._files.get(str(file_path))
+        return None if chunks is None else "".join(chunks)
+
+
+REPORT_ARTIFACTS = ReportArtifactCache()
+
+
 def prepare_report_data(
     stats: List[Dict],
     failed_ids: Optional[List] = None,
     new_titles: Optional[Dict] = None,
     id_to_name: Optional[Dict] = None,
     mode: str = "daily",
+    word_groups: Optional[List[Dict]] = None,
+    filter_words: Optional[List[str]] = None,
 ) -> Dict:
-    """准备报告数据"""
+    """准备报告数据，未传入频率词时从配置文件加载"""
     processed_new_titles = []
 
     # 在增量模式下隐藏新增新闻区域
@@ -1363,7 +2439,8 @@ def prepare_report_data(
     if not hide_new_section:
         filtered_new_titles = {}
         if new_titles and id_to_name:
-            word_groups, filter_words = load_frequency_words()
+            if word_groups is None or filter_words is None:
+                word_groups, filter_words = load_frequency_words()
             for source_id, titles_data in new_titles.items():
                 filtered_titles = {}
                 for title, title_data in titles_data.items():
@@ -1382,17 +2459,19 @@ def prepare_report_data(
                     mobile_url = title_data.get("mobileUrl", "")
                     ranks = title_data.get("ranks", [])
 
-                    processed_title = {
-                        "title": title,
-                        "source_name": source_name,
-                        "time_display": "",
-                        "count": 1,
-                        "ranks": ranks,
-                        "rank_threshold": CONFIG["RANK_THRESHOLD"],
-                        "url": url,
-                        "mobile_url": mobile_url,
-                        "is_new": True,
-                    }
+                    processed_title = ReportTitle(
+                        title,
+                        source_name,
+                        "",
+                        "",
+                        "",
+                        1,
+                        ranks,
+                        CONFIG["RANK_THRESHOLD"],
+                        url,
+                        mobile_url,
+                        True,
+                    )
                     source_titles.append(processed_title)
 
                 if source_titles:
@@ -1411,6 +2490,11 @@ def prepare_report_data(
 
         processed_titles = []
         for title_data in stat["titles"]:
+            # count_word_frequency 产生的记录已包含报告所需字段，直接复用
+            if isinstance(title_data, ReportTitle):
+                processed_titles.append(title_data)
+                continue
+
             processed_title = {
                 "title": title_data["title"],
                 "source_name": title_data["source_name"],
@@ -1609,8 +2693,11 @@ def generate_html_report(
     mode: str = "daily",
     is_daily_summary: bool = False,
     update_info: Optional[Dict] = None,
+    word_groups: Optional[List[Dict]] = None,
+    filter_words: Optional[List[str]] = None,
+    report_data: Optional[Dict] = None,
 ) -> str:
-    """生成HTML报告"""
+    """生成HTML报告，已准备好的报告数据可通过 report_data 传入"""
     if is_daily_summary:
         if mode == "current":
             filename = "当前榜单汇总.html"
@@ -1623,32 +2710,60 @@ def generate_html_report(
 
     file_path = get_output_path("html", filename)
 
-    report_data = prepare_report_data(stats, failed_ids, new_titles, id_to_name, mode)
+    if report_data is None:
+        report_data = prepare_report_data(
+            stats, failed_ids, new_titles, id_to_name, mode, word_groups, filter_words
+        )
+
+    # 缓存的是按顺序生成的HTML片段，写文件时逐段写出，不拼接整页字符串
+    html_chunks = REPORT_ARTIFACTS.get(
+        report_data,
+        "html",
+        (
+            total_titles,
+            is_daily_summary,
+            mode,
+            tuple(sorted(update_info.items())) if update_info else None,
+        ),
+        lambda: tuple(
+            iter_html_content(
+                report_data, total_titles, is_daily_summary, mode, update_info
+            )
+        ),
+    )
 
-    html_content = render_html_content(
-        report_data, total_titles, is_daily_summary, mode, update_info
+    write_html_file(
+        html_chunks, file_path, [Path("index.html")] if is_daily_summary else []
     )
+    REPORT_ARTIFACTS.remember_file(file_path, html_chunks)
 
-    with open(file_path, "w", encoding="utf-8") as f:
-        f.write(html_content)
+    return file_path
 
-    if is_daily_summary:
-        root_file_path = Path("index.html")
-        with open(root_file_path, "w", encoding="utf-8") as f:
-            f.write(html_content)
 
-    return file_path
+def write_html_file(
+    chunks: Iterable[str], file_path: Union[str, Path], copies: List[Path]
+) -> None:
+    """将HTML片段写入临时文件后原子替换目标文件，副本（如 index.html）优先用硬链接，跨文件系统时复制"""
+    file_path = Path(file_path)
+    tmp_path = file_path.with_name(file_path.name + ".tmp")
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        f.writelines(chunks)
+    os.replace(tmp_path, file_path)
+
+    for copy_path in copies:
+        copy_tmp = copy_path.with_name(copy_path.name + ".tmp")
+        try:
+            if copy_tmp.exists():
+                copy_tmp.unlink()
+            os.link(file_path, copy_tmp)
+        except OSError:
+            shutil.copyfile(file_path, copy_tmp)
+        # 目标文件总是整体替换，不会原地改写与报告共享的 inode
+        os.replace(copy_tmp, copy_path)
 
 
-def render_html_content(
-    report_data: Dict,
-    total_titles: int,
-    is_daily_summary: bool = False,
-    mode: str = "daily",
-    update_info: Optional[Dict] = None,
-) -> str:
-    """渲染HTML内容"""
-    html = """
+# HTML 报告的固定页头（样式与脚本）和页尾，模块加载时构建一次，渲染时直接输出
+HTML_REPORT_HEAD = """
     <!DOCTYPE html>
     <html>
     <head>
@@ -2092,320 +3207,82 @@ def render_html_content(
                         <span class="info-label">报告类型</span>
                         <span class="info-value">"""
 
-    # 处理报告类型显示
-    if is_daily_summary:
-        if mode == "current":
-            html += "当前榜单"
-        elif mode == "incremental":
-            html += "增量模式"
-        else:
-            html += "当日汇总"
-    else:
-        html += "实时分析"
-
-    html += """</span>
-                    </div>
-                    <div class="info-item">
-                        <span class="info-label">新闻总数</span>
-                        <span class="info-value">"""
-
-    html += f"{total_titles} 条"
-
-    # 计算筛选后的热点新闻数量
-    hot_news_count = sum(len(stat["titles"]) for stat in report_data["stats"])
-
-    html += """</span>
-                    </div>
-                    <div class="info-item">
-                        <span class="info-label">热点新闻</span>
-                        <span class="info-value">"""
-
-    html += f"{hot_news_count} 条"
-
-    html += """</span>
-                    </div>
-                    <div class="info-item">
-                        <span class="info-label">生成时间</span>
-                        <span class="info-value">"""
-
-    now = get_beijing_time()
-    html += now.strftime("%m-%d %H:%M")
-
-    html += """</span>
-                    </div>
+HTML_REPORT_TAIL = """
                 </div>
             </div>
-            
-            <div class="content">"""
-
-    # 处理失败ID错误信息
-    if report_data["failed_ids"]:
-        html += """
-                <div class="error-section">
-                    <div class="error-title">⚠️ 请求失败的平台</div>
-                    <ul class="error-list">"""
-        for id_value in report_data["failed_ids"]:
-            html += f'<li class="error-item">{html_escape(id_value)}</li>'
-        html += """
-                    </ul>
-                </div>"""
-
-    # 处理主要统计数据
-    if report_data["stats"]:
-        total_count = len(report_data["stats"])
-
-        for i, stat in enumerate(report_data["stats"], 1):
-            count = stat["count"]
-
-            # 确定热度等级
-            if count >= 10:
-                count_class = "hot"
-            elif count >= 5:
-                count_class = "warm"
-            else:
-                count_class = ""
-
-            escaped_word = html_escape(stat["word"])
-
-            html += f"""
-                <div class="word-group">
-                    <div class="word-header">
-                        <div class="word-info">
-                            <div class="word-name">{escaped_word}</div>
-                            <div class="word-count {count_class}">{count} 条</div>
-                        </div>
-                        <div class="word-index">{i}/{total_count}</div>
-                    </div>"""
-
-            # 处理每个词组下的新闻标题，给每条新闻标上序号
-            for j, title_data in enumerate(stat["titles"], 1):
-                is_new = title_data.get("is_new", False)
-                new_class = "new" if is_new else ""
-
-                html += f"""
-                    <div class="news-item {new_class}">
-                        <div class="news-number">{j}</div>
-                        <div class="news-content">
-                            <div class="news-header">
-                                <span class="source-name">{html_escape(title_data["source_name"])}</span>"""
-
-                # 处理排名显示
-                ranks = title_data.get("ranks", [])
-                if ranks:
-                    min_rank = min(ranks)
-                    max_rank = max(ranks)
-                    rank_threshold = title_data.get("rank_threshold", 10)
-
-                    # 确定排名等级
-                    if min_rank <= 3:
-                        rank_class = "top"
-                    elif min_rank <= rank_threshold:
-                        rank_class = "high"
-                    else:
-                        rank_class = ""
-
-                    if min_rank == max_rank:
-                        rank_text = str(min_rank)
-                    else:
-                        rank_text = f"{min_rank}-{max_rank}"
-
-                    html += f'<span class="rank-num {rank_class}">{rank_text}</span>'
-
-                # 处理时间显示
-                time_display = title_data.get("time_display", "")
-                if time_display:
-                    # 简化时间显示格式，将波浪线替换为~
-                    simplified_time = (
-                        time_display.replace(" ~ ", "~")
-                        .replace("[", "")
-                        .replace("]", "")
-                    )
-                    html += (
-                        f'<span class="time-info">{html_escape(simplified_time)}</span>'
-                    )
-
-                # 处理出现次数
-                count_info = title_data.get("count", 1)
-                if count_info > 1:
-                    html += f'<span class="count-info">{count_info}次</span>'
-
-                html += """
-                            </div>
-                            <div class="news-title">"""
-
-                # 处理标题和链接
-                escaped_title = html_escape(title_data["title"])
-                link_url = title_data.get("mobile_url") or title_data.get("url", "")
-
-                if link_url:
-                    escaped_url = html_escape(link_url)
-                    html += f'<a href="{escaped_url}" target="_blank" class="news-link">{escaped_title}</a>'
-                else:
-                    html += escaped_title
-
-                html += """
-                            </div>
-                        </div>
-                    </div>"""
-
-            html += """
-                </div>"""
-
-    # 处理新增新闻区域
-    if report_data["new_titles"]:
-        html += f"""
-                <div class="new-section">
-                    <div class="new-section-title">本次新增热点 (共 {report_data['total_new_count']} 条)</div>"""
-
-        for source_data in report_data["new_titles"]:
-            escaped_source = html_escape(source_data["source_name"])
-            titles_count = len(source_data["titles"])
-
-            html += f"""
-                    <div class="new-source-group">
-                        <div class="new-source-title">{escaped_source} · {titles_count}条</div>"""
-
-            # 为新增新闻也添加序号
-            for idx, title_data in enumerate(source_data["titles"], 1):
-                ranks = title_data.get("ranks", [])
-
-                # 处理新增新闻的排名显示
-                rank_class = ""
-                if ranks:
-                    min_rank = min(ranks)
-                    if min_rank <= 3:
-                        rank_class = "top"
-                    elif min_rank <= title_data.get("rank_threshold", 10):
-                        rank_class = "high"
-
-                    if len(ranks) == 1:
-                        rank_text = str(ranks[0])
-                    else:
-                        rank_text = f"{min(ranks)}-{max(ranks)}"
-                else:
-                    rank_text = "?"
-
-                html += f"""
-                        <div class="new-item">
-                            <div class="new-item-number">{idx}</div>
-                            <div class="new-item-rank {rank_class}">{rank_text}</div>
-                            <div class="new-item-content">
-                                <div class="new-item-title">"""
-
-                # 处理新增新闻的链接
-                escaped_title = html_escape(title_data["title"])
-                link_url = title_data.get("mobile_url") or title_data.get("url", "")
-
-                if link_url:
-                    escaped_url = html_escape(link_url)
-                    html += f'<a href="{escaped_url}" target="_blank" class="news-link">{escaped_title}</a>'
-                else:
-                    html += escaped_title
-
-                html += """
-                                </div>
-                            </div>
-                        </div>"""
-
-            html += """
-                    </div>"""
-
-        html += """
-                </div>"""
-
-    html += """
-            </div>
-            
-            <div class="footer">
-                <div class="footer-content">
-                    由 <span class="project-name">TrendRadar</span> 生成 · 
-                    <a href="https://github.com/sansan0/TrendRadar" target="_blank" class="footer-link">
-                        GitHub 开源项目
-                    </a>"""
-
-    if update_info:
-        html += f"""
-                    <br>
-                    <span style="color: #ea580c; font-weight: 500;">
-                        发现新版本 {update_info['remote_version']}，当前版本 {update_info['current_version']}
-                    </span>"""
-
-    html += """
-                </div>
-            </div>
-        </div>
-        
-        <script>
-            async function saveAsImage() {
-                const button = event.target;
-                const originalText = button.textContent;
-                
-                try {
-                    button.textContent = '生成中...';
-                    button.disabled = true;
-                    window.scrollTo(0, 0);
-                    
-                    // 等待页面稳定
-                    await new Promise(resolve => setTimeout(resolve, 200));
-                    
-                    // 截图前隐藏按钮
-                    const buttons = document.querySelector('.save-buttons');
-                    buttons.style.visibility = 'hidden';
-                    
-                    // 再次等待确保按钮完全隐藏
-                    await new Promise(resolve => setTimeout(resolve, 100));
-                    
-                    const container = document.querySelector('.container');
-                    
-                    const canvas = await html2canvas(container, {
-                        backgroundColor: '#ffffff',
-                        scale: 1.5,
-                        useCORS: true,
-                        allowTaint: false,
-                        imageTimeout: 10000,
-                        removeContainer: false,
-                        foreignObjectRendering: false,
-                        logging: false,
-                        width: container.offsetWidth,
-                        height: container.offsetHeight,
-                        x: 0,
-                        y: 0,
-                        scrollX: 0,
-                        scrollY: 0,
-                        windowWidth: window.innerWidth,
-                        windowHeight: window.innerHeight
-                    });
-                    
-                    buttons.style.visibility = 'visible';
-                    
-                    const link = document.createElement('a');
-                    const now = new Date();
-                    const filename = `TrendRadar_热点新闻分析_${now.getFullYear()}${String(now.getMonth() + 1).padStart(2, '0')}${String(now.getDate()).padStart(2, '0')}_${String(now.getHours()).padStart(2, '0')}${String(now.getMinutes()).padStart(2, '0')}.png`;
-                    
-                    link.download = filename;
-                    link.href = canvas.toDataURL('image/png', 1.0);
-                    
-                    // 触发下载
-                    document.body.appendChild(link);
-                    link.click();
-                    document.body.removeChild(link);
-                    
-                    button.textContent = '保存成功!';
-                    setTimeout(() => {
-                        button.textContent = originalText;
-                        button.disabled = false;
-                    }, 2000);
-                    
-                } catch (error) {
-                    const buttons = document.querySelector('.save-buttons');
-                    buttons.style.visibility = 'visible';
-                    button.textContent = '保存失败';
-                    setTimeout(() => {
-                        button.textContent = originalText;
-                        button.disabled = false;
-                    }, 2000);
-                }
-            }
+        </div>
+        
+        <script>
+            async function saveAsImage() {
+                const button = event.target;
+                const originalText = button.textContent;
+                
+                try {
+                    button.textContent = '生成中...';
+                    button.disabled = true;
+                    window.scrollTo(0, 0);
+                    
+                    // 等待页面稳定
+                    await new Promise(resolve => setTimeout(resolve, 200));
+                    
+                    // 截图前隐藏按钮
+                    const buttons = document.querySelector('.save-buttons');
+                    buttons.style.visibility = 'hidden';
+                    
+                    // 再次等待确保按钮完全隐藏
+                    await new Promise(resolve => setTimeout(resolve, 100));
+                    
+                    const container = document.querySelector('.container');
+                    
+                    const canvas = await html2canvas(container, {
+                        backgroundColor: '#ffffff',
+                        scale: 1.5,
+                        useCORS: true,
+                        allowTaint: false,
+                        imageTimeout: 10000,
+                        removeContainer: false,
+                        foreignObjectRendering: false,
+                        logging: false,
+                        width: container.offsetWidth,
+                        height: container.offsetHeight,
+                        x: 0,
+                        y: 0,
+                        scrollX: 0,
+                        scrollY: 0,
+                        windowWidth: window.innerWidth,
+                        windowHeight: window.innerHeight
+                    });
+                    
+                    buttons.style.visibility = 'visible';
+                    
+                    const link = document.createElement('a');
+                    const now = new Date();
+                    const filename = `TrendRadar_热点新闻分析_${now.getFullYear()}${String(now.getMonth() + 1).padStart(2, '0')}${String(now.getDate()).padStart(2, '0')}_${String(now.getHours()).padStart(2, '0')}${String(now.getMinutes()).padStart(2, '0')}.png`;
+                    
+                    link.download = filename;
+                    link.href = canvas.toDataURL('image/png', 1.0);
+                    
+                    // 触发下载
+                    document.body.appendChild(link);
+                    link.click();
+                    document.body.removeChild(link);
+                    
+                    button.textContent = '保存成功!';
+                    setTimeout(() => {
+                        button.textContent = originalText;
+                        button.disabled = false;
+                    }, 2000);
+                    
+                } catch (error) {
+                    const buttons = document.querySelector('.save-buttons');
+                    buttons.style.visibility = 'visible';
+                    button.textContent = '保存失败';
+                    setTimeout(() => {
+                        button.textContent = originalText;
+                        button.disabled = false;
+                    }, 2000);
+                }
+            }
             
             async function saveAsMultipleImages() {
                 const button = event.target;
@@ -2646,7 +3523,269 @@ def render_html_content(
     </html>
     """
 
-    return html
+
+def iter_html_content(
+    report_data: Dict,
+    total_titles: int,
+    is_daily_summary: bool = False,
+    mode: str = "daily",
+    update_info: Optional[Dict] = None,
+) -> Iterator[str]:
+    """按顺序逐段生成HTML内容，可直接写入文件而无需拼接整页字符串"""
+    yield HTML_REPORT_HEAD
+
+    # 处理报告类型显示
+    if is_daily_summary:
+        if mode == "current":
+            yield "当前榜单"
+        elif mode == "incremental":
+            yield "增量模式"
+        else:
+            yield "当日汇总"
+    else:
+        yield "实时分析"
+
+    yield """</span>
+                    </div>
+                    <div class="info-item">
+                        <span class="info-label">新闻总数</span>
+                        <span class="info-value">"""
+
+    yield f"{total_titles} 条"
+
+    # 计算筛选后的热点新闻数量
+    hot_news_count = sum(len(stat["titles"]) for stat in report_data["stats"])
+
+    yield """</span>
+                    </div>
+                    <div class="info-item">
+                        <span class="info-label">热点新闻</span>
+                        <span class="info-value">"""
+
+    yield f"{hot_news_count} 条"
+
+    yield """</span>
+                    </div>
+                    <div class="info-item">
+                        <span class="info-label">生成时间</span>
+                        <span class="info-value">"""
+
+    now = get_beijing_time()
+    yield now.strftime("%m-%d %H:%M")
+
+    yield """</span>
+                    </div>
+                </div>
+            </div>
+            
+            <div class="content">"""
+
+    # 处理失败ID错误信息
+    if report_data["failed_ids"]:
+        yield """
+                <div class="error-section">
+                    <div class="error-title">⚠️ 请求失败的平台</div>
+                    <ul class="error-list">"""
+        for id_value in report_data["failed_ids"]:
+            yield f'<li class="error-item">{html_escape(id_value)}</li>'
+        yield """
+                    </ul>
+                </div>"""
+
+    # 处理主要统计数据
+    if report_data["stats"]:
+        total_count = len(report_data["stats"])
+
+        for i, stat in enumerate(report_data["stats"], 1):
+            count = stat["count"]
+
+            # 确定热度等级
+            if count >= 10:
+                count_class = "hot"
+            elif count >= 5:
+                count_class = "warm"
+            else:
+                count_class = ""
+
+            escaped_word = html_escape(stat["word"])
+
+            yield f"""
+                <div class="word-group">
+                    <div class="word-header">
+                        <div class="word-info">
+                            <div class="word-name">{escaped_word}</div>
+                            <div class="word-count {count_class}">{count} 条</div>
+                        </div>
+                        <div class="word-index">{i}/{total_count}</div>
+                    </div>"""
+
+            # 处理每个词组下的新闻标题，给每条新闻标上序号
+            for j, title_data in enumerate(stat["titles"], 1):
+                is_new = title_data.get("is_new", False)
+                new_class = "new" if is_new else ""
+
+                yield f"""
+                    <div class="news-item {new_class}">
+                        <div class="news-number">{j}</div>
+                        <div class="news-content">
+                            <div class="news-header">
+                                <span class="source-name">{html_escape(title_data["source_name"])}</span>"""
+
+                # 处理排名显示
+                ranks = title_data.get("ranks", [])
+                if ranks:
+                    min_rank = min(ranks)
+                    max_rank = max(ranks)
+                    rank_threshold = title_data.get("rank_threshold", 10)
+
+                    # 确定排名等级
+                    if min_rank <= 3:
+                        rank_class = "top"
+                    elif min_rank <= rank_threshold:
+                        rank_class = "high"
+                    else:
+                        rank_class = ""
+
+                    if min_rank == max_rank:
+                        rank_text = str(min_rank)
+                    else:
+                        rank_text = f"{min_rank}-{max_rank}"
+
+                    yield f'<span class="rank-num {rank_class}">{rank_text}</span>'
+
+                # 处理时间显示
+                time_display = title_data.get("time_display", "")
+                if time_display:
+                    # 简化时间显示格式，将波浪线替换为~
+                    simplified_time = (
+                        time_display.replace(" ~ ", "~")
+                        .replace("[", "")
+                        .replace("]", "")
+                    )
+                    yield (
+                        f'<span class="time-info">{html_escape(simplified_time)}</span>'
+                    )
+
+                # 处理出现次数
+                count_info = title_data.get("count", 1)
+                if count_info > 1:
+                    yield f'<span class="count-info">{count_info}次</span>'
+
+                yield """
+                            </div>
+                            <div class="news-title">"""
+
+                # 处理标题和链接
+                escaped_title = html_escape(title_data["title"])
+                link_url = title_data.get("mobile_url") or title_data.get("url", "")
+
+                if link_url:
+                    escaped_url = html_escape(link_url)
+                    yield f'<a href="{escaped_url}" target="_blank" class="news-link">{escaped_title}</a>'
+                else:
+                    yield escaped_title
+
+                yield """
+                            </div>
+                        </div>
+                    </div>"""
+
+            yield """
+                </div>"""
+
+    # 处理新增新闻区域
+    if report_data["new_titles"]:
+        yield f"""
+                <div class="new-section">
+                    <div class="new-section-title">本次新增热点 (共 {report_data['total_new_count']} 条)</div>"""
+
+        for source_data in report_data["new_titles"]:
+            escaped_source = html_escape(source_data["source_name"])
+            titles_count = len(source_data["titles"])
+
+            yield f"""
+                    <div class="new-source-group">
+                        <div class="new-source-title">{escaped_source} · {titles_count}条</div>"""
+
+            # 为新增新闻也添加序号
+            for idx, title_data in enumerate(source_data["titles"], 1):
+                ranks = title_data.get("ranks", [])
+
+                # 处理新增新闻的排名显示
+                rank_class = ""
+                if ranks:
+                    min_rank = min(ranks)
+                    if min_rank <= 3:
+                        rank_class = "top"
+                    elif min_rank <= title_data.get("rank_threshold", 10):
+                        rank_class = "high"
+
+                    if len(ranks) == 1:
+                        rank_text = str(ranks[0])
+                    else:
+                        rank_text = f"{min(ranks)}-{max(ranks)}"
+                else:
+                    rank_text = "?"
+
+                yield f"""
+                        <div class="new-item">
+                            <div class="new-item-number">{idx}</div>
+                            <div class="new-item-rank {rank_class}">{rank_text}</div>
+                            <div class="new-item-content">
+                                <div class="new-item-title">"""
+
+                # 处理新增新闻的链接
+                escaped_title = html_escape(title_data["title"])
+                link_url = title_data.get("mobile_url") or title_data.get("url", "")
+
+                if link_url:
+                    escaped_url = html_escape(link_url)
+                    yield f'<a href="{escaped_url}" target="_blank" class="news-link">{escaped_title}</a>'
+                else:
+                    yield escaped_title
+
+                yield """
+                                </div>
+                            </div>
+                        </div>"""
+
+            yield """
+                    </div>"""
+
+        yield """
+                </div>"""
+
+    yield """
+            </div>
+            
+            <div class="footer">
+                <div class="footer-content">
+                    由 <span class="project-name">TrendRadar</span> 生成 · 
+                    <a href="https://github.com/sansan0/TrendRadar" target="_blank" class="footer-link">
+                        GitHub 开源项目
+                    </a>"""
+
+    if update_info:
+        yield f"""
+                    <br>
+                    <span style="color: #ea580c; font-weight: 500;">
+                        发现新版本 {update_info['remote_version']}，当前版本 {update_info['current_version']}
+                    </span>"""
+
+    yield HTML_REPORT_TAIL
+
+
+def render_html_content(
+    report_data: Dict,
+    total_titles: int,
+    is_daily_summary: bool = False,
+    mode: str = "daily",
+    update_info: Optional[Dict] = None,
+) -> str:
+    """渲染HTML内容"""
+    return "".join(
+        iter_html_content(report_data, total_titles, is_daily_summary, mode, update_info)
+    )
 
 
 def render_feishu_content(
@@ -2829,6 +3968,90 @@ def render_dingtalk_content(
     return text_content
 
 
+# 渲染结果相同的渠道共用一份标题渲染缓存
+TITLE_RENDER_FAMILY = {"dingtalk": "markdown", "wework": "markdown"}
+
+# 按 (渲染族, 是否显示来源, 标题对象) 缓存渲染结果；缓存项持有原对象引用，保证 id 不会被复用
+_title_fragments = {}
+
+
+def render_batch_title(
+    format_type: str, title_data: Dict, show_source: bool
+) -> Tuple[str, int]:
+    """渲染分批消息中的单条标题，返回 (文本, UTF-8 字节数)，同一报告在格式相同的渠道间复用"""
+    key = (TITLE_RENDER_FAMILY.get(format_type, format_type), show_source, id(title_data))
+    cached = _title_fragments.get(key)
+    if cached is not None and cached[0] is title_data:
+        return cached[1]
+
+    if show_source:
+        if format_type in ("wework", "telegram", "ntfy", "feishu", "dingtalk"):
+            text = format_title_for_platform(format_type, title_data, show_source=True)
+        else:
+            text = f"{title_data['title']}"
+    else:
+        # 新增新闻区域不显示来源和 🆕 标记
+        if format_type in ("wework", "telegram", "feishu", "dingtalk"):
+            title_data_copy = title_data.copy()
+            title_data_copy["is_new"] = False
+            text = format_title_for_platform(format_type, title_data_copy, show_source=False)
+        else:
+            text = f"{title_data['title']}"
+
+    if len(_title_fragments) >= 50000:
+        _title_fragments.clear()
+    fragment = (text, len(text.encode("utf-8")))
+    _title_fragments[key] = (title_data, fragment)
+    return fragment
+
+
+class BatchBuilder:
+    """消息分批拼接器：增量记录当前批次字节数，每个片段只编码一次"""
+
+    def __init__(self, base_header: str, base_footer: str, max_bytes: int):
+        self.base_header = base_header
+        self.base_footer = base_footer
+        self.header_size = len(base_header.encode("utf-8"))
+        # 当前批次（不含页脚）允许的字节数上限（不含）
+        self.limit = max_bytes - len(base_footer.encode("utf-8"))
+        self.batches = []
+        self.parts = [base_header]
+        self.size = self.header_size
+        self.has_content = False
+
+    def try_append(self, text: str, size: int) -> bool:
+        """当前批次放得下时追加片段，返回是否已追加"""
+        if self.size + size < self.limit:
+            self.parts.append(text)
+            self.size += size
+            return True
+        return False
+
+    def append(self, text: str) -> None:
+        """不做容量检查直接追加"""
+        self.parts.append(text)
+        self.size += len(text.encode("utf-8"))
+
+    def add(self, text: str, size: int, restart: List[Tuple[str, int]]) -> None:
+        """追加片段；放不下时结束当前批次，以页眉 + restart 中的片段开启新批次"""
+        if not self.try_append(text, size):
+            if self.has_content:
+                self.batches.append("".join(self.parts) + self.base_footer)
+            self.parts = [self.base_header]
+            self.size = self.header_size
+            for part, part_size in restart:
+                self.parts.append(part)
+                self.size += part_size
+        self.has_content = True
+
+    def finish(self) -> List[str]:
+        """完成最后批次并返回全部批次"""
+        if self.has_content:
+            self.batches.append("".join(self.parts) + self.base_footer)
+            self.has_content = False
+        return self.batches
+
+
 def split_content_into_batches(
     report_data: Dict,
     format_type: str,
@@ -2847,7 +4070,8 @@ def split_content_into_batches(
         else:
             max_bytes = CONFIG.get("MESSAGE_BATCH_SIZE", 4000)
 
-    batches = []
+    def measured(text: str) -> Tuple[str, int]:
+        return text, len(text.encode("utf-8"))
 
     total_titles = sum(
         len(stat["titles"]) for stat in report_data["stats"] if stat["count"] > 0
@@ -2904,9 +4128,6 @@ def split_content_into_batches(
         elif format_type == "dingtalk":
             stats_header = f"📊 **热点词汇统计**\n\n"
 
-    current_batch = base_header
-    current_batch_has_content = False
-
     if (
         not report_data["stats"]
         and not report_data["new_titles"]
@@ -2920,26 +4141,18 @@ def split_content_into_batches(
             mode_text = "暂无匹配的热点词汇"
         simple_content = f"📭 {mode_text}\n\n"
         final_content = base_header + simple_content + base_footer
-        batches.append(final_content)
-        return batches
+        return [final_content]
+
+    # 每个片段只编码一次，批次字节数随追加增量累计，整批只在输出时拼接一次
+    builder = BatchBuilder(base_header, base_footer, max_bytes)
 
     # 处理热点词汇统计
     if report_data["stats"]:
         total_count = len(report_data["stats"])
 
         # 添加统计标题
-        test_content = current_batch + stats_header
-        if (
-            len(test_content.encode("utf-8")) + len(base_footer.encode("utf-8"))
-            < max_bytes
-        ):
-            current_batch = test_content
-            current_batch_has_content = True
-        else:
-            if current_batch_has_content:
-                batches.append(current_batch + base_footer)
-            current_batch = base_header + stats_header
-            current_batch_has_content = True
+        stats_part = measured(stats_header)
+        builder.add(*stats_part, restart=[stats_part])
 
         # 逐个处理词组（确保词组标题+第一条新闻的原子性）
         for i, stat in enumerate(report_data["stats"]):
@@ -2996,101 +4209,31 @@ def split_content_into_batches(
                     )
                 else:
                     word_header = f"📌 {sequence_display} **{word}** : {count} 条\n\n"
+            word_part = measured(word_header)
 
-            # 构建第一条新闻
+            # 原子性检查：词组标题+第一条新闻必须一起处理
+            titles = stat["titles"]
             first_news_line = ""
-            if stat["titles"]:
-                first_title_data = stat["titles"][0]
-                if format_type == "wework":
-                    formatted_title = format_title_for_platform(
-                        "wework", first_title_data, show_source=True
-                    )
-                elif format_type == "telegram":
-                    formatted_title = format_title_for_platform(
-                        "telegram", first_title_data, show_source=True
-                    )
-                elif format_type == "ntfy":
-                    formatted_title = format_title_for_platform(
-                        "ntfy", first_title_data, show_source=True
-                    )
-                elif format_type == "feishu":
-                    formatted_title = format_title_for_platform(
-                        "feishu", first_title_data, show_source=True
-                    )
-                elif format_type == "dingtalk":
-                    formatted_title = format_title_for_platform(
-                        "dingtalk", first_title_data, show_source=True
-                    )
-                else:
-                    formatted_title = f"{first_title_data['title']}"
-
-                first_news_line = f"  1. {formatted_title}\n"
-                if len(stat["titles"]) > 1:
+            if titles:
+                first_news_line = f"  1. {render_batch_title(format_type, titles[0], True)[0]}\n"
+                if len(titles) > 1:
                     first_news_line += "\n"
-
-            # 原子性检查：词组标题+第一条新闻必须一起处理
-            word_with_first_news = word_header + first_news_line
-            test_content = current_batch + word_with_first_news
-
-            if (
-                len(test_content.encode("utf-8")) + len(base_footer.encode("utf-8"))
-                >= max_bytes
-            ):
-                # 当前批次容纳不下，开启新批次
-                if current_batch_has_content:
-                    batches.append(current_batch + base_footer)
-                current_batch = base_header + stats_header + word_with_first_news
-                current_batch_has_content = True
-                start_index = 1
-            else:
-                current_batch = test_content
-                current_batch_has_content = True
-                start_index = 1
+            word_with_first_news = measured(word_header + first_news_line)
+            builder.add(*word_with_first_news, restart=[stats_part, word_with_first_news])
 
             # 处理剩余新闻条目
-            for j in range(start_index, len(stat["titles"])):
-                title_data = stat["titles"][j]
-                if format_type == "wework":
-                    formatted_title = format_title_for_platform(
-                        "wework", title_data, show_source=True
-                    )
-                elif format_type == "telegram":
-                    formatted_title = format_title_for_platform(
-                        "telegram", title_data, show_source=True
-                    )
-                elif format_type == "ntfy":
-                    formatted_title = format_title_for_platform(
-                        "ntfy", title_data, show_source=True
-                    )
-                elif format_type == "feishu":
-                    formatted_title = format_title_for_platform(
-                        "feishu", title_data, show_source=True
-                    )
-                elif format_type == "dingtalk":
-                    formatted_title = format_title_for_platform(
-                        "dingtalk", title_data, show_source=True
-                    )
-                else:
-                    formatted_title = f"{title_data['title']}"
-
-                news_line = f"  {j + 1}. {formatted_title}\n"
-                if j < len(stat["titles"]) - 1:
-                    news_line += "\n"
-
-                test_content = current_batch + news_line
-                if (
-                    len(test_content.encode("utf-8")) + len(base_footer.encode("utf-8"))
-                    >= max_bytes
-                ):
-                    if current_batch_has_content:
-                        batches.append(current_batch + base_footer)
-                    current_batch = base_header + stats_header + word_header + news_line
-                    current_batch_has_content = True
-                else:
-                    current_batch = test_content
-                    current_batch_has_content = True
+            last_index = len(titles) - 1
+            for j in range(1, len(titles)):
+                formatted_title, title_size = render_batch_title(format_type, titles[j], True)
+                prefix = f"  {j + 1}. "
+                suffix = "\n\n" if j < last_index else "\n"
+                news_line = (
+                    prefix + formatted_title + suffix,
+                    len(prefix) + title_size + len(suffix),
+                )
+                builder.add(*news_line, restart=[stats_part, word_part, news_line])
 
-            # 词组间分隔符
+            # 词组间分隔符（放不下时直接省略）
             if i < len(report_data["stats"]) - 1:
                 separator = ""
                 if format_type == "wework":
@@ -3104,12 +4247,7 @@ def split_content_into_batches(
                 elif format_type == "dingtalk":
                     separator = f"\n---\n\n"
 
-                test_content = current_batch + separator
-                if (
-                    len(test_content.encode("utf-8")) + len(base_footer.encode("utf-8"))
-                    < max_bytes
-                ):
-                    current_batch = test_content
+                builder.try_append(*measured(separator))
 
     # 处理新增新闻（同样确保来源标题+第一条新闻的原子性）
     if report_data["new_titles"]:
@@ -3127,120 +4265,43 @@ def split_content_into_batches(
         elif format_type == "dingtalk":
             new_header = f"\n---\n\n🆕 **本次新增热点新闻** (共 {report_data['total_new_count']} 条)\n\n"
 
-        test_content = current_batch + new_header
-        if (
-            len(test_content.encode("utf-8")) + len(base_footer.encode("utf-8"))
-            >= max_bytes
-        ):
-            if current_batch_has_content:
-                batches.append(current_batch + base_footer)
-            current_batch = base_header + new_header
-            current_batch_has_content = True
-        else:
-            current_batch = test_content
-            current_batch_has_content = True
+        new_part = measured(new_header)
+        builder.add(*new_part, restart=[new_part])
 
         # 逐个处理新增新闻来源
         for source_data in report_data["new_titles"]:
+            titles = source_data["titles"]
             source_header = ""
             if format_type == "wework":
-                source_header = f"**{source_data['source_name']}** ({len(source_data['titles'])} 条):\n\n"
+                source_header = f"**{source_data['source_name']}** ({len(titles)} 条):\n\n"
             elif format_type == "telegram":
-                source_header = f"{source_data['source_name']} ({len(source_data['titles'])} 条):\n\n"
+                source_header = f"{source_data['source_name']} ({len(titles)} 条):\n\n"
             elif format_type == "ntfy":
-                source_header = f"**{source_data['source_name']}** ({len(source_data['titles'])} 条):\n\n"
+                source_header = f"**{source_data['source_name']}** ({len(titles)} 条):\n\n"
             elif format_type == "feishu":
-                source_header = f"**{source_data['source_name']}** ({len(source_data['titles'])} 条):\n\n"
+                source_header = f"**{source_data['source_name']}** ({len(titles)} 条):\n\n"
             elif format_type == "dingtalk":
-                source_header = f"**{source_data['source_name']}** ({len(source_data['titles'])} 条):\n\n"
-
-            # 构建第一条新增新闻
-            first_news_line = ""
-            if source_data["titles"]:
-                first_title_data = source_data["titles"][0]
-                title_data_copy = first_title_data.copy()
-                title_data_copy["is_new"] = False
-
-                if format_type == "wework":
-                    formatted_title = format_title_for_platform(
-                        "wework", title_data_copy, show_source=False
-                    )
-                elif format_type == "telegram":
-                    formatted_title = format_title_for_platform(
-                        "telegram", title_data_copy, show_source=False
-                    )
-                elif format_type == "feishu":
-                    formatted_title = format_title_for_platform(
-                        "feishu", title_data_copy, show_source=False
-                    )
-                elif format_type == "dingtalk":
-                    formatted_title = format_title_for_platform(
-                        "dingtalk", title_data_copy, show_source=False
-                    )
-                else:
-                    formatted_title = f"{title_data_copy['title']}"
-
-                first_news_line = f"  1. {formatted_title}\n"
+                source_header = f"**{source_data['source_name']}** ({len(titles)} 条):\n\n"
+            source_part = measured(source_header)
 
             # 原子性检查：来源标题+第一条新闻
-            source_with_first_news = source_header + first_news_line
-            test_content = current_batch + source_with_first_news
-
-            if (
-                len(test_content.encode("utf-8")) + len(base_footer.encode("utf-8"))
-                >= max_bytes
-            ):
-                if current_batch_has_content:
-                    batches.append(current_batch + base_footer)
-                current_batch = base_header + new_header + source_with_first_news
-                current_batch_has_content = True
-                start_index = 1
-            else:
-                current_batch = test_content
-                current_batch_has_content = True
-                start_index = 1
+            first_news_line = ""
+            if titles:
+                first_news_line = f"  1. {render_batch_title(format_type, titles[0], False)[0]}\n"
+            source_with_first_news = measured(source_header + first_news_line)
+            builder.add(*source_with_first_news, restart=[new_part, source_with_first_news])
 
             # 处理剩余新增新闻
-            for j in range(start_index, len(source_data["titles"])):
-                title_data = source_data["titles"][j]
-                title_data_copy = title_data.copy()
-                title_data_copy["is_new"] = False
-
-                if format_type == "wework":
-                    formatted_title = format_title_for_platform(
-                        "wework", title_data_copy, show_source=False
-                    )
-                elif format_type == "telegram":
-                    formatted_title = format_title_for_platform(
-                        "telegram", title_data_copy, show_source=False
-                    )
-                elif format_type == "feishu":
-                    formatted_title = format_title_for_platform(
-                        "feishu", title_data_copy, show_source=False
-                    )
-                elif format_type == "dingtalk":
-                    formatted_title = format_title_for_platform(
-                        "dingtalk", title_data_copy, show_source=False
-                    )
-                else:
-                    formatted_title = f"{title_data_copy['title']}"
-
-                news_line = f"  {j + 1}. {formatted_title}\n"
-
-                test_content = current_batch + news_line
-                if (
-                    len(test_content.encode("utf-8")) + len(base_footer.encode("utf-8"))
-                    >= max_bytes
-                ):
-                    if current_batch_has_content:
-                        batches.append(current_batch + base_footer)
-                    current_batch = base_header + new_header + source_header + news_line
-                    current_batch_has_content = True
-                else:
-                    current_batch = test_content
-                    current_batch_has_content = True
+            for j in range(1, len(titles)):
+                formatted_title, title_size = render_batch_title(format_type, titles[j], False)
+                prefix = f"  {j + 1}. "
+                news_line = (
+                    prefix + formatted_title + "\n",
+                    len(prefix) + title_size + 1,
+                )
+                builder.add(*news_line, restart=[new_part, source_part, news_line])
 
-            current_batch += "\n"
+            builder.append("\n")
 
     if report_data["failed_ids"]:
         failed_header = ""
@@ -3255,18 +4316,8 @@ def split_content_into_batches(
         elif format_type == "dingtalk":
             failed_header = f"\n---\n\n⚠️ **数据获取失败的平台：**\n\n"
 
-        test_content = current_batch + failed_header
-        if (
-            len(test_content.encode("utf-8")) + len(base_footer.encode("utf-8"))
-            >= max_bytes
-        ):
-            if current_batch_has_content:
-                batches.append(current_batch + base_footer)
-            current_batch = base_header + failed_header
-            current_batch_has_content = True
-        else:
-            current_batch = test_content
-            current_batch_has_content = True
+        failed_part = measured(failed_header)
+        builder.add(*failed_part, restart=[failed_part])
 
         for i, id_value in enumerate(report_data["failed_ids"], 1):
             if format_type == "feishu":
@@ -3276,24 +4327,88 @@ def split_content_into_batches(
             else:
                 failed_line = f"  • {id_value}\n"
 
-            test_content = current_batch + failed_line
-            if (
-                len(test_content.encode("utf-8")) + len(base_footer.encode("utf-8"))
-                >= max_bytes
-            ):
-                if current_batch_has_content:
-                    batches.append(current_batch + base_footer)
-                current_batch = base_header + failed_header + failed_line
-                current_batch_has_content = True
-            else:
-                current_batch = test_content
-                current_batch_has_content = True
+            failed_line_part = measured(failed_line)
+            builder.add(*failed_line_part, restart=[failed_part, failed_line_part])
 
     # 完成最后批次
-    if current_batch_has_content:
-        batches.append(current_batch + base_footer)
+    return builder.finish()
+
+
+def get_report_batches(
+    report_data: Dict,
+    format_type: str,
+    update_info: Optional[Dict] = None,
+    max_bytes: int = None,
+    mode: str = "daily",
+) -> List[str]:
+    """获取报告的分批消息内容，同一报告数据和格式只分批一次"""
+    options = (
+        tuple(sorted(update_info.items())) if update_info else None,
+        max_bytes,
+        mode,
+    )
+    batches = REPORT_ARTIFACTS.get(
+        report_data,
+        format_type,
+        options,
+        lambda: split_content_into_batches(
+            report_data, format_type, update_info, max_bytes, mode
+        ),
+    )
+    return list(batches)
+
 
-    return batches
+def dispatch_notifications(
+    channels: List[Tuple[str, Callable[[], bool]]], deadline: float
+) -> Dict[str, Dict]:
+    """并发执行各渠道发送任务，超过截止时间仍未完成的渠道记为失败"""
+    results = {}
+    lock = threading.Lock()
+
+    def run_channel(name: str, send: Callable[[], bool]) -> None:
+        start_time = time.monotonic()
+        try:
+            success, error = bool(send()), None
+        except Exception as e:
+            success, error = False, str(e)
+        with lock:
+            results[name] = {
+                "success": success,
+                "elapsed": round(time.monotonic() - start_time, 2),
+                "error": error,
+            }
+
+    # 使用守护线程，超时未完成的渠道不会阻塞程序退出
+    threads = [
+        threading.Thread(
+            target=run_channel, args=(name, send), name=f"notify-{name}", daemon=True
+        )
+        for name, send in channels
+    ]
+    end_time = time.monotonic() + deadline
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(max(0, end_time - time.monotonic()))
+
+    with lock:
+        summary = {}
+        for name, _ in channels:
+            summary[name] = results.get(name) or {
+                "success": False,
+                "elapsed": deadline,
+                "error": f"超过发送截止时间 {deadline} 秒",
+            }
+
+    if summary:
+        print(
+            "通知发送汇总："
+            + "，".join(
+                f"{name} {'成功' if result['success'] else '失败'} {result['elapsed']}s"
+                for name, result in summary.items()
+            )
+        )
+    return summary
 
 
 def send_to_notifications(
@@ -3306,8 +4421,11 @@ def send_to_notifications(
     proxy_url: Optional[str] = None,
     mode: str = "daily",
     html_file_path: Optional[str] = None,
-) -> Dict[str, bool]:
-    """发送数据到多个通知平台"""
+    word_groups: Optional[List[Dict]] = None,
+    filter_words: Optional[List[str]] = None,
+    report_data: Optional[Dict] = None,
+) -> Dict[str, Dict]:
+    """发送数据到多个通知平台，返回各渠道的 {success, elapsed, error}"""
     results = {}
 
     if CONFIG["PUSH_WINDOW"]["ENABLED"]:
@@ -3329,7 +4447,10 @@ def send_to_notifications(
             else:
                 print(f"推送窗口控制：今天首次推送")
 
-    report_data = prepare_report_data(stats, failed_ids, new_titles, id_to_name, mode)
+    if report_data is None:
+        report_data = prepare_report_data(
+            stats, failed_ids, new_titles, id_to_name, mode, word_groups, filter_words
+        )
 
     feishu_url = CONFIG["FEISHU_WEBHOOK_URL"]
     dingtalk_url = CONFIG["DINGTALK_WEBHOOK_URL"]
@@ -3347,27 +4468,30 @@ def send_to_notifications(
 
     update_info_to_send = update_info if CONFIG["SHOW_VERSION_UPDATE"] else None
 
+    # 收集已配置的渠道，各渠道在独立线程中并发发送，渠道内部仍按批次顺序发送
+    channels = []
+
     # 发送到飞书
     if feishu_url:
-        results["feishu"] = send_to_feishu(
+        channels.append(("feishu", lambda: send_to_feishu(
             feishu_url, report_data, report_type, update_info_to_send, proxy_url, mode
-        )
+        )))
 
     # 发送到钉钉
     if dingtalk_url:
-        results["dingtalk"] = send_to_dingtalk(
+        channels.append(("dingtalk", lambda: send_to_dingtalk(
             dingtalk_url, report_data, report_type, update_info_to_send, proxy_url, mode
-        )
+        )))
 
     # 发送到企业微信
     if wework_url:
-        results["wework"] = send_to_wework(
+        channels.append(("wework", lambda: send_to_wework(
             wework_url, report_data, report_type, update_info_to_send, proxy_url, mode
-        )
+        )))
 
     # 发送到 Telegram
     if telegram_token and telegram_chat_id:
-        results["telegram"] = send_to_telegram(
+        channels.append(("telegram", lambda: send_to_telegram(
             telegram_token,
             telegram_chat_id,
             report_data,
@@ -3375,11 +4499,11 @@ def send_to_notifications(
             update_info_to_send,
             proxy_url,
             mode,
-        )
+        )))
 
     # 发送到 ntfy
     if ntfy_server_url and ntfy_topic:
-        results["ntfy"] = send_to_ntfy(
+        channels.append(("ntfy", lambda: send_to_ntfy(
             ntfy_server_url,
             ntfy_topic,
             ntfy_token,
@@ -3388,11 +4512,11 @@ def send_to_notifications(
             update_info_to_send,
             proxy_url,
             mode,
-        )
+        )))
 
     # 发送邮件
     if email_from and email_password and email_to:
-        results["email"] = send_to_email(
+        channels.append(("email", lambda: send_to_email(
             email_from,
             email_password,
             email_to,
@@ -3400,7 +4524,10 @@ def send_to_notifications(
             html_file_path,
             email_smtp_server,
             email_smtp_port,
-        )
+            html_content=REPORT_ARTIFACTS.file_content(html_file_path),
+        )))
+
+    results = dispatch_notifications(channels, CONFIG["SEND_DEADLINE"])
 
     if not results:
         print("未配置任何通知渠道，跳过通知发送")
@@ -3409,7 +4536,7 @@ def send_to_notifications(
     if (
         CONFIG["PUSH_WINDOW"]["ENABLED"]
         and CONFIG["PUSH_WINDOW"]["ONCE_PER_DAY"]
-        and any(results.values())
+        and any(result["success"] for result in results.values())
     ):
         push_manager = PushRecordManager()
         push_manager.record_push(report_type)
@@ -3427,12 +4554,9 @@ def send_to_feishu(
 ) -> bool:
     """发送到飞书（支持分批发送）"""
     headers = {"Content-Type": "application/json"}
-    proxies = None
-    if proxy_url:
-        proxies = {"http": proxy_url, "https": proxy_url}
 
     # 获取分批内容，使用飞书专用的批次大小
-    batches = split_content_into_batches(
+    batches = get_report_batches(
         report_data,
         "feishu",
         update_info,
@@ -3442,12 +4566,14 @@ def send_to_feishu(
 
     print(f"飞书消息分为 {len(batches)} 批次发送 [{report_type}]")
 
-    # 逐批发送
+    total_titles = sum(
+        len(stat["titles"]) for stat in report_data["stats"] if stat["count"] > 0
+    )
+
+    # 生成各批次消息，交给发件箱逐批发送
+    messages = []
     for i, batch_content in enumerate(batches, 1):
         batch_size = len(batch_content.encode("utf-8"))
-        print(
-            f"发送飞书第 {i}/{len(batches)} 批次，大小：{batch_size} 字节 [{report_type}]"
-        )
 
         # 添加批次标识
         if len(batches) > 1:
@@ -3461,9 +4587,6 @@ def send_to_feishu(
                 # 如果没有统计标题，直接在开头添加
                 batch_content = batch_header + batch_content
 
-        total_titles = sum(
-            len(stat["titles"]) for stat in report_data["stats"] if stat["count"] > 0
-        )
         now = get_beijing_time()
 
         payload = {
@@ -3475,36 +4598,18 @@ def send_to_feishu(
                 "text": batch_content,
             },
         }
+        messages.append(
+            {
+                "label": f"第 {i}/{len(batches)} 批次",
+                "size": batch_size,
+                "headers": headers,
+                "json": payload,
+            }
+        )
 
-        try:
-            response = requests.post(
-                webhook_url, headers=headers, json=payload, proxies=proxies, timeout=30
-            )
-            if response.status_code == 200:
-                result = response.json()
-                # 检查飞书的响应状态
-                if result.get("StatusCode") == 0 or result.get("code") == 0:
-                    print(f"飞书第 {i}/{len(batches)} 批次发送成功 [{report_type}]")
-                    # 批次间间隔
-                    if i < len(batches):
-                        time.sleep(CONFIG["BATCH_SEND_INTERVAL"])
-                else:
-                    error_msg = result.get("msg") or result.get("StatusMessage", "未知错误")
-                    print(
-                        f"飞书第 {i}/{len(batches)} 批次发送失败 [{report_type}]，错误：{error_msg}"
-                    )
-                    return False
-            else:
-                print(
-                    f"飞书第 {i}/{len(batches)} 批次发送失败 [{report_type}]，状态码：{response.status_code}"
-                )
-                return False
-        except Exception as e:
-            print(f"飞书第 {i}/{len(batches)} 批次发送出错 [{report_type}]：{e}")
-            return False
-
-    print(f"飞书所有 {len(batches)} 批次发送完成 [{report_type}]")
-    return True
+    return get_notification_outbox().send(
+        "feishu", report_type, messages, proxy_url, endpoint=(webhook_url, {})
+    )
 
 
 def send_to_dingtalk(
@@ -3517,12 +4622,9 @@ def send_to_dingtalk(
 ) -> bool:
     """发送到钉钉（支持分批发送）"""
     headers = {"Content-Type": "application/json"}
-    proxies = None
-    if proxy_url:
-        proxies = {"http": proxy_url, "https": proxy_url}
 
     # 获取分批内容，使用钉钉专用的批次大小
-    batches = split_content_into_batches(
+    batches = get_report_batches(
         report_data,
         "dingtalk",
         update_info,
@@ -3532,12 +4634,10 @@ def send_to_dingtalk(
 
     print(f"钉钉消息分为 {len(batches)} 批次发送 [{report_type}]")
 
-    # 逐批发送
+    # 生成各批次消息，交给发件箱逐批发送
+    messages = []
     for i, batch_content in enumerate(batches, 1):
         batch_size = len(batch_content.encode("utf-8"))
-        print(
-            f"发送钉钉第 {i}/{len(batches)} 批次，大小：{batch_size} 字节 [{report_type}]"
-        )
 
         # 添加批次标识
         if len(batches) > 1:
@@ -3558,34 +4658,18 @@ def send_to_dingtalk(
                 "text": batch_content,
             },
         }
+        messages.append(
+            {
+                "label": f"第 {i}/{len(batches)} 批次",
+                "size": batch_size,
+                "headers": headers,
+                "json": payload,
+            }
+        )
 
-        try:
-            response = requests.post(
-                webhook_url, headers=headers, json=payload, proxies=proxies, timeout=30
-            )
-            if response.status_code == 200:
-                result = response.json()
-                if result.get("errcode") == 0:
-                    print(f"钉钉第 {i}/{len(batches)} 批次发送成功 [{report_type}]")
-                    # 批次间间隔
-                    if i < len(batches):
-                        time.sleep(CONFIG["BATCH_SEND_INTERVAL"])
-                else:
-                    print(
-                        f"钉钉第 {i}/{len(batches)} 批次发送失败 [{report_type}]，错误：{result.get('errmsg')}"
-                    )
-                    return False
-            else:
-                print(
-                    f"钉钉第 {i}/{len(batches)} 批次发送失败 [{report_type}]，状态码：{response.status_code}"
-                )
-                return False
-        except Exception as e:
-            print(f"钉钉第 {i}/{len(batches)} 批次发送出错 [{report_type}]：{e}")
-            return False
-
-    print(f"钉钉所有 {len(batches)} 批次发送完成 [{report_type}]")
-    return True
+    return get_notification_outbox().send(
+        "dingtalk", report_type, messages, proxy_url, endpoint=(webhook_url, {})
+    )
 
 
 def strip_markdown(text: str) -> str:
@@ -3642,9 +4726,6 @@ def send_to_wework(
 ) -> bool:
     """发送到企业微信（支持分批发送，支持 markdown 和 text 两种格式）"""
     headers = {"Content-Type": "application/json"}
-    proxies = None
-    if proxy_url:
-        proxies = {"http": proxy_url, "https": proxy_url}
 
     # 获取消息类型配置（markdown 或 text）
     msg_type = CONFIG.get("WEWORK_MSG_TYPE", "markdown").lower()
@@ -3656,11 +4737,12 @@ def send_to_wework(
         print(f"企业微信使用 markdown 格式（群机器人模式）[{report_type}]")
 
     # 获取分批内容
-    batches = split_content_into_batches(report_data, "wework", update_info, mode=mode)
+    batches = get_report_batches(report_data, "wework", update_info, mode=mode)
 
     print(f"企业微信消息分为 {len(batches)} 批次发送 [{report_type}]")
 
-    # 逐批发送
+    # 生成各批次消息，交给发件箱逐批发送
+    messages = []
     for i, batch_content in enumerate(batches, 1):
         # 添加批次标识
         if len(batches) > 1:
@@ -3681,37 +4763,18 @@ def send_to_wework(
             payload = {"msgtype": "markdown", "markdown": {"content": batch_content}}
             batch_size = len(batch_content.encode("utf-8"))
 
-        print(
-            f"发送企业微信第 {i}/{len(batches)} 批次，大小：{batch_size} 字节 [{report_type}]"
+        messages.append(
+            {
+                "label": f"第 {i}/{len(batches)} 批次",
+                "size": batch_size,
+                "headers": headers,
+                "json": payload,
+            }
         )
 
-        try:
-            response = requests.post(
-                webhook_url, headers=headers, json=payload, proxies=proxies, timeout=30
-            )
-            if response.status_code == 200:
-                result = response.json()
-                if result.get("errcode") == 0:
-                    print(f"企业微信第 {i}/{len(batches)} 批次发送成功 [{report_type}]")
-                    # 批次间间隔
-                    if i < len(batches):
-                        time.sleep(CONFIG["BATCH_SEND_INTERVAL"])
-                else:
-                    print(
-                        f"企业微信第 {i}/{len(batches)} 批次发送失败 [{report_type}]，错误：{result.get('errmsg')}"
-                    )
-                    return False
-            else:
-                print(
-                    f"企业微信第 {i}/{len(batches)} 批次发送失败 [{report_type}]，状态码：{response.status_code}"
-                )
-                return False
-        except Exception as e:
-            print(f"企业微信第 {i}/{len(batches)} 批次发送出错 [{report_type}]：{e}")
-            return False
-
-    print(f"企业微信所有 {len(batches)} 批次发送完成 [{report_type}]")
-    return True
+    return get_notification_outbox().send(
+        "wework", report_type, messages, proxy_url, endpoint=(webhook_url, {})
+    )
 
 
 def send_to_telegram(
@@ -3727,63 +4790,46 @@ def send_to_telegram(
     headers = {"Content-Type": "application/json"}
     url = f"https://api.telegram.org/bot{bot_token}/sendMessage"
 
-    proxies = None
-    if proxy_url:
-        proxies = {"http": proxy_url, "https": proxy_url}
-
     # 获取分批内容
-    batches = split_content_into_batches(
+    batches = get_report_batches(
         report_data, "telegram", update_info, mode=mode
     )
 
     print(f"Telegram消息分为 {len(batches)} 批次发送 [{report_type}]")
 
-    # 逐批发送
+    # 生成各批次消息，交给发件箱逐批发送
+    messages = []
     for i, batch_content in enumerate(batches, 1):
         batch_size = len(batch_content.encode("utf-8"))
-        print(
-            f"发送Telegram第 {i}/{len(batches)} 批次，大小：{batch_size} 字节 [{report_type}]"
-        )
 
         # 添加批次标识
         if len(batches) > 1:
             batch_header = f"<b>[第 {i}/{len(batches)} 批次]</b>\n\n"
             batch_content = batch_header + batch_content
 
+        # chat_id 在发送时合并，不写入发件箱
         payload = {
-            "chat_id": chat_id,
             "text": batch_content,
             "parse_mode": "HTML",
             "disable_web_page_preview": True,
         }
+        messages.append(
+            {
+                "label": f"第 {i}/{len(batches)} 批次",
+                "size": batch_size,
+                "headers": headers,
+                "json": payload,
+            }
+        )
 
-        try:
-            response = requests.post(
-                url, headers=headers, json=payload, proxies=proxies, timeout=30
-            )
-            if response.status_code == 200:
-                result = response.json()
-                if result.get("ok"):
-                    print(f"Telegram第 {i}/{len(batches)} 批次发送成功 [{report_type}]")
-                    # 批次间间隔
-                    if i < len(batches):
-                        time.sleep(CONFIG["BATCH_SEND_INTERVAL"])
-                else:
-                    print(
-                        f"Telegram第 {i}/{len(batches)} 批次发送失败 [{report_type}]，错误：{result.get('description')}"
-                    )
-                    return False
-            else:
-                print(
-                    f"Telegram第 {i}/{len(batches)} 批次发送失败 [{report_type}]，状态码：{response.status_code}"
-                )
-                return False
-        except Exception as e:
-            print(f"Telegram第 {i}/{len(batches)} 批次发送出错 [{report_type}]：{e}")
-            return False
-
-    print(f"Telegram所有 {len(batches)} 批次发送完成 [{report_type}]")
-    return True
+    return get_notification_outbox().send(
+        "telegram",
+        report_type,
+        messages,
+        proxy_url,
+        endpoint=(url, {}),
+        payload_fields={"chat_id": chat_id},
+    )
 
 
 def send_to_email(
@@ -3794,16 +4840,20 @@ def send_to_email(
     html_file_path: str,
     custom_smtp_server: Optional[str] = None,
     custom_smtp_port: Optional[int] = None,
+    html_content: Optional[str] = None,
 ) -> bool:
-    """发送邮件通知"""
+    """发送邮件通知，传入 html_content 时直接使用内存中的报告，不再读取文件"""
     try:
-        if not html_file_path or not Path(html_file_path).exists():
-            print(f"错误：HTML文件不存在或未提供: {html_file_path}")
-            return False
+        if html_content is None:
+            if not html_file_path or not Path(html_file_path).exists():
+                print(f"错误：HTML文件不存在或未提供: {html_file_path}")
+                return False
 
-        print(f"使用HTML文件: {html_file_path}")
-        with open(html_file_path, "r", encoding="utf-8") as f:
-            html_content = f.read()
+            print(f"使用HTML文件: {html_file_path}")
+            with open(html_file_path, "r", encoding="utf-8") as f:
+                html_content = f.read()
+        else:
+            print(f"使用HTML报告: {html_file_path}")
 
         domain = from_email.split("@")[-1].lower()
 
@@ -3955,8 +5005,10 @@ def send_to_ntfy(
         "Tags": "news",
     }
 
+    # 鉴权头只在发送时附加，不写入发件箱
+    auth_headers = {}
     if token:
-        headers["Authorization"] = f"Bearer {token}"
+        auth_headers["Authorization"] = f"Bearer {token}"
     
     # 构建完整URL，确保格式正确
     base_url = server_url.rstrip("/")
@@ -3964,12 +5016,8 @@ def send_to_ntfy(
         base_url = f"https://{base_url}"
     url = f"{base_url}/{topic}"
 
-    proxies = None
-    if proxy_url:
-        proxies = {"http": proxy_url, "https": proxy_url}
-
     # 获取分批内容，使用ntfy专用的4KB限制
-    batches = split_content_into_batches(
+    batches = get_report_batches(
         report_data, "ntfy", update_info, max_bytes=3800, mode=mode
     )
 
@@ -3982,16 +5030,13 @@ def send_to_ntfy(
     
     print(f"ntfy将按反向顺序推送（最后批次先推送），确保客户端显示顺序正确")
 
-    # 逐批发送（反向顺序）
-    success_count = 0
+    # 生成各批次消息（反向顺序），交给发件箱逐批发送
+    messages = []
     for idx, batch_content in enumerate(reversed_batches, 1):
         # 计算正确的批次编号（用户视角的编号）
         actual_batch_num = total_batches - idx + 1
         
         batch_size = len(batch_content.encode("utf-8"))
-        print(
-            f"发送ntfy第 {actual_batch_num}/{total_batches} 批次（推送顺序: {idx}/{total_batches}），大小：{batch_size} 字节 [{report_type}]"
-        )
 
         # 检查消息大小，确保不超过4KB
         if batch_size > 4096:
@@ -4006,77 +5051,71 @@ def send_to_ntfy(
                 f"{report_type_en} ({actual_batch_num}/{total_batches})"
             )
 
-        try:
-            response = requests.post(
-                url,
-                headers=current_headers,
-                data=batch_content.encode("utf-8"),
-                proxies=proxies,
-                timeout=30,
-            )
-
-            if response.status_code == 200:
-                print(f"ntfy第 {actual_batch_num}/{total_batches} 批次发送成功 [{report_type}]")
-                success_count += 1
-                if idx < total_batches:
-                    # 公共服务器建议 2-3 秒，自托管可以更短
-                    interval = 2 if "ntfy.sh" in server_url else 1
-                    time.sleep(interval)
-            elif response.status_code == 429:
-                print(
-                    f"ntfy第 {actual_batch_num}/{total_batches} 批次速率限制 [{report_type}]，等待后重试"
-                )
-                time.sleep(10)  # 等待10秒后重试
-                # 重试一次
-                retry_response = requests.post(
-                    url,
-                    headers=current_headers,
-                    data=batch_content.encode("utf-8"),
-                    proxies=proxies,
-                    timeout=30,
-                )
-                if retry_response.status_code == 200:
-                    print(f"ntfy第 {actual_batch_num}/{total_batches} 批次重试成功 [{report_type}]")
-                    success_count += 1
-                else:
-                    print(
-                        f"ntfy第 {actual_batch_num}/{total_batches} 批次重试失败，状态码：{retry_response.status_code}"
-                    )
-            elif response.status_code == 413:
-                print(
-                    f"ntfy第 {actual_batch_num}/{total_batches} 批次消息过大被拒绝 [{report_type}]，消息大小：{batch_size} 字节"
-                )
-            else:
-                print(
-                    f"ntfy第 {actual_batch_num}/{total_batches} 批次发送失败 [{report_type}]，状态码：{response.status_code}"
-                )
-                try:
-                    print(f"错误详情：{response.text}")
-                except:
-                    pass
-
-        except requests.exceptions.ConnectTimeout:
-            print(f"ntfy第 {actual_batch_num}/{total_batches} 批次连接超时 [{report_type}]")
-        except requests.exceptions.ReadTimeout:
-            print(f"ntfy第 {actual_batch_num}/{total_batches} 批次读取超时 [{report_type}]")
-        except requests.exceptions.ConnectionError as e:
-            print(f"ntfy第 {actual_batch_num}/{total_batches} 批次连接错误 [{report_type}]：{e}")
-        except Exception as e:
-            print(f"ntfy第 {actual_batch_num}/{total_batches} 批次发送异常 [{report_type}]：{e}")
+        messages.append(
+            {
+                "label": f"第 {actual_batch_num}/{total_batches} 批次（推送顺序: {idx}/{total_batches}）",
+                "size": batch_size,
+                "headers": current_headers,
+                "data": batch_content,
+            }
+        )
 
-    # 判断整体发送是否成功
-    if success_count == total_batches:
-        print(f"ntfy所有 {total_batches} 批次发送完成 [{report_type}]")
-        return True
-    elif success_count > 0:
-        print(f"ntfy部分发送成功：{success_count}/{total_batches} 批次 [{report_type}]")
-        return True  # 部分成功也视为成功
-    else:
-        print(f"ntfy发送完全失败 [{report_type}]")
-        return False
+    # 单个批次失败（如消息过大被拒绝）时继续发送其余批次，部分成功也视为成功
+    return get_notification_outbox().send(
+        "ntfy",
+        report_type,
+        messages,
+        proxy_url,
+        endpoint=(url, auth_headers),
+        skip_failed=True,
+    )
 
 
 # === 主分析器 ===
+class RunContext:
+    """单次运行上下文：频率词和当日数据只加载一次，在各阶段之间共享"""
+
+    def __init__(self):
+        self.platform_ids = [platform["id"] for platform in CONFIG["PLATFORMS"]]
+        self.title_file = None
+        self._frequency_words = None
+        self._today_data = None
+        self._io_start = dict(IO_STATS)
+
+    def get_frequency_words(self) -> Tuple[List[Dict], List[str]]:
+        """获取频率词配置（本次运行只读取一次）"""
+        if self._frequency_words is None:
+            self._frequency_words = load_frequency_words()
+        return self._frequency_words
+
+    def get_today_data(self) -> Tuple[Dict, Dict, Dict, Dict]:
+        """获取按当前监控平台过滤的当日数据 (all_results, id_to_name, title_info, new_titles)"""
+        if self._today_data is None:
+            all_results, id_to_name, title_info = read_all_today_titles(
+                self.platform_ids
+            )
+            new_titles = detect_latest_new_titles(self.platform_ids)
+            self._today_data = (all_results, id_to_name, title_info, new_titles)
+        return self._today_data
+
+    def set_title_file(self, title_file: str) -> None:
+        """记录本次保存的快照文件，并使已加载的当日数据失效"""
+        self.title_file = title_file
+        self._today_data = None
+
+    def print_io_stats(self) -> None:
+        """输出本次运行的文件读取统计"""
+        files_parsed = IO_STATS["files_parsed"] - self._io_start["files_parsed"]
+        bytes_read = IO_STATS["bytes_read"] - self._io_start["bytes_read"]
+        frequency_loads = (
+            IO_STATS["frequency_loads"] - self._io_start["frequency_loads"]
+        )
+        print(
+            f"本次运行 I/O 统计: 解析快照 {files_parsed} 个, 读取 {bytes_read / 1024:.1f} KB, "
+            f"加载频率词 {frequency_loads} 次"
+        )
+
+
 class NewsAnalyzer:
     """新闻分析器"""
 
@@ -4121,6 +5160,7 @@ class NewsAnalyzer:
         self.proxy_url = None
         self._setup_proxy()
         self.data_fetcher = DataFetcher(self.proxy_url)
+        self.ctx = RunContext()
 
         if self.is_github_actions:
             self._check_version_update()
@@ -4211,15 +5251,10 @@ class NewsAnalyzer:
     ) -> Optional[Tuple[Dict, Dict, Dict, Dict, List, List]]:
         """统一的数据加载和预处理，使用当前监控平台列表过滤历史数据"""
         try:
-            # 获取当前配置的监控平台ID列表
-            current_platform_ids = []
-            for platform in CONFIG["PLATFORMS"]:
-                current_platform_ids.append(platform["id"])
-
-            print(f"当前监控平台: {current_platform_ids}")
+            print(f"当前监控平台: {self.ctx.platform_ids}")
 
-            all_results, id_to_name, title_info = read_all_today_titles(
-                current_platform_ids
+            all_results, id_to_name, title_info, new_titles = (
+                self.ctx.get_today_data()
             )
 
             if not all_results:
@@ -4229,8 +5264,7 @@ class NewsAnalyzer:
             total_titles = sum(len(titles) for titles in all_results.values())
             print(f"读取到 {total_titles} 个标题（已按当前监控平台过滤）")
 
-            new_titles = detect_latest_new_titles(current_platform_ids)
-            word_groups, filter_words = load_frequency_words()
+            word_groups, filter_words = self.ctx.get_frequency_words()
 
             return (
                 all_results,
@@ -4254,14 +5288,9 @@ class NewsAnalyzer:
                 url = title_data.get("url", "")
                 mobile_url = title_data.get("mobileUrl", "")
 
-                title_info[source_id][title] = {
-                    "first_time": time_info,
-                    "last_time": time_info,
-                    "count": 1,
-                    "ranks": ranks,
-                    "url": url,
-                    "mobileUrl": mobile_url,
-                }
+                title_info[source_id][title] = TitleRecord(
+                    ranks, url, mobile_url, time_info, time_info, 1
+                )
         return title_info
 
     def _run_analysis_pipeline(
@@ -4275,8 +5304,8 @@ class NewsAnalyzer:
         id_to_name: Dict,
         failed_ids: Optional[List] = None,
         is_daily_summary: bool = False,
-    ) -> Tuple[List[Dict], str]:
-        """统一的分析流水线：数据处理 → 统计计算 → HTML生成"""
+    ) -> Tuple[List[Dict], str, Dict]:
+        """统一的分析流水线：数据处理 → 统计计算 → 报告数据 → HTML生成"""
 
         # 统计计算
         stats, total_titles = count_word_frequency(
@@ -4290,6 +5319,11 @@ class NewsAnalyzer:
             mode=mode,
         )
 
+        # 报告数据只准备一次，HTML 与通知共用
+        report_data = prepare_report_data(
+            stats, failed_ids, new_titles, id_to_name, mode, word_groups, filter_words
+        )
+
         # HTML生成
         html_file = generate_html_report(
             stats,
@@ -4300,9 +5334,12 @@ class NewsAnalyzer:
             mode=mode,
             is_daily_summary=is_daily_summary,
             update_info=self.update_info if CONFIG["SHOW_VERSION_UPDATE"] else None,
+            word_groups=word_groups,
+            filter_words=filter_words,
+            report_data=report_data,
         )
 
-        return stats, html_file
+        return stats, html_file, report_data
 
     def _send_notification_if_needed(
         self,
@@ -4313,6 +5350,7 @@ class NewsAnalyzer:
         new_titles: Optional[Dict] = None,
         id_to_name: Optional[Dict] = None,
         html_file_path: Optional[str] = None,
+        report_data: Optional[Dict] = None,
     ) -> bool:
         """统一的通知发送逻辑，包含所有判断条件"""
         has_notification = self._has_notification_configured()
@@ -4322,6 +5360,7 @@ class NewsAnalyzer:
             and has_notification
             and self._has_valid_content(stats, new_titles)
         ):
+            word_groups, filter_words = self.ctx.get_frequency_words()
             send_to_notifications(
                 stats,
                 failed_ids or [],
@@ -4332,6 +5371,9 @@ class NewsAnalyzer:
                 self.proxy_url,
                 mode=mode,
                 html_file_path=html_file_path,
+                word_groups=word_groups,
+                filter_words=filter_words,
+                report_data=report_data,
             )
             return True
         elif CONFIG["ENABLE_NOTIFICATION"] and not has_notification:
@@ -4372,7 +5414,7 @@ class NewsAnalyzer:
         )
 
         # 运行分析流水线
-        stats, html_file = self._run_analysis_pipeline(
+        stats, html_file, report_data = self._run_analysis_pipeline(
             all_results,
             mode_strategy["summary_mode"],
             title_info,
@@ -4394,6 +5436,7 @@ class NewsAnalyzer:
             new_titles=new_titles,
             id_to_name=id_to_name,
             html_file_path=html_file,
+            report_data=report_data,
         )
 
         return html_file
@@ -4413,7 +5456,7 @@ class NewsAnalyzer:
         )
 
         # 运行分析流水线
-        _, html_file = self._run_analysis_pipeline(
+        _, html_file, _ = self._run_analysis_pipeline(
             all_results,
             mode,
             title_info,
@@ -4468,6 +5511,7 @@ class NewsAnalyzer:
         )
 
         title_file = save_titles_to_file(results, id_to_name, failed_ids)
+        self.ctx.set_title_file(title_file)
         print(f"标题已保存到: {title_file}")
 
         return results, id_to_name, failed_ids
@@ -4476,12 +5520,10 @@ class NewsAnalyzer:
         self, mode_strategy: Dict, results: Dict, id_to_name: Dict, failed_ids: List
     ) -> Optional[str]:
         """执行模式特定逻辑"""
-        # 获取当前监控平台ID列表
-        current_platform_ids = [platform["id"] for platform in CONFIG["PLATFORMS"]]
-
-        new_titles = detect_latest_new_titles(current_platform_ids)
-        time_info = Path(save_titles_to_file(results, id_to_name, failed_ids)).stem
-        word_groups, filter_words = load_frequency_words()
+        # 快照已在 _crawl_data 中保存，这里直接复用本次运行的数据
+        new_titles = self.ctx.get_today_data()[3]
+        time_info = Path(self.ctx.title_file).stem
+        word_groups, filter_words = self.ctx.get_frequency_words()
 
         # current模式下，实时推送需要使用完整的历史数据来保证统计信息的完整性
         if self.report_mode == "current":
@@ -4501,7 +5543,7 @@ class NewsAnalyzer:
                     f"current模式：使用过滤后的历史数据，包含平台：{list(all_results.keys())}"
                 )
 
-                stats, html_file = self._run_analysis_pipeline(
+                stats, html_file, _ = self._run_analysis_pipeline(
                     all_results,
                     self.report_mode,
                     historical_title_info,
@@ -4533,7 +5575,7 @@ class NewsAnalyzer:
                 raise RuntimeError("数据一致性检查失败：保存后立即读取失败")
         else:
             title_info = self._prepare_current_title_info(results, time_info)
-            stats, html_file = self._run_analysis_pipeline(
+            stats, html_file, report_data = self._run_analysis_pipeline(
                 results,
                 self.report_mode,
                 title_info,
@@ -4556,6 +5598,7 @@ class NewsAnalyzer:
                     new_titles=new_titles,
                     id_to_name=id_to_name,
                     html_file_path=html_file,
+                    report_data=report_data,
                 )
 
         # 生成汇总报告（如果需要）
@@ -4599,6 +5642,13 @@ class NewsAnalyzer:
 
             self._execute_mode_strategy(mode_strategy, results, id_to_name, failed_ids)
 
+            # 续发其余渠道之前未发完的报告（本次已发送过的渠道在发送前已续发过）
+            if CONFIG["ENABLE_NOTIFICATION"]:
+                get_notification_outbox().flush(self.proxy_url)
+
+            get_http_client().print_pool_stats()
+            self.ctx.print_io_stats()
+
         except Exception as e:
             print(f"分析流程执行出错: {e}")
             raise
@@ -5,8 +5,12 @@ TrendRadar MCP Server - FastMCP 2.0 实现
 支持 stdio 和 HTTP 两种传输模式。
 """
 
+import asyncio
 import json
-from typing import List, Optional, Dict
+import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Any, Callable, List, Optional, Dict
 
 from fastmcp import FastMCP
 
@@ -15,6 +19,8 @@ from .tools.analytics import AnalyticsTools
 from .tools.search_tools import SearchTools
 from .tools.config_mgmt import ConfigManagementTools
 from .tools.system import SystemManagementTools
+from .services.snapshot_watcher import start_snapshot_watcher
+from .utils.errors import ToolTimeoutError
 
 
 # 创建 FastMCP 2.0 应用
@@ -35,6 +41,103 @@ def _get_tools(project_root: Optional[str] = None):
     return _tools_instances
 
 
+# ==================== 工具执行 ====================
+
+# 工具在线程池中执行，避免阻塞事件循环（HTTP 模式下多个客户端共用一个事件循环）。
+# 使用线程而非进程：各工具共享进程内的缓存、解析结果与索引。
+DEFAULT_TOOL_WORKERS = 8
+
+# 默认超时时间（秒），包含排队等待时间；可通过环境变量 MCP_TOOL_TIMEOUT 覆盖
+DEFAULT_TOOL_TIMEOUT = 60.0
+
+# 各工具的超时时间（秒），可通过环境变量 MCP_TOOL_TIMEOUT_<工具名大写> 覆盖
+TOOL_TIMEOUTS = {
+    "analyze_topic_trend": 120.0,
+    "analyze_data_insights": 120.0,
+    "generate_summary_report": 120.0,
+    "search_related_news_history": 120.0,
+    "trigger_crawl": 300.0,
+}
+
+_executor = None
+_executor_workers = None
+
+
+def configure_tool_executor(max_workers: Optional[int] = None) -> None:
+    """
+    设置工具线程池大小（需在处理请求前调用）
+
+    Args:
+        max_workers: 最大并发工具数，默认读取环境变量 MCP_TOOL_WORKERS
+    """
+    global _executor, _executor_workers
+    if max_workers is None:
+        max_workers = int(os.environ.get("MCP_TOOL_WORKERS", DEFAULT_TOOL_WORKERS))
+    if _executor is not None:
+        _executor.shutdown(wait=False)
+        _executor = None
+    _executor_workers = max(1, max_workers)
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    """获取工具线程池（懒加载）"""
+    global _executor
+    if _executor is None:
+        if _executor_workers is None:
+            configure_tool_executor()
+        _executor = ThreadPoolExecutor(max_workers=_executor_workers, thread_name_prefix="mcp-tool")
+    return _executor
+
+
+def get_tool_timeout(tool_name: str) -> float:
+    """
+    获取工具的超时时间
+
+    Args:
+        tool_name: 工具名称
+
+    Returns:
+        超时时间（秒），0 或负数表示不限制
+    """
+    value = os.environ.get(f"MCP_TOOL_TIMEOUT_{tool_name.upper()}")
+    if value is None:
+        if tool_name in TOOL_TIMEOUTS:
+            return TOOL_TIMEOUTS[tool_name]
+        value = os.environ.get("MCP_TOOL_TIMEOUT", DEFAULT_TOOL_TIMEOUT)
+    return float(value)
+
+
+def _call_tool(func: Callable[..., Any], kwargs: Dict) -> str:
+    """在工作线程中执行工具并序列化结果"""
+    result = func(**kwargs)
+    return json.dumps(result, ensure_ascii=False, indent=2)
+
+
+async def _run_tool(tool_name: str, func: Callable[..., Any], **kwargs) -> str:
+    """
+    在线程池中执行工具，超时返回错误信息
+
+    超时后请求立即返回，但已开始执行的工具无法中断，会在后台运行完毕后释放线程。
+
+    Args:
+        tool_name: 工具名称（用于查找超时时间）
+        func: 工具方法
+        **kwargs: 工具参数
+
+    Returns:
+        JSON格式的工具结果
+    """
+    loop = asyncio.get_running_loop()
+    future = loop.run_in_executor(_get_executor(), partial(_call_tool, func, kwargs))
+
+    timeout = get_tool_timeout(tool_name)
+    try:
+        return await asyncio.wait_for(future, timeout=timeout if timeout > 0 else None)
+    except asyncio.TimeoutError:
+        error = ToolTimeoutError(tool_name, timeout)
+        return json.dumps({"success": False, "error": error.to_dict()}, ensure_ascii=False, indent=2)
+
+
 # ==================== 数据查询工具 ====================
 
 @mcp.tool
@@ -71,8 +174,13 @@ async def get_latest_news(
     **注意**：如果用户询问"为什么只显示了部分"，说明他们需要完整数据
     """
     tools = _get_tools()
-    result = tools['data'].get_latest_news(platforms=platforms, limit=limit, include_url=include_url)
-    return json.dumps(result, ensure_ascii=False, indent=2)
+    return await _run_tool(
+        'get_latest_news',
+        tools['data'].get_latest_news,
+        platforms=platforms,
+        limit=limit,
+        include_url=include_url
+    )
 
 
 @mcp.tool
@@ -96,8 +204,7 @@ async def get_trending_topics(
         JSON格式的关注词频率统计列表
     """
     tools = _get_tools()
-    result = tools['data'].get_trending_topics(top_n=top_n, mode=mode)
-    return json.dumps(result, ensure_ascii=False, indent=2)
+    return await _run_tool('get_trending_topics', tools['data'].get_trending_topics, top_n=top_n, mode=mode)
 
 
 @mcp.tool
@@ -139,13 +246,14 @@ async def get_news_by_date(
     **注意**：如果用户询问"为什么只显示了部分"，说明他们需要完整数据
     """
     tools = _get_tools()
-    result = tools['data'].get_news_by_date(
+    return await _run_tool(
+        'get_news_by_date',
+        tools['data'].get_news_by_date,
         date_query=date_query,
         platforms=platforms,
         limit=limit,
         include_url=include_url
     )
-    return json.dumps(result, ensure_ascii=False, indent=2)
 
 
 
@@ -204,7 +312,9 @@ async def analyze_topic_trend(
         - analyze_topic_trend(topic="ChatGPT", analysis_type="predict", lookahead_hours=6)
     """
     tools = _get_tools()
-    result = tools['analytics'].analyze_topic_trend_unified(
+    return await _run_tool(
+        'analyze_topic_trend',
+        tools['analytics'].analyze_topic_trend_unified,
         topic=topic,
         analysis_type=analysis_type,
         date_range=date_range,
@@ -214,7 +324,6 @@ async def analyze_topic_trend(
         lookahead_hours=lookahead_hours,
         confidence_threshold=confidence_threshold
     )
-    return json.dumps(result, ensure_ascii=False, indent=2)
 
 
 @mcp.tool
@@ -250,14 +359,15 @@ async def analyze_data_insights(
         - analyze_data_insights(insight_type="keyword_cooccur", min_frequency=5, top_n=15)
     """
     tools = _get_tools()
-    result = tools['analytics'].analyze_data_insights_unified(
+    return await _run_tool(
+        'analyze_data_insights',
+        tools['analytics'].analyze_data_insights_unified,
         insight_type=insight_type,
         topic=topic,
         date_range=date_range,
         min_frequency=min_frequency,
         top_n=top_n
     )
-    return json.dumps(result, ensure_ascii=False, indent=2)
 
 
 @mcp.tool
@@ -297,7 +407,9 @@ async def analyze_sentiment(
     - 仅在用户明确要求"总结"或"挑重点"时才进行筛选
     """
     tools = _get_tools()
-    result = tools['analytics'].analyze_sentiment(
+    return await _run_tool(
+        'analyze_sentiment',
+        tools['analytics'].analyze_sentiment,
         topic=topic,
         platforms=platforms,
         date_range=date_range,
@@ -305,7 +417,6 @@ async def analyze_sentiment(
         sort_by_weight=sort_by_weight,
         include_url=include_url
     )
-    return json.dumps(result, ensure_ascii=False, indent=2)
 
 
 @mcp.tool
@@ -335,13 +446,14 @@ async def find_similar_news(
     - 仅在用户明确要求"总结"或"挑重点"时才进行筛选
     """
     tools = _get_tools()
-    result = tools['analytics'].find_similar_news(
+    return await _run_tool(
+        'find_similar_news',
+        tools['analytics'].find_similar_news,
         reference_title=reference_title,
         threshold=threshold,
         limit=limit,
         include_url=include_url
     )
-    return json.dumps(result, ensure_ascii=False, indent=2)
 
 
 @mcp.tool
@@ -363,11 +475,12 @@ async def generate_summary_report(
         JSON格式的摘要报告，包含Markdown格式内容
     """
     tools = _get_tools()
-    result = tools['analytics'].generate_summary_report(
+    return await _run_tool(
+        'generate_summary_report',
+        tools['analytics'].generate_summary_report,
         report_type=report_type,
         date_range=date_range
     )
-    return json.dumps(result, ensure_ascii=False, indent=2)
 
 
 # ==================== 智能检索工具 ====================
@@ -442,7 +555,9 @@ async def search_news(
         - 模糊搜索: search_news(query="特斯拉降价", search_mode="fuzzy", threshold=0.4)
     """
     tools = _get_tools()
-    result = tools['search'].search_news_unified(
+    return await _run_tool(
+        'search_news',
+        tools['search'].search_news_unified,
         query=query,
         search_mode=search_mode,
         date_range=date_range,
@@ -452,7 +567,6 @@ async def search_news(
         threshold=threshold,
         include_url=include_url
     )
-    return json.dumps(result, ensure_ascii=False, indent=2)
 
 
 @mcp.tool
@@ -489,14 +603,15 @@ async def search_related_news_history(
     - 仅在用户明确要求"总结"或"挑重点"时才进行筛选
     """
     tools = _get_tools()
-    result = tools['search'].search_related_news_history(
+    return await _run_tool(
+        'search_related_news_history',
+        tools['search'].search_related_news_history,
         reference_text=reference_text,
         time_preset=time_preset,
         threshold=threshold,
         limit=limit,
         include_url=include_url
     )
-    return json.dumps(result, ensure_ascii=False, indent=2)
 
 
 # ==================== 配置与系统管理工具 ====================
@@ -520,8 +635,7 @@ async def get_current_config(
         JSON格式的配置信息
     """
     tools = _get_tools()
-    result = tools['config'].get_current_config(section=section)
-    return json.dumps(result, ensure_ascii=False, indent=2)
+    return await _run_tool('get_current_config', tools['config'].get_current_config, section=section)
 
 
 @mcp.tool
@@ -535,8 +649,7 @@ async def get_system_status() -> str:
         JSON格式的系统状态信息
     """
     tools = _get_tools()
-    result = tools['system'].get_system_status()
-    return json.dumps(result, ensure_ascii=False, indent=2)
+    return await _run_tool('get_system_status', tools['system'].get_system_status)
 
 
 @mcp.tool
@@ -570,8 +683,13 @@ async def trigger_crawl(
         - 使用默认平台: trigger_crawl()  # 爬取config.yaml中配置的所有平台
     """
     tools = _get_tools()
-    result = tools['system'].trigger_crawl(platforms=platforms, save_to_local=save_to_local, include_url=include_url)
-    return json.dumps(result, ensure_ascii=False, indent=2)
+    return await _run_tool(
+        'trigger_crawl',
+        tools['system'].trigger_crawl,
+        platforms=platforms,
+        save_to_local=save_to_local,
+        include_url=include_url
+    )
 
 
 # ==================== 启动入口 ====================
@@ -580,7 +698,8 @@ def run_server(
     project_root: Optional[str] = None,
     transport: str = 'stdio',
     host: str = '0.0.0.0',
-    port: int = 3333
+    port: int = 3333,
+    workers: Optional[int] = None
 ):
     """
     启动 MCP 服务器
@@ -590,16 +709,24 @@ def run_server(
         transport: 传输模式，'stdio' 或 'http'
         host: HTTP模式的监听地址，默认 0.0.0.0
         port: HTTP模式的监听端口，默认 3333
+        workers: 最大并发工具数，默认读取环境变量 MCP_TOOL_WORKERS 或 8
     """
+    # 设置工具线程池
+    configure_tool_executor(workers)
+
     # 初始化工具实例
     _get_tools(project_root)
 
+    # 监听新快照，及时失效当天缓存
+    watcher = start_snapshot_watcher(project_root)
+
     # 打印启动信息
     print()
     print("=" * 60)
     print("  TrendRadar MCP Server - FastMCP 2.0")
     print("=" * 60)
     print(f"  传输模式: {transport.upper()}")
+    print(f"  并发工具数: {_executor_workers}")
 
     if transport == 'stdio':
         print("  协议: MCP over stdio (标准输入输出)")
@@ -614,6 +741,11 @@ def run_server(
     else:
         print("  项目目录: 当前目录")
 
+    if watcher:
+        print(f"  快照监听: {watcher.backend}")
+    else:
+        print("  快照监听: 未启用")
+
     print()
     print("  已注册的工具:")
     print("    === 基础数据查询（P0核心）===")
@@ -685,6 +817,11 @@ if __name__ == '__main__':
         '--project-root',
         help='项目根目录路径'
     )
+    parser.add_argument(
+        '--workers',
+        type=int,
+        help='最大并发工具数，默认 8（也可通过环境变量 MCP_TOOL_WORKERS 设置）'
+    )
 
     args = parser.parse_args()
 
@@ -692,5 +829,6 @@ if __name__ == '__main__':
         project_root=args.project_root,
         transport=args.transport,
         host=args.host,
-        port=args.port
+        port=args.port,
+        workers=args.workers
     )
@@ -1,56 +1,183 @@
 """
 缓存服务
 
-实现TTL缓存机制，提升数据访问性能。
+实现带容量上限的 LRU + TTL 缓存，提升数据访问性能。
+
+- 条目数和估算内存占用超过上限时，按最近最少使用顺序淘汰
+- 每个键在写入时记录自身的 TTL，读取时与调用方传入的 TTL 取较小值
+- 每隔若干次操作顺带清理一次过期条目，无需后台线程
 """
 
+import os
+import sys
 import time
-from typing import Any, Optional
+from collections import OrderedDict
+from itertools import islice
+from typing import Any, Iterable, Optional, Set
 from threading import Lock
 
 
+# 默认容量上限（可通过环境变量覆盖）
+DEFAULT_MAX_ENTRIES = 256
+DEFAULT_MAX_BYTES = 128 * 1024 * 1024
+
+# 未指定 TTL 时使用的默认存活时间（秒）
+DEFAULT_TTL = 3600
+
+# 每隔多少次 get/set 清理一次过期条目
+SWEEP_INTERVAL = 128
+
+# 估算内存占用时每个容器抽样的元素数与最大递归深度
+SIZE_SAMPLE = 16
+SIZE_MAX_DEPTH = 8
+
+
+def estimate_size(obj: Any, exclude: Iterable[Any] = ()) -> int:
+    """
+    抽样估算对象及其引用对象占用的内存（字节）
+
+    容器只抽取前 SIZE_SAMPLE 个元素计算平均大小再乘以元素数，嵌套超过 SIZE_MAX_DEPTH 层
+    只计算自身大小，耗时与数据量基本无关。抽样中遇到的同一对象（如共享的键字符串）只计算一次。
+    结果用于容量控制，不要求精确。
+
+    Args:
+        obj: 任意对象
+        exclude: 不计入的对象（例如索引引用的、已单独缓存的原始数据）
+
+    Returns:
+        估算字节数
+    """
+    return _estimate(obj, {id(item) for item in exclude}, 0)
+
+
+def _estimate(obj: Any, seen: Set[int], depth: int) -> int:
+    """estimate_size 的递归实现，seen 为已计算（或排除）的对象 id"""
+    if id(obj) in seen:
+        return 0
+    seen.add(id(obj))
+    try:
+        size = sys.getsizeof(obj)
+    except TypeError:
+        return 0
+
+    if isinstance(obj, (str, bytes, int, float, bool, type(None))) or depth >= SIZE_MAX_DEPTH:
+        return size
+
+    if isinstance(obj, dict):
+        items = list(islice(obj.items(), SIZE_SAMPLE))
+        if items:
+            sampled = sum(
+                _estimate(key, seen, depth + 1) + _estimate(value, seen, depth + 1)
+                for key, value in items
+            )
+            size += sampled * len(obj) // len(items)
+    elif isinstance(obj, (list, tuple, set, frozenset)):
+        items = list(islice(obj, SIZE_SAMPLE))
+        if items:
+            sampled = sum(_estimate(item, seen, depth + 1) for item in items)
+            size += sampled * len(obj) // len(items)
+    else:
+        if hasattr(obj, "__dict__"):
+            size += _estimate(obj.__dict__, seen, depth + 1)
+        for slot in getattr(type(obj), "__slots__", ()):
+            if hasattr(obj, slot):
+                size += _estimate(getattr(obj, slot), seen, depth + 1)
+
+    return size
+
+
 class CacheService:
     """缓存服务类"""
 
-    def __init__(self):
-        """初始化缓存服务"""
-        self._cache = {}
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        default_ttl: int = DEFAULT_TTL
+    ):
+        """
+        初始化缓存服务
+
+        Args:
+            max_entries: 最大条目数
+            max_bytes: 估算内存占用上限（字节）
+            default_ttl: set 未指定 TTL 时的默认存活时间（秒）
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.default_ttl = default_ttl
+
+        # 按访问顺序排列，最近使用的在末尾
+        self._cache = OrderedDict()
         self._timestamps = {}
+        self._ttls = {}
+        self._sizes = {}
+        self._total_bytes = 0
         self._lock = Lock()
 
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+        self._ops = 0
+
     def get(self, key: str, ttl: int = 900) -> Optional[Any]:
         """
         获取缓存数据
 
         Args:
             key: 缓存键
-            ttl: 存活时间（秒），默认15分钟
+            ttl: 存活时间（秒），默认15分钟；与写入时记录的 TTL 取较小值
 
         Returns:
             缓存的值，如果不存在或已过期则返回None
         """
         with self._lock:
+            self._tick()
             if key in self._cache:
                 # 检查是否过期
-                if time.time() - self._timestamps[key] < ttl:
+                if time.time() - self._timestamps[key] < min(ttl, self._ttls[key]):
+                    self._cache.move_to_end(key)
+                    self._hits += 1
                     return self._cache[key]
                 else:
                     # 已过期，删除缓存
-                    del self._cache[key]
-                    del self._timestamps[key]
+                    self._remove(key)
+                    self._expirations += 1
+            self._misses += 1
         return None
 
-    def set(self, key: str, value: Any) -> None:
+    def set(self, key: str, value: Any, ttl: Optional[int] = None, size: Optional[int] = None) -> None:
         """
         设置缓存数据
 
         Args:
             key: 缓存键
             value: 缓存值
+            ttl: 该键的存活时间（秒），默认使用 default_ttl
+            size: 调用方给出的内存占用（字节），默认由 estimate_size 抽样估算
         """
+        if size is None:
+            size = estimate_size(value)
+
         with self._lock:
+            self._tick()
+            if key in self._cache:
+                self._remove(key)
+
             self._cache[key] = value
             self._timestamps[key] = time.time()
+            self._ttls[key] = ttl if ttl is not None else self.default_ttl
+            self._sizes[key] = size
+            self._total_bytes += size
+
+            # 超出容量时淘汰最久未使用的条目（至少保留刚写入的这一条）
+            while len(self._cache) > 1 and (
+                len(self._cache) > self.max_entries or self._total_bytes > self.max_bytes
+            ):
+                oldest_key = next(iter(self._cache))
+                self._remove(oldest_key)
+                self._evictions += 1
 
     def delete(self, key: str) -> bool:
         """
@@ -64,39 +191,47 @@ class CacheService:
         """
         with self._lock:
             if key in self._cache:
-                del self._cache[key]
-                del self._timestamps[key]
+                self._remove(key)
                 return True
         return False
 
+    def delete_prefix(self, prefix: str) -> int:
+        """
+        删除所有以指定前缀开头的缓存
+
+        Args:
+            prefix: 缓存键前缀
+
+        Returns:
+            删除的条目数量
+        """
+        with self._lock:
+            keys = [key for key in self._cache if key.startswith(prefix)]
+            for key in keys:
+                self._remove(key)
+        return len(keys)
+
     def clear(self) -> None:
         """清空所有缓存"""
         with self._lock:
             self._cache.clear()
             self._timestamps.clear()
+            self._ttls.clear()
+            self._sizes.clear()
+            self._total_bytes = 0
 
     def cleanup_expired(self, ttl: int = 900) -> int:
         """
         清理过期缓存
 
         Args:
-            ttl: 存活时间（秒）
+            ttl: 存活时间（秒），与各键自身的 TTL 取较小值
 
         Returns:
             清理的条目数量
         """
         with self._lock:
-            current_time = time.time()
-            expired_keys = [
-                key for key, timestamp in self._timestamps.items()
-                if current_time - timestamp >= ttl
-            ]
-
-            for key in expired_keys:
-                del self._cache[key]
-                del self._timestamps[key]
-
-            return len(expired_keys)
+            return self._sweep(ttl)
 
     def get_stats(self) -> dict:
         """
@@ -106,6 +241,7 @@ class CacheService:
             统计信息字典
         """
         with self._lock:
+            lookups = self._hits + self._misses
             return {
                 "total_entries": len(self._cache),
                 "oldest_entry_age": (
@@ -115,9 +251,46 @@ class CacheService:
                 "newest_entry_age": (
                     time.time() - max(self._timestamps.values())
                     if self._timestamps else 0
-                )
+                ),
+                "max_entries": self.max_entries,
+                "estimated_bytes": self._total_bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_rate": round(self._hits / lookups, 4) if lookups else 0,
+                "evictions": self._evictions,
+                "expirations": self._expirations
             }
 
+    def _remove(self, key: str) -> None:
+        """删除条目并更新内存统计（调用方需持有锁）"""
+        del self._cache[key]
+        del self._timestamps[key]
+        del self._ttls[key]
+        self._total_bytes -= self._sizes.pop(key)
+
+    def _sweep(self, ttl: Optional[int] = None) -> int:
+        """清理过期条目（调用方需持有锁）"""
+        current_time = time.time()
+        expired_keys = [
+            key for key, timestamp in self._timestamps.items()
+            if current_time - timestamp >= (
+                self._ttls[key] if ttl is None else min(ttl, self._ttls[key])
+            )
+        ]
+
+        for key in expired_keys:
+            self._remove(key)
+        self._expirations += len(expired_keys)
+
+        return len(expired_keys)
+
+    def _tick(self) -> None:
+        """记录一次操作，按固定间隔分摊清理过期条目（调用方需持有锁）"""
+        self._ops += 1
+        if self._ops % SWEEP_INTERVAL == 0:
+            self._sweep()
+
 
 # 全局缓存实例
 _global_cache = None
@@ -127,10 +300,15 @@ def get_cache() -> CacheService:
     """
     获取全局缓存实例
 
+    容量上限可通过环境变量 MCP_CACHE_MAX_ENTRIES、MCP_CACHE_MAX_MB 调整。
+
     Returns:
         全局缓存服务实例
     """
     global _global_cache
     if _global_cache is None:
-        _global_cache = CacheService()
+        _global_cache = CacheService(
+            max_entries=int(os.environ.get("MCP_CACHE_MAX_ENTRIES", DEFAULT_MAX_ENTRIES)),
+            max_bytes=int(float(os.environ.get("MCP_CACHE_MAX_MB", DEFAULT_MAX_BYTES / 1024 / 1024)) * 1024 * 1024)
+        )
     return _global_cache
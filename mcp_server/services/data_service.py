@@ -6,11 +6,15 @@
 
 import re
 from collections import Counter
-from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Tuple
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from .cache_service import get_cache
+from .history_store import get_history_store
+from .http_service import get_http_service
 from .parser_service import ParserService
+from .singleflight import single_flight
+from .snapshot_watcher import cache_generation, today_cache_ttl
 from ..utils.errors import DataNotFoundError
 
 
@@ -26,6 +30,48 @@ class DataService:
         """
         self.parser = ParserService(project_root)
         self.cache = get_cache()
+        self.history = get_history_store(self.parser.project_root, self.parser)
+
+    def _get_cached(
+        self,
+        cache_key: str,
+        ttl: int,
+        load: Callable[[], Any],
+        date_str: Optional[str] = None
+    ) -> Any:
+        """
+        读取缓存，未命中时计算并写入缓存
+
+        相同缓存键的并发请求只计算一次，其余请求等待并共享结果。
+        计算期间该日期有新快照写入（缓存代数变化）时，结果只返回不缓存。
+
+        Args:
+            cache_key: 缓存键
+            ttl: 缓存时间（秒）
+            load: 计算函数
+            date_str: 数据所属日期（YYYY-MM-DD），默认为今天
+
+        Returns:
+            缓存或计算得到的结果
+        """
+        cached = self.cache.get(cache_key, ttl=ttl)
+        if cached:
+            return cached
+
+        date = date_str or datetime.now().strftime("%Y-%m-%d")
+
+        def compute():
+            # 等待期间前一次计算可能刚写入缓存
+            cached = self.cache.get(cache_key, ttl=ttl)
+            if cached:
+                return cached
+            generation = cache_generation(date)
+            result = load()
+            if cache_generation(date) == generation:
+                self.cache.set(cache_key, result, ttl=ttl)
+            return result
+
+        return single_flight(cache_key, compute)
 
     def get_latest_news(
         self,
@@ -49,10 +95,19 @@ class DataService:
         """
         # 尝试从缓存获取
         cache_key = f"latest_news:{','.join(platforms or [])}:{limit}:{include_url}"
-        cached = self.cache.get(cache_key, ttl=900)  # 15分钟缓存
-        if cached:
-            return cached
+        ttl = today_cache_ttl(900)  # 15分钟缓存，快照监听生效时延长
+        return self._get_cached(
+            cache_key, ttl,
+            lambda: self._load_latest_news(platforms, limit, include_url)
+        )
 
+    def _load_latest_news(
+        self,
+        platforms: Optional[List[str]],
+        limit: int,
+        include_url: bool
+    ) -> List[Dict]:
+        """读取今天的数据并整理为最新新闻列表（不经过缓存）"""
         # 读取今天的数据
         all_titles, id_to_name, timestamps = self.parser.read_all_titles_for_date(
             date=None,
@@ -96,9 +151,6 @@ class DataService:
         # 限制返回数量
         result = news_list[:limit]
 
-        # 缓存结果
-        self.cache.set(cache_key, result)
-
         return result
 
     def get_news_by_date(
@@ -134,10 +186,24 @@ class DataService:
         # 尝试从缓存获取
         date_str = target_date.strftime("%Y-%m-%d")
         cache_key = f"news_by_date:{date_str}:{','.join(platforms or [])}:{limit}:{include_url}"
-        cached = self.cache.get(cache_key, ttl=1800)  # 30分钟缓存
-        if cached:
-            return cached
+        ttl = 1800  # 30分钟缓存
+        if target_date.date() == datetime.now().date():
+            ttl = today_cache_ttl(ttl)
+        return self._get_cached(
+            cache_key, ttl,
+            lambda: self._load_news_by_date(target_date, date_str, platforms, limit, include_url),
+            date_str
+        )
 
+    def _load_news_by_date(
+        self,
+        target_date: datetime,
+        date_str: str,
+        platforms: Optional[List[str]],
+        limit: int,
+        include_url: bool
+    ) -> List[Dict]:
+        """读取指定日期的数据并整理为新闻列表（不经过缓存）"""
         # 读取指定日期的数据
         all_titles, id_to_name, timestamps = self.parser.read_all_titles_for_date(
             date=target_date,
@@ -176,9 +242,6 @@ class DataService:
         # 限制返回数量
         result = news_list[:limit]
 
-        # 缓存结果(历史数据缓存更久)
-        self.cache.set(cache_key, result)
-
         return result
 
     def search_news_by_keyword(
@@ -210,48 +273,28 @@ class DataService:
             # 默认搜索今天
             start_date = end_date = datetime.now()
 
-        # 收集所有匹配的新闻
+        # 收集所有匹配的新闻（历史库按日期、全文索引检索）
         results = []
         platform_distribution = Counter()
 
-        # 遍历日期范围
-        current_date = start_date
-        while current_date <= end_date:
-            try:
-                all_titles, id_to_name, _ = self.parser.read_all_titles_for_date(
-                    date=current_date,
-                    platform_ids=platforms
-                )
-
-                # 搜索包含关键词的标题
-                for platform_id, titles in all_titles.items():
-                    platform_name = id_to_name.get(platform_id, platform_id)
-
-                    for title, info in titles.items():
-                        if keyword.lower() in title.lower():
-                            # 计算平均排名
-                            avg_rank = sum(info["ranks"]) / len(info["ranks"]) if info["ranks"] else 0
-
-                            results.append({
-                                "title": title,
-                                "platform": platform_id,
-                                "platform_name": platform_name,
-                                "ranks": info["ranks"],
-                                "count": len(info["ranks"]),
-                                "avg_rank": round(avg_rank, 2),
-                                "url": info.get("url", ""),
-                                "mobileUrl": info.get("mobileUrl", ""),
-                                "date": current_date.strftime("%Y-%m-%d")
-                            })
-
-                            platform_distribution[platform_id] += 1
-
-            except DataNotFoundError:
-                # 该日期没有数据,继续下一天
-                pass
+        for item in self.history.search_titles(keyword, start_date, end_date, platforms):
+            ranks = item["ranks"]
+            # 计算平均排名
+            avg_rank = sum(ranks) / len(ranks) if ranks else 0
+
+            results.append({
+                "title": item["title"],
+                "platform": item["platform_id"],
+                "platform_name": item["platform_name"],
+                "ranks": ranks,
+                "count": len(ranks),
+                "avg_rank": round(avg_rank, 2),
+                "url": item["url"],
+                "mobileUrl": item["mobileUrl"],
+                "date": item["date"]
+            })
 
-            # 下一天
-            current_date += timedelta(days=1)
+            platform_distribution[item["platform_id"]] += 1
 
         if not results:
             raise DataNotFoundError(
@@ -305,10 +348,14 @@ class DataService:
         """
         # 尝试从缓存获取
         cache_key = f"trending_topics:{top_n}:{mode}"
-        cached = self.cache.get(cache_key, ttl=1800)  # 30分钟缓存
-        if cached:
-            return cached
+        ttl = today_cache_ttl(1800)  # 30分钟缓存，快照监听生效时延长
+        return self._get_cached(
+            cache_key, ttl,
+            lambda: self._load_trending_topics(top_n, mode)
+        )
 
+    def _load_trending_topics(self, top_n: int, mode: str) -> Dict:
+        """统计今天数据中的关注词频率（不经过缓存）"""
         # 读取今天的数据
         all_titles, id_to_name, timestamps = self.parser.read_all_titles_for_date()
 
@@ -395,9 +442,6 @@ class DataService:
             "description": self._get_mode_description(mode)
         }
 
-        # 缓存结果
-        self.cache.set(cache_key, result)
-
         return result
 
     def _get_mode_description(self, mode: str) -> str:
@@ -491,10 +535,29 @@ class DataService:
             result = {}
 
         # 缓存结果
-        self.cache.set(cache_key, result)
+        self.cache.set(cache_key, result, ttl=3600)
 
         return result
 
+    def get_topic_titles_by_date(
+        self,
+        topic: str,
+        start_date: datetime,
+        end_date: datetime
+    ) -> Dict[str, List[str]]:
+        """
+        按日期获取包含话题的标题（所有平台）
+
+        Args:
+            topic: 话题关键词
+            start_date: 开始日期
+            end_date: 结束日期
+
+        Returns:
+            {YYYY-MM-DD: [匹配标题, ...]}，没有匹配的日期不出现
+        """
+        return self.history.titles_by_date(topic, start_date, end_date)
+
     def get_available_date_range(self) -> Tuple[Optional[datetime], Optional[datetime]]:
         """
         扫描 output 目录，返回实际可用的日期范围
@@ -600,5 +663,6 @@ class DataService:
                 "latest_record": latest_record.strftime("%Y-%m-%d") if latest_record else None,
             },
             "cache": self.cache.get_stats(),
+            "http": get_http_service().get_pool_stats(),
             "health": "healthy"
         }
@@ -0,0 +1,393 @@
+"""
+历史数据存储服务
+
+将 output/ 下的 txt 快照增量导入嵌入式 SQLite 数据库（output/.mcp/history.db），
+按日期、平台建立索引，并使用 FTS5 trigram 全文索引支持关键词子串检索，
+使跨多天的查询变为一次索引查询而不是逐日解析文件。
+
+txt 快照仍是权威数据：每次查询前按文件名、mtime、大小核对，
+新增快照增量导入，文件被修改或删除时整天重建。
+"""
+
+import json
+import sqlite3
+from datetime import datetime, timedelta
+from pathlib import Path
+from threading import RLock
+from typing import Dict, List, Optional
+
+from .parser_service import ParserService
+
+
+SCHEMA_VERSION = "1"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+CREATE TABLE IF NOT EXISTS snapshots (
+    date TEXT NOT NULL,
+    file_name TEXT NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    PRIMARY KEY (date, file_name)
+);
+CREATE TABLE IF NOT EXISTS platforms (
+    date TEXT NOT NULL,
+    platform_id TEXT NOT NULL,
+    name TEXT NOT NULL,
+    seq INTEGER NOT NULL,
+    PRIMARY KEY (date, platform_id)
+);
+CREATE TABLE IF NOT EXISTS news (
+    id INTEGER PRIMARY KEY,
+    date TEXT NOT NULL,
+    platform_id TEXT NOT NULL,
+    platform_seq INTEGER NOT NULL,
+    title TEXT NOT NULL,
+    url TEXT NOT NULL,
+    mobile_url TEXT NOT NULL,
+    ranks TEXT NOT NULL,
+    first_time TEXT NOT NULL,
+    last_time TEXT NOT NULL,
+    UNIQUE (date, platform_id, title)
+);
+CREATE INDEX IF NOT EXISTS idx_news_date ON news (date, platform_seq, id);
+"""
+
+FTS_SCHEMA = """
+CREATE VIRTUAL TABLE IF NOT EXISTS news_fts USING fts5(
+    title, content='news', content_rowid='id', tokenize='trigram'
+);
+CREATE TRIGGER IF NOT EXISTS news_fts_insert AFTER INSERT ON news BEGIN
+    INSERT INTO news_fts (rowid, title) VALUES (new.id, new.title);
+END;
+CREATE TRIGGER IF NOT EXISTS news_fts_delete AFTER DELETE ON news BEGIN
+    INSERT INTO news_fts (news_fts, rowid, title) VALUES ('delete', old.id, old.title);
+END;
+"""
+
+# trigram 分词器要求查询串至少 3 个字符
+FTS_MIN_QUERY_LENGTH = 3
+
+
+class HistoryStore:
+    """历史数据存储类"""
+
+    def __init__(self, project_root: Path, parser: Optional[ParserService] = None):
+        """
+        初始化历史数据存储
+
+        Args:
+            project_root: 项目根目录
+            parser: 解析服务，用于读取 txt 快照
+        """
+        self.project_root = Path(project_root)
+        self.parser = parser or ParserService(str(self.project_root))
+        self.db_path = self.project_root / "output" / ".mcp" / "history.db"
+        self._lock = RLock()
+        self._synced_files = {}
+        self._conn = None
+        self.fts_enabled = False
+
+    def _connect(self) -> sqlite3.Connection:
+        """打开数据库连接并初始化表结构（首次调用时）"""
+        if self._conn is not None:
+            return self._conn
+
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+
+        version = None
+        try:
+            row = conn.execute("SELECT value FROM meta WHERE key = 'schema_version'").fetchone()
+            version = row[0] if row else None
+        except sqlite3.OperationalError:
+            pass
+
+        if version != SCHEMA_VERSION:
+            for table in ("news_fts", "news", "platforms", "snapshots", "meta"):
+                conn.execute(f"DROP TABLE IF EXISTS {table}")
+
+        conn.executescript(SCHEMA)
+        try:
+            conn.executescript(FTS_SCHEMA)
+            self.fts_enabled = True
+        except sqlite3.OperationalError:
+            # SQLite 未编译 FTS5/trigram 时退化为按日期范围扫描
+            self.fts_enabled = False
+
+        conn.execute(
+            "INSERT OR REPLACE INTO meta (key, value) VALUES ('schema_version', ?)",
+            (SCHEMA_VERSION,)
+        )
+        conn.commit()
+        self._conn = conn
+        return conn
+
+    @staticmethod
+    def iter_dates(start_date: datetime, end_date: datetime) -> List[datetime]:
+        """按天展开日期范围（与各工具逐日遍历的方式一致）"""
+        dates = []
+        current_date = start_date
+        while current_date <= end_date:
+            dates.append(current_date)
+            current_date += timedelta(days=1)
+        return dates
+
+    def sync_date(self, date: datetime) -> None:
+        """
+        将指定日期的 txt 快照同步到数据库
+
+        Args:
+            date: 日期对象
+        """
+        date_key = date.strftime("%Y-%m-%d")
+        txt_dir = self.project_root / "output" / self.parser.get_date_folder_name(date) / "txt"
+
+        with self._lock:
+            conn = self._connect()
+
+            # 逐文件核对 (文件名, mtime, 大小)：原地改写的文件不会改变目录 mtime
+            current_files = []
+            if txt_dir.is_dir():
+                current_files = [item[:3] for item in self.parser.list_txt_files(txt_dir)]
+
+            # 与上次同步时一致则无需查询数据库
+            if self._synced_files.get(date_key) == current_files:
+                return
+
+            stored_files = [
+                tuple(row) for row in conn.execute(
+                    "SELECT file_name, mtime_ns, size FROM snapshots WHERE date = ? ORDER BY file_name",
+                    (date_key,)
+                )
+            ]
+
+            if stored_files != current_files:
+                if current_files[:len(stored_files)] == stored_files:
+                    new_files = current_files[len(stored_files):]
+                else:
+                    self._delete_date(conn, date_key)
+                    new_files = current_files
+
+                self._ingest_files(conn, date_key, txt_dir, new_files)
+                conn.commit()
+
+            self._synced_files[date_key] = current_files
+
+    def _delete_date(self, conn: sqlite3.Connection, date_key: str) -> None:
+        """删除某天的全部数据"""
+        conn.execute("DELETE FROM news WHERE date = ?", (date_key,))
+        conn.execute("DELETE FROM platforms WHERE date = ?", (date_key,))
+        conn.execute("DELETE FROM snapshots WHERE date = ?", (date_key,))
+
+    def _ingest_files(
+        self,
+        conn: sqlite3.Connection,
+        date_key: str,
+        txt_dir: Path,
+        files: List[tuple]
+    ) -> None:
+        """按时间顺序导入快照，合并规则与 ParserService.read_all_titles_for_date 相同"""
+        existing = {}
+        for row_id, platform_id, title, ranks, last_time in conn.execute(
+            "SELECT id, platform_id, title, ranks, last_time FROM news WHERE date = ?",
+            (date_key,)
+        ):
+            existing[(platform_id, title)] = [row_id, json.loads(ranks), last_time, False]
+
+        platform_seq = {}
+        platform_names = {}
+        for platform_id, name, seq in conn.execute(
+            "SELECT platform_id, name, seq FROM platforms WHERE date = ?",
+            (date_key,)
+        ):
+            platform_seq[platform_id] = seq
+            platform_names[platform_id] = name
+
+        for file_name, mtime_ns, size in files:
+            conn.execute(
+                "INSERT OR REPLACE INTO snapshots (date, file_name, mtime_ns, size) VALUES (?, ?, ?, ?)",
+                (date_key, file_name, mtime_ns, size)
+            )
+
+            try:
+                titles_by_id, id_to_name = self.parser.parse_txt_file(txt_dir / file_name)
+            except Exception as e:
+                # 与逐日读取一致：忽略无法解析的文件
+                print(f"Warning: 解析文件 {txt_dir / file_name} 失败: {e}")
+                continue
+
+            platform_names.update(id_to_name)
+            time_info = Path(file_name).stem
+
+            for platform_id, titles in titles_by_id.items():
+                if platform_id not in platform_seq:
+                    platform_seq[platform_id] = len(platform_seq)
+
+                for title, info in titles.items():
+                    entry = existing.get((platform_id, title))
+                    if entry is not None:
+                        entry[1].extend(info["ranks"])
+                        entry[2] = time_info
+                        entry[3] = True
+                        continue
+
+                    cursor = conn.execute(
+                        """
+                        INSERT INTO news (date, platform_id, platform_seq, title, url,
+                                          mobile_url, ranks, first_time, last_time)
+                        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                        """,
+                        (
+                            date_key, platform_id, platform_seq[platform_id], title,
+                            info.get("url", ""), info.get("mobileUrl", ""),
+                            json.dumps(info["ranks"]), time_info, time_info
+                        )
+                    )
+                    existing[(platform_id, title)] = [
+                        cursor.lastrowid, list(info["ranks"]), time_info, False
+                    ]
+
+        conn.executemany(
+            "UPDATE news SET ranks = ?, last_time = ? WHERE id = ?",
+            [
+                (json.dumps(ranks), last_time, row_id)
+                for row_id, ranks, last_time, dirty in existing.values()
+                if dirty
+            ]
+        )
+        conn.executemany(
+            "INSERT OR REPLACE INTO platforms (date, platform_id, name, seq) VALUES (?, ?, ?, ?)",
+            [
+                (date_key, platform_id, platform_names.get(platform_id, platform_id), seq)
+                for platform_id, seq in platform_seq.items()
+            ]
+        )
+
+    def search_titles(
+        self,
+        keyword: str,
+        start_date: datetime,
+        end_date: datetime,
+        platforms: Optional[List[str]] = None
+    ) -> List[Dict]:
+        """
+        在日期范围内检索包含关键词的标题（忽略大小写的子串匹配）
+
+        Args:
+            keyword: 关键词
+            start_date: 开始日期
+            end_date: 结束日期
+            platforms: 平台过滤列表，None 表示所有平台
+
+        Returns:
+            按日期、平台首次出现顺序、标题首次出现顺序排列的结果列表，
+            每项包含 date/platform_id/platform_name/title/ranks/url/mobileUrl
+        """
+        dates = self.iter_dates(start_date, end_date)
+        if not dates:
+            return []
+
+        date_keys = [date.strftime("%Y-%m-%d") for date in dates]
+        for date in dates:
+            self.sync_date(date)
+
+        columns = """
+            n.date, n.platform_id, COALESCE(p.name, n.platform_id), n.title,
+            n.ranks, n.url, n.mobile_url
+        """
+        join = "LEFT JOIN platforms p ON p.date = n.date AND p.platform_id = n.platform_id"
+        placeholders = ",".join("?" * len(date_keys))
+
+        with self._lock:
+            conn = self._connect()
+            if self.fts_enabled and len(keyword) >= FTS_MIN_QUERY_LENGTH:
+                query = '"' + keyword.replace('"', '""') + '"'
+                rows = conn.execute(
+                    f"""
+                    SELECT {columns}
+                    FROM news_fts f JOIN news n ON n.id = f.rowid {join}
+                    WHERE news_fts MATCH ? AND n.date IN ({placeholders})
+                    ORDER BY n.date, n.platform_seq, n.id
+                    """,
+                    [query] + date_keys
+                ).fetchall()
+            else:
+                rows = conn.execute(
+                    f"""
+                    SELECT {columns}
+                    FROM news n {join}
+                    WHERE n.date IN ({placeholders})
+                    ORDER BY n.date, n.platform_seq, n.id
+                    """,
+                    date_keys
+                ).fetchall()
+
+        keyword_lower = keyword.lower()
+        results = []
+        for date_key, platform_id, platform_name, title, ranks, url, mobile_url in rows:
+            # 候选结果统一按 Python 的小写子串语义复核，保证与逐日扫描一致
+            if keyword_lower not in title.lower():
+                continue
+            if platforms and platform_id not in platforms:
+                continue
+            results.append({
+                "date": date_key,
+                "platform_id": platform_id,
+                "platform_name": platform_name,
+                "title": title,
+                "ranks": json.loads(ranks),
+                "url": url,
+                "mobileUrl": mobile_url
+            })
+        return results
+
+    def titles_by_date(
+        self,
+        keyword: str,
+        start_date: datetime,
+        end_date: datetime
+    ) -> Dict[str, List[str]]:
+        """
+        按日期分组获取包含关键词的标题
+
+        Args:
+            keyword: 关键词
+            start_date: 开始日期
+            end_date: 结束日期
+
+        Returns:
+            {YYYY-MM-DD: [匹配标题, ...]}，没有匹配的日期不出现
+        """
+        matches = {}
+        for item in self.search_titles(keyword, start_date, end_date):
+            matches.setdefault(item["date"], []).append(item["title"])
+        return matches
+
+
+# 按数据库路径共享的存储实例
+_stores = {}
+_stores_lock = RLock()
+
+
+def get_history_store(project_root: Path, parser: Optional[ParserService] = None) -> HistoryStore:
+    """
+    获取项目对应的共享历史存储实例
+
+    Args:
+        project_root: 项目根目录
+        parser: 解析服务（首次创建时使用）
+
+    Returns:
+        历史数据存储实例
+    """
+    key = str(Path(project_root).resolve())
+    with _stores_lock:
+        if key not in _stores:
+            _stores[key] = HistoryStore(Path(project_root), parser)
+        return _stores[key]
@@ -0,0 +1,136 @@
+"""
+HTTP 会话服务
+
+提供进程内共享的 requests.Session，复用连接池与 keep-alive 连接，
+并按主机统计请求情况用于诊断。
+"""
+
+import time
+from threading import Lock
+from typing import Dict, Optional
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+
+
+class HttpService:
+    """共享 HTTP 会话服务类"""
+
+    def __init__(self, pool_size: int = 10, timeout: float = 10):
+        """
+        初始化 HTTP 会话
+
+        Args:
+            pool_size: 每个主机的连接池大小
+            timeout: 默认请求超时（秒）
+        """
+        self.timeout = timeout
+        self.session = requests.Session()
+        self.adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session.mount("http://", self.adapter)
+        self.session.mount("https://", self.adapter)
+
+        self._stats = {}
+        self._lock = Lock()
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        proxy_url: Optional[str] = None,
+        **kwargs
+    ) -> requests.Response:
+        """
+        发送请求
+
+        Args:
+            method: 请求方法
+            url: 请求地址
+            proxy_url: 代理地址，为空则不使用代理
+            **kwargs: 透传给 requests 的参数，未指定 timeout 时使用默认超时
+
+        Returns:
+            响应对象
+        """
+        kwargs.setdefault("timeout", self.timeout)
+        if proxy_url:
+            kwargs.setdefault("proxies", {"http": proxy_url, "https": proxy_url})
+
+        host = urlparse(url).hostname or ""
+        start_time = time.monotonic()
+        try:
+            response = self.session.request(method, url, **kwargs)
+        except Exception:
+            self._record(host, time.monotonic() - start_time, failed=True)
+            raise
+        self._record(host, time.monotonic() - start_time, failed=False)
+        return response
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        """发送 GET 请求"""
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url: str, **kwargs) -> requests.Response:
+        """发送 POST 请求"""
+        return self.request("POST", url, **kwargs)
+
+    def _record(self, host: str, elapsed: float, failed: bool) -> None:
+        """记录单次请求统计"""
+        with self._lock:
+            stats = self._stats.setdefault(
+                host, {"requests": 0, "failures": 0, "total_time": 0.0}
+            )
+            stats["requests"] += 1
+            stats["total_time"] += elapsed
+            if failed:
+                stats["failures"] += 1
+
+    def get_pool_stats(self) -> Dict[str, Dict]:
+        """
+        获取各主机的连接池统计
+
+        Returns:
+            {host: {requests, failures, avg_ms, connections}}，
+            connections 为实际新建的连接数，远小于 requests 说明连接被复用
+        """
+        connections = {}
+        pools = self.adapter.poolmanager.pools
+        for pool_key in pools.keys():
+            pool = pools.get(pool_key)
+            if pool is None:
+                continue
+            connections[pool_key.key_host] = (
+                connections.get(pool_key.key_host, 0) + pool.num_connections
+            )
+
+        with self._lock:
+            return {
+                host: {
+                    "requests": stats["requests"],
+                    "failures": stats["failures"],
+                    "avg_ms": round(stats["total_time"] / stats["requests"] * 1000, 1),
+                    "connections": connections.get(host, 0)
+                }
+                for host, stats in self._stats.items()
+            }
+
+
+# 全局 HTTP 会话实例
+_global_http = None
+_global_http_lock = Lock()
+
+
+def get_http_service() -> HttpService:
+    """
+    获取全局 HTTP 会话实例
+
+    Returns:
+        全局 HTTP 会话服务实例
+    """
+    global _global_http
+    if _global_http is None:
+        with _global_http_lock:
+            if _global_http is None:
+                _global_http = HttpService()
+    return _global_http
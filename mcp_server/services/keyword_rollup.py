@@ -0,0 +1,290 @@
+"""
+每日关键词统计汇总服务
+
+对某一天的全部标题（所有平台）分词一次，预先计算并持久化以下统计表：
+
+- 每个标题的关键词列表（标题编号即 all_titles 的遍历顺序）
+- 当日关键词计数、各平台关键词计数
+- 关键词 -> 标题编号的倒排表
+- 同一标题内关键词两两共现计数
+
+汇总结果保存在 output/.mcp/rollups/<日期文件夹>.json，记录 txt 快照的 (文件名, mtime, 大小)
+与分词器版本，任一变化即失效。当天有新快照时只对新出现的标题分词，其余标题沿用已有结果。
+
+各计数表按关键词首次出现的顺序保存，还原出的 Counter 与逐条 update 得到的完全一致
+（包括 most_common 在计数相同时的先后顺序）。
+"""
+
+import json
+import os
+from collections import Counter
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+from .cache_service import estimate_size, get_cache
+from .parser_service import ParserService
+from .singleflight import single_flight
+
+
+# 汇总文件格式版本，统计口径变化时递增
+ROLLUP_VERSION = "1"
+
+
+class KeywordRollup:
+    """单日关键词统计表"""
+
+    def __init__(
+        self,
+        titles: List[str],
+        platform_spans: List[Tuple[str, int, int]],
+        title_keywords: List[List[str]]
+    ):
+        """
+        根据每个标题的关键词计算各统计表
+
+        Args:
+            titles: 标题列表（按 all_titles 遍历顺序，跨平台重复的标题会出现多次）
+            platform_spans: [(platform_id, 起始编号, 结束编号)]
+            title_keywords: 每个标题的关键词列表
+        """
+        self.titles = titles
+        self.platform_spans = platform_spans
+        self.title_keywords = title_keywords
+
+        self.keyword_counts = Counter()
+        self.postings = {}
+        self.cooccurrence = Counter()
+
+        for title_id, keywords in enumerate(title_keywords):
+            self.keyword_counts.update(keywords)
+
+            for kw in keywords:
+                posting = self.postings.get(kw)
+                if posting is None:
+                    self.postings[kw] = [title_id]
+                else:
+                    posting.append(title_id)
+
+            # 计算两两共现（统一排序，避免重复）
+            if len(keywords) >= 2:
+                for i, kw1 in enumerate(keywords):
+                    for kw2 in keywords[i + 1:]:
+                        pair = (kw1, kw2) if kw1 <= kw2 else (kw2, kw1)
+                        self.cooccurrence[pair] += 1
+
+        self.platform_keyword_counts = {}
+        for platform_id, start, end in platform_spans:
+            counts = self.platform_keyword_counts.setdefault(platform_id, Counter())
+            for keywords in title_keywords[start:end]:
+                counts.update(keywords)
+
+        # 内存中关联的原始数据（不持久化），用于判断是否需要刷新
+        self.source = None
+        self.signature = None
+        self.tokenizer_version = None
+
+    def keyword_titles(self, keyword: str) -> List[str]:
+        """
+        包含关键词的标题（按出现顺序，关键词在标题中出现几次就重复几次）
+
+        Args:
+            keyword: 关键词
+
+        Returns:
+            标题列表
+        """
+        return [self.titles[title_id] for title_id in self.postings.get(keyword, ())]
+
+    def titles_with_both(self, kw1: str, kw2: str) -> List[str]:
+        """
+        同时包含两个关键词的标题（按 kw1 的倒排顺序）
+
+        Args:
+            kw1: 关键词1
+            kw2: 关键词2
+
+        Returns:
+            标题列表
+        """
+        other = set(self.postings.get(kw2, ()))
+        return [
+            self.titles[title_id]
+            for title_id in self.postings.get(kw1, ())
+            if title_id in other
+        ]
+
+    def to_dict(self) -> Dict:
+        """转换为可持久化的字典"""
+        return {
+            "version": ROLLUP_VERSION,
+            "tokenizer_version": self.tokenizer_version,
+            "signature": self.signature,
+            "titles": self.titles,
+            "platform_spans": self.platform_spans,
+            "title_keywords": self.title_keywords,
+            "keyword_counts": list(self.keyword_counts.items()),
+            "platform_keyword_counts": {
+                platform_id: list(counts.items())
+                for platform_id, counts in self.platform_keyword_counts.items()
+            },
+            "postings": self.postings,
+            "cooccurrence": [[kw1, kw2, count] for (kw1, kw2), count in self.cooccurrence.items()]
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "KeywordRollup":
+        """从持久化的字典还原（直接读取预先计算的统计表）"""
+        rollup = cls.__new__(cls)
+        rollup.titles = data["titles"]
+        rollup.platform_spans = [tuple(span) for span in data["platform_spans"]]
+        rollup.title_keywords = data["title_keywords"]
+        rollup.keyword_counts = Counter(dict(data["keyword_counts"]))
+        rollup.platform_keyword_counts = {
+            platform_id: Counter(dict(counts))
+            for platform_id, counts in data["platform_keyword_counts"].items()
+        }
+        rollup.postings = data["postings"]
+        rollup.cooccurrence = Counter({(kw1, kw2): count for kw1, kw2, count in data["cooccurrence"]})
+        rollup.source = None
+        rollup.signature = data["signature"]
+        rollup.tokenizer_version = data["tokenizer_version"]
+        return rollup
+
+
+def _rollup_path(parser: ParserService, date_folder: str) -> Path:
+    """汇总文件路径"""
+    return parser.project_root / "output" / ".mcp" / "rollups" / f"{date_folder}.json"
+
+
+def _load_rollup(path: Path) -> Optional[KeywordRollup]:
+    """读取汇总文件，不存在或格式不符时返回 None"""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        if data.get("version") != ROLLUP_VERSION:
+            return None
+        return KeywordRollup.from_dict(data)
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+
+def _save_rollup(path: Path, rollup: KeywordRollup) -> None:
+    """写入汇总文件（先写临时文件再替换，避免读到半个文件）"""
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(rollup.to_dict(), f, ensure_ascii=False, separators=(",", ":"))
+        os.replace(tmp_path, path)
+    except OSError as e:
+        # 持久化失败不影响本次结果
+        print(f"Warning: 写入关键词汇总 {path} 失败: {e}")
+
+
+def build_rollup(
+    all_titles: Dict,
+    tokenize: Callable[[str], List[str]],
+    known: Optional[Dict[str, List[str]]] = None
+) -> KeywordRollup:
+    """
+    对一天的标题分词并计算统计表
+
+    Args:
+        all_titles: {platform_id: {title: info}}
+        tokenize: 分词函数
+        known: 已知标题的分词结果 {title: keywords}，命中的标题不再重复分词
+
+    Returns:
+        关键词统计表
+    """
+    known = dict(known or {})
+    titles = []
+    platform_spans = []
+    title_keywords = []
+
+    for platform_id, platform_titles in all_titles.items():
+        start = len(titles)
+        for title in platform_titles.keys():
+            keywords = known.get(title)
+            if keywords is None:
+                keywords = tokenize(title)
+                known[title] = keywords
+            titles.append(title)
+            title_keywords.append(keywords)
+        platform_spans.append((platform_id, start, len(titles)))
+
+    return KeywordRollup(titles, platform_spans, title_keywords)
+
+
+def get_keyword_rollup(
+    parser: ParserService,
+    date: Optional[datetime],
+    tokenize: Callable[[str], List[str]],
+    tokenizer_version: str,
+    ttl: int = 3600
+) -> KeywordRollup:
+    """
+    获取某天（所有平台）的关键词统计表
+
+    依次尝试：内存缓存（原始数据未变）-> 汇总文件（快照与分词器版本一致）-> 重新计算。
+    重新计算时沿用旧汇总中已有标题的分词结果，只对新标题分词，并写回汇总文件。
+
+    Args:
+        parser: 解析服务
+        date: 日期，None 表示今天
+        tokenize: 分词函数
+        tokenizer_version: 分词器版本，分词逻辑变化时必须修改
+        ttl: 内存缓存时间（秒）
+
+    Returns:
+        关键词统计表
+
+    Raises:
+        DataNotFoundError: 该日期没有数据
+    """
+    date_folder = parser.get_date_folder_name(date)
+    cache = get_cache()
+    cache_key = f"keyword_rollup:{date_folder}"
+
+    # 读取数据前后各取一次快照签名，两者不一致说明期间有新快照，本次结果不与签名关联
+    txt_dir = parser.project_root / "output" / date_folder / "txt"
+    signature = [list(item[:3]) for item in parser.list_txt_files(txt_dir)]
+    all_titles, _, _ = parser.read_all_titles_for_date(date)
+    if [list(item[:3]) for item in parser.list_txt_files(txt_dir)] != signature:
+        signature = None
+
+    rollup = cache.get(cache_key, ttl=ttl)
+    if rollup is not None and rollup.source is all_titles and rollup.tokenizer_version == tokenizer_version:
+        return rollup
+
+    def compute() -> KeywordRollup:
+        previous = cache.get(cache_key, ttl=ttl)
+        if previous is not None and previous.source is all_titles and previous.tokenizer_version == tokenizer_version:
+            return previous
+
+        path = _rollup_path(parser, date_folder)
+        stored = _load_rollup(path)
+        if stored is not None and stored.tokenizer_version != tokenizer_version:
+            stored = None
+
+        if stored is not None and signature is not None and stored.signature == signature:
+            rollup = stored
+        else:
+            # 沿用已有标题的分词结果（当天新增快照时只需对新标题分词）
+            known = {}
+            for base in (stored, previous):
+                if base is not None and base.tokenizer_version == tokenizer_version:
+                    known.update(zip(base.titles, base.title_keywords))
+
+            rollup = build_rollup(all_titles, tokenize, known)
+            rollup.signature = signature
+            rollup.tokenizer_version = tokenizer_version
+            _save_rollup(path, rollup)
+
+        rollup.source = all_titles
+        # 不计入 source 引用的汇总数据，它已单独缓存在 read_all_titles:* 下
+        cache.set(cache_key, rollup, ttl=ttl, size=estimate_size(rollup, exclude=(all_titles,)))
+        return rollup
+
+    return single_flight(cache_key, compute)
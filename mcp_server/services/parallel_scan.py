@@ -0,0 +1,186 @@
+"""
+按日期并行扫描服务
+
+分析工具按天读取标题数据并统计，各天之间互不依赖。本模块把逐日计算（map）
+分发到进程池中并行执行，按日期顺序返回各天的部分结果，由调用方依次合并（reduce），
+合并顺序与逐日串行执行时相同，因此结果一致。
+
+- 每个工作进程是一个单进程池，按需创建并复用，各自维护解析缓存
+- 同一日期固定分发到同一个工作进程，重复查询时命中该进程已缓存的汇总数据
+- 汇总数据已在当前进程缓存的日期直接在本进程计算，不再分发
+- 有数据目录的待解析天数较少或只有一个 CPU 时退化为串行执行
+
+并发进程数可通过环境变量 MCP_SCAN_WORKERS 设置，设为 1 时始终串行。
+"""
+
+import multiprocessing
+import os
+from concurrent.futures import CancelledError, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from datetime import datetime, timedelta
+from threading import Lock
+from typing import Any, List, Optional, Tuple
+
+from ..utils.errors import DataNotFoundError
+
+
+# 需要解析的天数达到该值时才使用进程池
+PARALLEL_MIN_DAYS = 3
+
+# 默认最大进程数
+DEFAULT_MAX_WORKERS = 8
+
+# 工作进程列表（每个都是单进程池），日期按序号取模固定分配
+_pools = []
+_pool_lock = Lock()
+
+# 工作进程内的工具实例：(工具类, 项目根目录) -> 实例
+_worker_tools = {}
+
+
+def get_scan_workers() -> int:
+    """
+    获取并行扫描的进程数
+
+    Returns:
+        进程数，1 表示串行
+    """
+    value = os.environ.get("MCP_SCAN_WORKERS")
+    if value is not None:
+        return max(1, int(value))
+    return max(1, min(os.cpu_count() or 1, DEFAULT_MAX_WORKERS))
+
+
+def _get_pool(date: datetime, workers: int) -> ProcessPoolExecutor:
+    """获取负责该日期的工作进程（懒加载）"""
+    global _pools
+    with _pool_lock:
+        if len(_pools) != workers:
+            for pool in _pools:
+                pool.shutdown(wait=False, cancel_futures=True)
+            # 服务进程中有其他线程在运行，不使用 fork 启动工作进程
+            methods = multiprocessing.get_all_start_methods()
+            context = multiprocessing.get_context("forkserver" if "forkserver" in methods else "spawn")
+            _pools = [ProcessPoolExecutor(max_workers=1, mp_context=context) for _ in range(workers)]
+        return _pools[date.toordinal() % workers]
+
+
+def _reset_pool() -> None:
+    """丢弃已损坏的工作进程"""
+    global _pools
+    with _pool_lock:
+        for pool in _pools:
+            pool.shutdown(wait=False, cancel_futures=True)
+        _pools = []
+
+
+def _scan_day(
+    tools: Any,
+    date: datetime,
+    day_method: str,
+    args: tuple,
+    platform_ids: Optional[List[str]]
+) -> Tuple[bool, Any]:
+    """
+    读取某天数据并执行逐日计算
+
+    Returns:
+        (是否有数据, 部分结果)
+    """
+    try:
+        all_titles, id_to_name, timestamps = tools.data_service.parser.read_all_titles_for_date(
+            date=date,
+            platform_ids=platform_ids
+        )
+        return True, getattr(tools, day_method)(date, all_titles, id_to_name, timestamps, *args)
+    except DataNotFoundError:
+        return False, None
+
+
+def _scan_day_in_worker(
+    tools_class: type,
+    project_root: str,
+    date: datetime,
+    day_method: str,
+    args: tuple,
+    platform_ids: Optional[List[str]]
+) -> Tuple[bool, Any]:
+    """工作进程入口：复用本进程的工具实例后执行逐日计算"""
+    key = (tools_class, project_root)
+    tools = _worker_tools.get(key)
+    if tools is None:
+        tools = tools_class(project_root)
+        _worker_tools[key] = tools
+    return _scan_day(tools, date, day_method, args, platform_ids)
+
+
+def scan_dates(
+    tools: Any,
+    start_date: datetime,
+    end_date: datetime,
+    day_method: str,
+    *args,
+    platform_ids: Optional[List[str]] = None
+) -> List[Tuple[datetime, Any]]:
+    """
+    对日期范围内的每一天执行 tools.<day_method>(date, all_titles, id_to_name, timestamps, *args)
+
+    day_method 的参数和返回值需可被 pickle，且只能依赖 tools 的构造参数（project_root），
+    工作进程中会以 type(tools)(project_root) 重新创建工具实例。
+
+    Args:
+        tools: 工具实例（需有 data_service 属性）
+        start_date: 开始日期
+        end_date: 结束日期（包含）
+        day_method: 逐日计算的方法名
+        *args: 传给逐日计算的额外参数
+        platform_ids: 平台ID列表，None表示所有平台
+
+    Returns:
+        [(日期, 部分结果)]，按日期升序，没有数据的日期不包含在内
+    """
+    dates = []
+    current_date = start_date
+    while current_date <= end_date:
+        dates.append(current_date)
+        current_date += timedelta(days=1)
+
+    parser = tools.data_service.parser
+    workers = get_scan_workers()
+    pending = [] if workers <= 1 else [
+        date for date in dates
+        if (parser.project_root / "output" / parser.get_date_folder_name(date) / "txt").is_dir()
+        and not parser.has_cached_titles(date, platform_ids)
+    ]
+
+    futures = {}
+    if len(pending) >= PARALLEL_MIN_DAYS:
+        project_root = str(parser.project_root)
+        try:
+            for date in pending:
+                futures[date] = _get_pool(date, workers).submit(
+                    _scan_day_in_worker, type(tools), project_root,
+                    date, day_method, args, platform_ids
+                )
+        except (BrokenProcessPool, RuntimeError):
+            _reset_pool()
+            futures = {}
+
+    results = []
+    for date in dates:
+        outcome = None
+        future = futures.get(date)
+        if future is not None:
+            try:
+                outcome = future.result()
+            except (BrokenProcessPool, CancelledError):
+                # 工作进程异常退出（或因此被取消）时在本进程重新计算
+                _reset_pool()
+        if outcome is None:
+            outcome = _scan_day(tools, date, day_method, args, platform_ids)
+
+        found, partial = outcome
+        if found:
+            results.append((date, partial))
+
+    return results
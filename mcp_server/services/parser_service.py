@@ -4,15 +4,27 @@
 提供txt格式新闻数据和YAML配置文件的解析功能。
 """
 
+import gzip
+import json
 import re
+import threading
+from collections import OrderedDict
 from pathlib import Path
-from typing import Dict, List, Tuple, Optional
+from typing import Dict, List, Set, Tuple, Optional
 from datetime import datetime
 
 import yaml
 
 from ..utils.errors import FileParseError, DataNotFoundError
 from .cache_service import get_cache
+from .singleflight import single_flight
+
+
+# 当日汇总数据的缓存时间（秒）；是否过期由文件 mtime/大小判断，TTL 只用于释放内存
+PARSE_CACHE_TTL = 3600
+
+# 单个文件解析结果最多保留的文件数（约为一天的快照数），与全局缓存分开存放，不挤占汇总数据
+PARSED_FILE_CACHE_SIZE = 64
 
 
 class ParserService:
@@ -35,6 +47,10 @@ class ParserService:
         # 初始化缓存服务
         self.cache = get_cache()
 
+        # 单个文件的解析结果：路径 -> ((mtime_ns, 大小), 解析结果)，按最近使用顺序淘汰
+        self._parsed_files = OrderedDict()
+        self._parsed_files_lock = threading.Lock()
+
     @staticmethod
     def clean_title(title: str) -> str:
         """
@@ -52,9 +68,49 @@ class ParserService:
         title = title.strip()
         return title
 
+    def parse_compact_snapshot(self, file_path: Path) -> Optional[Tuple[Dict, Dict]]:
+        """
+        读取 txt 旁的紧凑快照（.snap，gzip 压缩的 JSON + 字符串表）
+
+        Args:
+            file_path: txt文件路径
+
+        Returns:
+            与 parse_txt_file 相同的 (titles_by_id, id_to_name)；
+            快照不存在、早于 txt 或无法解析时返回 None
+        """
+        snapshot_path = file_path.with_suffix(".snap")
+        try:
+            if snapshot_path.stat().st_mtime_ns < file_path.stat().st_mtime_ns:
+                return None
+            data = json.loads(gzip.decompress(snapshot_path.read_bytes()))
+            if data.get("version") != 1:
+                return None
+
+            strings = data["strings"]
+            titles_by_id = {}
+            id_to_name = {}
+            for source_index, name_index, items in data["sources"]:
+                if not items:
+                    continue
+
+                platform_id = strings[source_index]
+                id_to_name[platform_id] = strings[name_index]
+                titles = titles_by_id[platform_id] = {}
+                for rank, title_index, url_index, mobile_index in items:
+                    titles[strings[title_index]] = {
+                        "ranks": [rank],
+                        "url": strings[url_index],
+                        "mobileUrl": strings[mobile_index],
+                    }
+            return titles_by_id, id_to_name
+        except Exception:
+            # 快照只是加速手段，任何问题都回退到解析 txt
+            return None
+
     def parse_txt_file(self, file_path: Path) -> Tuple[Dict, Dict]:
         """
-        解析单个txt文件的标题数据
+        解析单个txt文件的标题数据（存在有效的紧凑快照时优先读取快照）
 
         Args:
             file_path: txt文件路径
@@ -70,6 +126,10 @@ class ParserService:
         if not file_path.exists():
             raise FileParseError(str(file_path), "文件不存在")
 
+        snapshot = self.parse_compact_snapshot(file_path)
+        if snapshot is not None:
+            return snapshot
+
         titles_by_id = {}
         id_to_name = {}
 
@@ -143,6 +203,90 @@ class ParserService:
 
         return titles_by_id, id_to_name
 
+    def parse_txt_file_cached(self, file_path: Path) -> Tuple[Dict, Dict]:
+        """
+        解析单个txt文件，结果按 (路径, mtime, 大小) 缓存
+
+        文件未变化时直接返回缓存的解析结果，不同平台过滤条件的汇总共用同一份解析结果。
+        解析结果只保存在本实例中最近使用的 PARSED_FILE_CACHE_SIZE 个文件里，不进入全局缓存。
+        返回的数据与缓存共享，调用方不得修改。
+
+        Args:
+            file_path: txt文件路径
+
+        Returns:
+            与 parse_txt_file 相同的 (titles_by_id, id_to_name)
+
+        Raises:
+            FileParseError: 文件解析错误
+        """
+        try:
+            stat = file_path.stat()
+        except OSError:
+            raise FileParseError(str(file_path), "文件不存在")
+
+        signature = (stat.st_mtime_ns, stat.st_size)
+        cache_key = str(file_path)
+        with self._parsed_files_lock:
+            cached = self._parsed_files.get(cache_key)
+            if cached is not None and cached[0] == signature:
+                self._parsed_files.move_to_end(cache_key)
+                return cached[1]
+
+        def parse():
+            result = self.parse_txt_file(file_path)
+            with self._parsed_files_lock:
+                self._parsed_files[cache_key] = (signature, result)
+                self._parsed_files.move_to_end(cache_key)
+                while len(self._parsed_files) > PARSED_FILE_CACHE_SIZE:
+                    self._parsed_files.popitem(last=False)
+            return result
+
+        return single_flight(f"parsed_file:{id(self)}:{cache_key}:{signature[0]}:{signature[1]}", parse)
+
+    @staticmethod
+    def _merge_file_titles(
+        all_titles: Dict,
+        titles_by_id: Dict,
+        platform_ids: Optional[List[str]],
+        owned: Set[int]
+    ) -> None:
+        """
+        将单个文件的标题合并进汇总数据（写时复制）
+
+        汇总数据可能已返回给调用方，只能原地修改本次新建的字典（id 记录在 owned 中），
+        其余平台字典和标题条目一律复制后替换；文件解析结果同样不会被修改。
+
+        Args:
+            all_titles: 汇总数据 {platform_id: {title: info}}
+            titles_by_id: 单个文件的解析结果
+            platform_ids: 平台过滤，None 表示全部
+            owned: 本次更新中新建的字典 id
+        """
+        for platform_id, titles in titles_by_id.items():
+            # 如果指定了平台过滤
+            if platform_ids and platform_id not in platform_ids:
+                continue
+
+            platform_titles = all_titles.get(platform_id)
+            if platform_titles is None or id(platform_titles) not in owned:
+                platform_titles = dict(platform_titles or {})
+                owned.add(id(platform_titles))
+                all_titles[platform_id] = platform_titles
+
+            for title, info in titles.items():
+                existing = platform_titles.get(title)
+                if existing is None:
+                    entry = {**info, "ranks": list(info["ranks"])}
+                elif id(existing) in owned:
+                    # 合并排名
+                    existing["ranks"].extend(info["ranks"])
+                    continue
+                else:
+                    entry = {**existing, "ranks": existing["ranks"] + info["ranks"]}
+                owned.add(id(entry))
+                platform_titles[title] = entry
+
     def get_date_folder_name(self, date: datetime = None) -> str:
         """
         获取日期文件夹名称
@@ -165,6 +309,12 @@ class ParserService:
         """
         读取指定日期的所有标题文件（带缓存）
 
+        每次调用都会检查txt文件列表及其 mtime/大小：文件未变化时直接返回缓存的汇总；
+        只新增了快照文件时，仅解析新文件并合并到已有汇总上；其他情况重新汇总，
+        未变化的文件复用各自的解析缓存。因此当天新抓取的数据会立即可见。
+
+        返回的数据与缓存共享，调用方不得修改。
+
         Args:
             date: 日期对象，默认为今天
             platform_ids: 平台ID列表，None表示所有平台
@@ -178,23 +328,9 @@ class ParserService:
         Raises:
             DataNotFoundError: 数据不存在
         """
-        # 生成缓存键
-        date_str = self.get_date_folder_name(date)
-        platform_key = ','.join(sorted(platform_ids)) if platform_ids else 'all'
-        cache_key = f"read_all_titles:{date_str}:{platform_key}"
-
-        # 尝试从缓存获取
-        # 对于历史数据（非今天），使用更长的缓存时间（1小时）
-        # 对于今天的数据，使用较短的缓存时间（15分钟），因为可能有新数据
-        is_today = (date is None) or (date.date() == datetime.now().date())
-        ttl = 900 if is_today else 3600  # 15分钟 vs 1小时
-
-        cached = self.cache.get(cache_key, ttl=ttl)
-        if cached:
-            return cached
-
-        # 缓存未命中，读取文件
         date_folder = self.get_date_folder_name(date)
+        cache_key = self._titles_cache_key(date_folder, platform_ids)
+
         txt_dir = self.project_root / "output" / date_folder / "txt"
 
         if not txt_dir.exists():
@@ -203,44 +339,118 @@ class ParserService:
                 suggestion="请先运行爬虫或检查日期是否正确"
             )
 
-        all_titles = {}
-        id_to_name = {}
-        all_timestamps = {}
-
-        # 读取所有txt文件
-        txt_files = sorted(txt_dir.glob("*.txt"))
+        # 读取所有txt文件的 (文件名, mtime, 大小)，用于判断缓存的汇总是否仍然有效
+        files = self.list_txt_files(txt_dir)
 
-        if not txt_files:
+        if not files:
             raise DataNotFoundError(
                 f"{date_folder} 没有数据文件",
                 suggestion="请等待爬虫任务完成"
             )
 
-        for txt_file in txt_files:
+        state = self.cache.get(cache_key, ttl=PARSE_CACHE_TTL)
+        if state is not None and state["files"] == files:
+            return state["result"]
+
+        # 相同的并发请求只汇总一次，其余请求等待并共享结果
+        return single_flight(
+            cache_key,
+            lambda: self._build_titles_for_date(cache_key, txt_dir, date_folder, files, platform_ids)
+        )
+
+    def has_cached_titles(
+        self,
+        date: datetime = None,
+        platform_ids: Optional[List[str]] = None
+    ) -> bool:
+        """
+        指定日期的汇总数据是否已缓存且仍然有效（再次读取无需解析文件）
+
+        Args:
+            date: 日期对象，默认为今天
+            platform_ids: 平台ID列表，None表示所有平台
+
+        Returns:
+            是否命中缓存
+        """
+        date_folder = self.get_date_folder_name(date)
+        state = self.cache.get(self._titles_cache_key(date_folder, platform_ids), ttl=PARSE_CACHE_TTL)
+        if state is None:
+            return False
+        txt_dir = self.project_root / "output" / date_folder / "txt"
+        return state["files"] == self.list_txt_files(txt_dir)
+
+    @staticmethod
+    def _titles_cache_key(date_folder: str, platform_ids: Optional[List[str]]) -> str:
+        """汇总数据的缓存键"""
+        platform_key = ','.join(sorted(platform_ids)) if platform_ids else 'all'
+        return f"read_all_titles:{date_folder}:{platform_key}"
+
+    @staticmethod
+    def list_txt_files(txt_dir: Path) -> List[Tuple]:
+        """按文件名排序列出txt文件的 (文件名, mtime_ns, 大小, mtime)"""
+        files = []
+        for txt_file in sorted(txt_dir.glob("*.txt")):
             try:
-                titles_by_id, file_id_to_name = self.parse_txt_file(txt_file)
+                stat = txt_file.stat()
+            except OSError:
+                continue
+            files.append((txt_file.name, stat.st_mtime_ns, stat.st_size, stat.st_mtime))
+        return files
+
+    def _build_titles_for_date(
+        self,
+        cache_key: str,
+        txt_dir: Path,
+        date_folder: str,
+        files: List[Tuple],
+        platform_ids: Optional[List[str]]
+    ) -> Tuple[Dict, Dict, Dict]:
+        """
+        汇总指定日期的标题数据并写入缓存
+
+        Args:
+            cache_key: 汇总数据的缓存键
+            txt_dir: txt目录
+            date_folder: 日期文件夹名称
+            files: [(文件名, mtime_ns, 大小, mtime)]
+            platform_ids: 平台ID列表，None表示所有平台
+
+        Returns:
+            (all_titles, id_to_name, all_timestamps) 元组
+        """
+        # 等待期间前一次汇总可能刚写入缓存
+        state = self.cache.get(cache_key, ttl=PARSE_CACHE_TTL)
+        if state is not None and state["files"] == files:
+            return state["result"]
+
+        # 已汇总的文件未变化时只合并新增文件，否则重新汇总（未变化的文件仍命中解析缓存）
+        if state is not None and files[:len(state["files"])] == state["files"]:
+            applied = len(state["files"])
+            all_titles, id_to_name, all_timestamps = state["result"]
+            all_titles = dict(all_titles)
+            id_to_name = dict(id_to_name)
+            all_timestamps = dict(all_timestamps)
+        else:
+            applied = 0
+            all_titles = {}
+            id_to_name = {}
+            all_timestamps = {}
+
+        owned = set()
+        for file_name, _, _, mtime in files[applied:]:
+            txt_file = txt_dir / file_name
+            try:
+                titles_by_id, file_id_to_name = self.parse_txt_file_cached(txt_file)
 
                 # 更新id_to_name
                 id_to_name.update(file_id_to_name)
 
                 # 合并标题数据
-                for platform_id, titles in titles_by_id.items():
-                    # 如果指定了平台过滤
-                    if platform_ids and platform_id not in platform_ids:
-                        continue
-
-                    if platform_id not in all_titles:
-                        all_titles[platform_id] = {}
-
-                    for title, info in titles.items():
-                        if title in all_titles[platform_id]:
-                            # 合并排名
-                            all_titles[platform_id][title]["ranks"].extend(info["ranks"])
-                        else:
-                            all_titles[platform_id][title] = info.copy()
+                self._merge_file_titles(all_titles, titles_by_id, platform_ids, owned)
 
                 # 记录文件时间戳
-                all_timestamps[txt_file.name] = txt_file.stat().st_mtime
+                all_timestamps[file_name] = mtime
 
             except Exception as e:
                 # 忽略单个文件的解析错误，继续处理其他文件
@@ -255,7 +465,7 @@ class ParserService:
 
         # 缓存结果
         result = (all_titles, id_to_name, all_timestamps)
-        self.cache.set(cache_key, result)
+        self.cache.set(cache_key, {"files": files, "result": result}, ttl=PARSE_CACHE_TTL)
 
         return result
 
@@ -0,0 +1,128 @@
+"""
+标题倒排索引服务
+
+为某一天解析后的标题数据建立倒排索引（单字符与二元字符组 postings、分词 postings），
+搜索时先用索引筛出候选标题，再对候选逐条精确打分，
+使搜索耗时不再随标题总数线性增长。
+
+索引只做候选筛选，保证是精确结果的超集，最终是否命中仍由调用方原有的判断逻辑决定。
+"""
+
+from typing import Callable, Dict, Iterable, List, Set
+
+from .cache_service import estimate_size, get_cache
+
+
+class TitleSearchIndex:
+    """单日标题倒排索引"""
+
+    def __init__(self, all_titles: Dict, tokenize: Callable[[str], List[str]]):
+        """
+        建立索引
+
+        Args:
+            all_titles: {platform_id: {title: info}}，通常来自 read_all_titles_for_date
+            tokenize: 分词函数，需与调用方计算关键词重合度时使用的函数一致
+        """
+        self.source = all_titles
+        self.tokenize = tokenize
+
+        # 按原始遍历顺序保存 (platform_id, title, info)，候选按编号排序即可还原顺序
+        self.entries = []
+        self.char_postings = {}
+        self.bigram_postings = {}
+        self.token_postings = {}
+
+        for platform_id, titles in all_titles.items():
+            for title, info in titles.items():
+                entry_id = len(self.entries)
+                self.entries.append((platform_id, title, info))
+
+                title_lower = title.lower()
+                for char in set(title_lower):
+                    self.char_postings.setdefault(char, set()).add(entry_id)
+
+                for i in range(len(title_lower) - 1):
+                    self.bigram_postings.setdefault(title_lower[i:i + 2], set()).add(entry_id)
+
+                for token in set(tokenize(title)):
+                    self.token_postings.setdefault(token, set()).add(entry_id)
+
+    def all_candidates(self) -> Set[int]:
+        """返回全部标题编号"""
+        return set(range(len(self.entries)))
+
+    def substring_candidates(self, text_lower: str) -> Set[int]:
+        """
+        筛选小写标题中可能包含 text_lower 的标题
+
+        Args:
+            text_lower: 已转小写的查询串
+
+        Returns:
+            候选标题编号集合
+        """
+        if not text_lower:
+            return self.all_candidates()
+
+        if len(text_lower) == 1:
+            return set(self.char_postings.get(text_lower, ()))
+
+        postings = []
+        for i in range(len(text_lower) - 1):
+            posting = self.bigram_postings.get(text_lower[i:i + 2])
+            if not posting:
+                return set()
+            postings.append(posting)
+
+        postings.sort(key=len)
+        return set(postings[0]).intersection(*postings[1:])
+
+    def token_hits(self, tokens: Iterable[str]) -> Dict[int, int]:
+        """
+        统计每个标题命中的查询词数量（查询词需去重）
+
+        Args:
+            tokens: 查询词
+
+        Returns:
+            {标题编号: 命中词数}
+        """
+        hits = {}
+        for token in tokens:
+            for entry_id in self.token_postings.get(token, ()):
+                hits[entry_id] = hits.get(entry_id, 0) + 1
+        return hits
+
+
+def get_search_index(
+    date_folder: str,
+    all_titles: Dict,
+    tokenize: Callable[[str], List[str]],
+    ttl: int = 3600
+) -> TitleSearchIndex:
+    """
+    获取某天标题数据的倒排索引（与解析结果一同缓存）
+
+    缓存的索引只有在对应的 all_titles 仍是同一个对象、分词函数相同时才会复用，
+    解析数据刷新后会自动重建。
+
+    Args:
+        date_folder: 日期文件夹名称
+        all_titles: 标题数据
+        tokenize: 分词函数
+        ttl: 缓存时间（秒）
+
+    Returns:
+        标题倒排索引
+    """
+    cache = get_cache()
+    cache_key = f"search_index:{date_folder}:{','.join(sorted(all_titles))}"
+
+    index = cache.get(cache_key, ttl=ttl)
+    if index is not None and index.source is all_titles and index.tokenize == tokenize:
+        return index
+
+    index = TitleSearchIndex(all_titles, tokenize)
+    cache.set(cache_key, index, ttl=ttl, size=estimate_size(index, exclude=(all_titles,)))
+    return index
@@ -0,0 +1,163 @@
+"""
+标题相似度服务
+
+标题相似度沿用 difflib.SequenceMatcher(None, a, b).ratio()，取值 0-1，阈值含义不变。
+
+对于一天内的大量标题，预先建立字符 -> {标题编号: 出现次数} 的倒排表。
+ratio = 2M / (len(a) + len(b))，其中匹配字符数 M 不超过两串各字符出现次数取小后的总和，
+据此得到每个标题的相似度上界；只对上界达到阈值的标题调用 SequenceMatcher，
+结果与逐条计算完全一致。
+"""
+
+from collections import Counter
+from difflib import SequenceMatcher
+from typing import Dict, Sequence
+
+from .cache_service import estimate_size, get_cache
+
+
+def text_similarity(text1: str, text2: str, ignore_case: bool = True) -> float:
+    """
+    计算两个文本的相似度
+
+    Args:
+        text1: 文本1
+        text2: 文本2
+        ignore_case: 是否忽略大小写
+
+    Returns:
+        相似度分数（0-1之间）
+    """
+    if ignore_case:
+        text1, text2 = text1.lower(), text2.lower()
+    return SequenceMatcher(None, text1, text2).ratio()
+
+
+class SimilarityIndex:
+    """基于字符计数上界筛选候选的标题相似度索引"""
+
+    def __init__(self, texts: Sequence[str], ignore_case: bool = True):
+        """
+        预计算所有文本的长度与字符倒排表
+
+        Args:
+            texts: 文本列表，查询结果以其下标返回
+            ignore_case: 是否忽略大小写
+        """
+        self.ignore_case = ignore_case
+        self.texts = [text.lower() for text in texts] if ignore_case else list(texts)
+        self.lengths = [len(text) for text in self.texts]
+        self.char_postings = {}
+        for text_id, text in enumerate(self.texts):
+            for char, count in Counter(text).items():
+                self.char_postings.setdefault(char, {})[text_id] = count
+
+    def upper_bounds(self, text: str) -> Dict[int, float]:
+        """
+        计算每个条目与文本的 SequenceMatcher.ratio() 上界
+
+        没有共同字符的条目上界为 0，不出现在结果中。
+
+        Args:
+            text: 查询文本（已按 ignore_case 处理）
+
+        Returns:
+            {下标: 相似度上界}
+        """
+        shared = {}
+        for char, query_count in Counter(text).items():
+            for text_id, count in self.char_postings.get(char, {}).items():
+                shared[text_id] = shared.get(text_id, 0) + min(query_count, count)
+
+        query_length = len(text)
+        return {
+            text_id: 2.0 * common / (query_length + self.lengths[text_id])
+            for text_id, common in shared.items()
+        }
+
+    def query(self, text: str, threshold: float) -> Dict[int, float]:
+        """
+        查找与文本相似度达到阈值的条目
+
+        阈值不大于 0 时对全部条目计算；否则只计算上界达到阈值的条目。
+        结果与对每个条目调用 text_similarity(text, 条目) 后按阈值过滤相同。
+
+        Args:
+            text: 查询文本
+            threshold: 相似度阈值（0-1之间）
+
+        Returns:
+            {下标: 相似度}
+        """
+        if self.ignore_case:
+            text = text.lower()
+
+        if threshold <= 0:
+            candidates = range(len(self.texts))
+        elif not text:
+            # 空查询只可能与空文本完全相同
+            candidates = [text_id for text_id, length in enumerate(self.lengths) if not length]
+        else:
+            candidates = [
+                text_id
+                for text_id, bound in self.upper_bounds(text).items()
+                if bound >= threshold
+            ]
+
+        results = {}
+        for text_id in candidates:
+            score = SequenceMatcher(None, text, self.texts[text_id]).ratio()
+            if score >= threshold:
+                results[text_id] = score
+        return results
+
+
+class TitleSimilarityIndex(SimilarityIndex):
+    """单日标题的相似度索引，条目顺序与 all_titles 的遍历顺序一致"""
+
+    def __init__(self, all_titles: Dict, ignore_case: bool = True):
+        """
+        Args:
+            all_titles: {platform_id: {title: info}}
+            ignore_case: 是否忽略大小写
+        """
+        self.source = all_titles
+        self.entries = [
+            (platform_id, title, info)
+            for platform_id, titles in all_titles.items()
+            for title, info in titles.items()
+        ]
+        super().__init__([title for _, title, _ in self.entries], ignore_case)
+
+
+def get_similarity_index(
+    date_folder: str,
+    all_titles: Dict,
+    ignore_case: bool = True,
+    ttl: int = 3600
+) -> TitleSimilarityIndex:
+    """
+    获取某天标题数据的相似度索引（与解析结果一同缓存）
+
+    缓存的索引只有在对应的 all_titles 仍是同一个对象时才会复用。
+
+    Args:
+        date_folder: 日期文件夹名称
+        all_titles: 标题数据
+        ignore_case: 是否忽略大小写
+        ttl: 缓存时间（秒）
+
+    Returns:
+        标题相似度索引
+    """
+    cache = get_cache()
+    case_key = "nocase" if ignore_case else "case"
+    cache_key = f"similarity_index:{date_folder}:{case_key}:{','.join(sorted(all_titles))}"
+
+    index = cache.get(cache_key, ttl=ttl)
+    if index is not None and index.source is all_titles:
+        return index
+
+    index = TitleSimilarityIndex(all_titles, ignore_case)
+    cache.set(cache_key, index, ttl=ttl, size=estimate_size(index, exclude=(all_titles,)))
+    return index
@@ -0,0 +1,90 @@
+"""
+并发请求合并服务（single-flight）
+
+同一个键同时只执行一次计算：计算进行中到达的相同请求不再重复计算，
+而是等待并共享第一个请求的结果（或异常）。计算完成后立即释放该键，
+之后的请求照常读取缓存或重新计算。
+"""
+
+from threading import Event, Lock
+from typing import Any, Callable, Dict
+
+
+class _Call:
+    """进行中的一次计算"""
+
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self):
+        self.done = Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    """按键合并并发计算"""
+
+    def __init__(self):
+        self._lock = Lock()
+        self._calls: Dict[str, _Call] = {}
+
+    def do(self, key: str, fn: Callable[[], Any]) -> Any:
+        """
+        执行计算，相同键的并发调用只执行一次
+
+        Args:
+            key: 请求键（通常与缓存键一致）
+            fn: 计算函数
+
+        Returns:
+            计算结果，等待中的调用方拿到的是同一个对象
+
+        Raises:
+            计算函数抛出的异常会传递给所有等待中的调用方
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = _Call()
+                self._calls[key] = call
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result
+
+    def in_flight(self) -> int:
+        """进行中的计算数量"""
+        with self._lock:
+            return len(self._calls)
+
+
+# 全局实例
+_global_flight = SingleFlight()
+
+
+def single_flight(key: str, fn: Callable[[], Any]) -> Any:
+    """
+    使用全局实例合并并发计算
+
+    Args:
+        key: 请求键
+        fn: 计算函数
+
+    Returns:
+        计算结果
+    """
+    return _global_flight.do(key, fn)
@@ -0,0 +1,393 @@
+"""
+快照目录监听服务
+
+监听 output/<日期>/txt/ 下新写入的快照文件，只失效对应日期派生出的缓存：
+
+- news_by_date:<YYYY-MM-DD>:*
+- 当天数据额外失效 latest_news:*、trending_topics:*
+
+每次失效同时递增该日期的缓存代数，失效前开始计算的结果不会再写入缓存。
+
+read_all_titles 按文件 mtime 自行校验，搜索与相似度索引按数据对象校验，
+无需在此处理。Linux 下优先使用 inotify，不可用时退化为定时检查目录 mtime。
+
+监听方式可通过环境变量 MCP_SNAPSHOT_WATCH 指定：auto（默认）、inotify、poll、off。
+"""
+
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import sys
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+from .cache_service import CacheService, get_cache
+
+
+# 轮询模式的检查间隔（秒）
+DEFAULT_POLL_INTERVAL = 5.0
+
+# 监听生效时当天数据相关缓存可使用的 TTL（秒）
+WATCHED_TTL = 3600
+
+# inotify 事件常量（见 <sys/inotify.h>）
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ISDIR = 0x40000000
+IN_NONBLOCK = 0o4000
+IN_CLOEXEC = 0o2000000
+
+_EVENT_HEADER = struct.Struct("iIII")
+
+# 各日期（YYYY-MM-DD）的缓存代数，每次失效加一；_epoch 在全部失效时加一
+_generations: Dict[str, int] = {}
+_epoch = 0
+_generations_lock = threading.Lock()
+
+# 目录事件（新日期文件夹、新 txt 子目录）与快照文件事件
+_DIR_MASK = IN_CREATE | IN_MOVED_TO | IN_DELETE_SELF
+_TXT_MASK = IN_CLOSE_WRITE | IN_MOVED_TO | IN_DELETE | IN_DELETE_SELF
+
+
+def _load_inotify():
+    """加载 libc 中的 inotify 函数，不支持时返回 None"""
+    if not sys.platform.startswith("linux"):
+        return None
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or None, use_errno=True)
+        for name in ("inotify_init1", "inotify_add_watch"):
+            getattr(libc, name)
+    except (OSError, AttributeError):
+        return None
+
+    libc.inotify_init1.argtypes = [ctypes.c_int]
+    libc.inotify_add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+    return libc
+
+
+def cache_generation(date_str: str) -> Tuple[int, int]:
+    """
+    读取某个日期的缓存代数
+
+    计算前读取一次，写入缓存前再读取一次，两者不同说明期间有新快照写入，结果不应缓存。
+
+    Args:
+        date_str: 日期，格式: YYYY-MM-DD
+
+    Returns:
+        (全局代数, 日期代数)
+    """
+    with _generations_lock:
+        return _epoch, _generations.get(date_str, 0)
+
+
+def _bump_generation(date_str: Optional[str] = None) -> None:
+    """递增某个日期的缓存代数，未指定日期时递增全局代数"""
+    global _epoch
+    with _generations_lock:
+        if date_str is None:
+            _epoch += 1
+        else:
+            _generations[date_str] = _generations.get(date_str, 0) + 1
+
+
+def invalidate_date(date_folder: str, cache: Optional[CacheService] = None) -> int:
+    """
+    失效某个日期文件夹派生出的缓存
+
+    Args:
+        date_folder: 日期文件夹名称，格式: YYYY年MM月DD日
+        cache: 缓存实例，默认为全局缓存
+
+    Returns:
+        删除的缓存条目数量
+    """
+    cache = cache or get_cache()
+    try:
+        date = datetime.strptime(date_folder, "%Y年%m月%d日").date()
+    except ValueError:
+        return 0
+
+    # 先递增代数再删除，正在计算的旧结果不会在删除之后写回
+    _bump_generation(date.isoformat())
+    removed = cache.delete_prefix(f"news_by_date:{date.isoformat()}:")
+    if date == datetime.now().date():
+        removed += cache.delete_prefix("latest_news:")
+        removed += cache.delete_prefix("trending_topics:")
+    return removed
+
+
+class SnapshotWatcher:
+    """快照目录监听器（后台守护线程）"""
+
+    def __init__(
+        self,
+        output_dir: Path,
+        cache: Optional[CacheService] = None,
+        mode: str = "auto",
+        poll_interval: float = DEFAULT_POLL_INTERVAL
+    ):
+        """
+        初始化监听器
+
+        Args:
+            output_dir: output 目录
+            cache: 缓存实例，默认为全局缓存
+            mode: auto、inotify 或 poll
+            poll_interval: 轮询模式的检查间隔（秒）
+        """
+        self.output_dir = Path(output_dir)
+        self.cache = cache or get_cache()
+        self.mode = mode
+        self.poll_interval = poll_interval
+
+        self.backend = None
+        self._thread = None
+        self._stop = threading.Event()
+
+        # inotify 状态：watch 描述符 -> (目录类型 root/date/txt, 目录, 日期文件夹名)
+        self._libc = None
+        self._fd = -1
+        self._watches = {}
+
+        # 轮询状态：日期文件夹 -> txt 目录签名
+        self._signatures = {}
+
+    @property
+    def active(self) -> bool:
+        """监听线程是否在运行"""
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> bool:
+        """
+        启动监听线程
+
+        Returns:
+            是否启动成功（output 目录不存在时不启动）
+        """
+        if self.active:
+            return True
+        if not self.output_dir.is_dir():
+            return False
+
+        self._stop.clear()
+        if self.mode in ("auto", "inotify") and self._init_inotify():
+            self.backend = "inotify"
+            target = self._run_inotify
+        elif self.mode in ("auto", "poll"):
+            self.backend = "poll"
+            self._signatures = self._scan()
+            target = self._run_poll
+        else:
+            return False
+
+        self._thread = threading.Thread(target=target, name="snapshot-watcher", daemon=True)
+        self._thread.start()
+        return True
+
+    def stop(self, timeout: float = 2.0) -> None:
+        """停止监听线程"""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+        if self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
+            self._watches.clear()
+
+    def _invalidate(self, date_folder: str) -> None:
+        """失效单个日期的缓存"""
+        invalidate_date(date_folder, self.cache)
+
+    def _invalidate_all(self) -> None:
+        """事件丢失时失效全部日期相关缓存"""
+        _bump_generation()
+        for prefix in ("news_by_date:", "latest_news:", "trending_topics:"):
+            self.cache.delete_prefix(prefix)
+
+    # ---------------- inotify ----------------
+
+    def _init_inotify(self) -> bool:
+        """创建 inotify 实例并监听已有目录"""
+        libc = _load_inotify()
+        if libc is None:
+            return False
+
+        fd = libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if fd < 0:
+            return False
+
+        self._libc = libc
+        self._fd = fd
+        if not self._add_watch("root", self.output_dir, "", _DIR_MASK):
+            os.close(fd)
+            self._fd = -1
+            return False
+
+        for date_dir in self.output_dir.iterdir():
+            if date_dir.is_dir():
+                self._watch_date_dir(date_dir)
+        return True
+
+    def _add_watch(self, kind: str, path: Path, date_folder: str, mask: int) -> bool:
+        """为目录添加 watch"""
+        wd = self._libc.inotify_add_watch(self._fd, os.fsencode(str(path)), mask)
+        if wd < 0:
+            return False
+        self._watches[wd] = (kind, path, date_folder)
+        return True
+
+    def _watch_date_dir(self, date_dir: Path) -> None:
+        """监听日期文件夹及其 txt 子目录"""
+        self._add_watch("date", date_dir, date_dir.name, _DIR_MASK)
+        txt_dir = date_dir / "txt"
+        if txt_dir.is_dir():
+            self._add_watch("txt", txt_dir, date_dir.name, _TXT_MASK)
+
+    def _run_inotify(self) -> None:
+        """inotify 事件循环"""
+        while not self._stop.is_set():
+            try:
+                ready, _, _ = select.select([self._fd], [], [], 1.0)
+                if not ready:
+                    continue
+                data = os.read(self._fd, 64 * 1024)
+            except (OSError, ValueError):
+                # 描述符已关闭（stop）或读取失败
+                return
+
+            changed = set()
+            offset = 0
+            while offset + _EVENT_HEADER.size <= len(data):
+                wd, mask, _, length = _EVENT_HEADER.unpack_from(data, offset)
+                offset += _EVENT_HEADER.size
+                name = os.fsdecode(data[offset:offset + length].rstrip(b"\0"))
+                offset += length
+
+                if mask & IN_Q_OVERFLOW:
+                    self._invalidate_all()
+                    continue
+
+                watch = self._watches.get(wd)
+                if watch is None:
+                    continue
+                kind, path, date_folder = watch
+
+                if mask & IN_IGNORED:
+                    self._watches.pop(wd, None)
+                    continue
+
+                created_dir = mask & IN_ISDIR and mask & (IN_CREATE | IN_MOVED_TO)
+                if kind == "root":
+                    # 新建日期文件夹
+                    if created_dir:
+                        self._watch_date_dir(path / name)
+                        changed.add(name)
+                elif kind == "date":
+                    # 新建 txt 子目录
+                    if created_dir and name == "txt":
+                        self._add_watch("txt", path / name, date_folder, _TXT_MASK)
+                        changed.add(date_folder)
+                elif name.endswith(".txt") or mask & IN_DELETE_SELF:
+                    changed.add(date_folder)
+
+            for date_folder in changed:
+                self._invalidate(date_folder)
+
+    # ---------------- 轮询 ----------------
+
+    def _scan(self) -> Dict[str, tuple]:
+        """读取每个日期 txt 目录的 (mtime, 文件数) 签名"""
+        signatures = {}
+        try:
+            date_dirs = list(os.scandir(self.output_dir))
+        except OSError:
+            return signatures
+
+        for entry in date_dirs:
+            if not entry.is_dir():
+                continue
+            txt_dir = os.path.join(entry.path, "txt")
+            try:
+                stat = os.stat(txt_dir)
+            except OSError:
+                signatures[entry.name] = None
+                continue
+            signatures[entry.name] = (stat.st_mtime_ns, len(os.listdir(txt_dir)))
+        return signatures
+
+    def _run_poll(self) -> None:
+        """定时比较目录签名"""
+        while not self._stop.wait(self.poll_interval):
+            signatures = self._scan()
+            for date_folder, signature in signatures.items():
+                if self._signatures.get(date_folder, ()) != signature:
+                    self._invalidate(date_folder)
+            self._signatures = signatures
+
+
+# 全局监听器实例
+_watcher = None
+
+
+def start_snapshot_watcher(project_root: Optional[str] = None) -> Optional[SnapshotWatcher]:
+    """
+    启动全局快照监听器
+
+    Args:
+        project_root: 项目根目录，默认与 ParserService 一致
+
+    Returns:
+        监听器实例，未启动时返回 None
+    """
+    global _watcher
+    if _watcher is not None and _watcher.active:
+        return _watcher
+
+    mode = os.environ.get("MCP_SNAPSHOT_WATCH", "auto").lower()
+    if mode == "off":
+        return None
+
+    if project_root is None:
+        root = Path(__file__).parent.parent.parent
+    else:
+        root = Path(project_root)
+
+    watcher = SnapshotWatcher(
+        root / "output",
+        mode=mode,
+        poll_interval=float(os.environ.get("MCP_SNAPSHOT_POLL_INTERVAL", DEFAULT_POLL_INTERVAL))
+    )
+    if not watcher.start():
+        return None
+
+    _watcher = watcher
+    return watcher
+
+
+def is_watching() -> bool:
+    """全局快照监听器是否在运行"""
+    return _watcher is not None and _watcher.active
+
+
+def today_cache_ttl(ttl: int) -> int:
+    """
+    当天数据相关缓存的 TTL：监听生效时放宽到 WATCHED_TTL，否则使用原值
+
+    Args:
+        ttl: 未监听时的 TTL（秒）
+
+    Returns:
+        实际使用的 TTL（秒）
+    """
+    return max(ttl, WATCHED_TTL) if is_watching() else ttl
@@ -0,0 +1,237 @@
+"""
+中文分词服务
+
+为关键词提取提供不依赖网络和第三方库的分词：
+
+- 汉字片段按词典正向最大匹配切分，词典由 config/tokenizer_words.txt 中的常用词、
+  config/frequency_words.txt 中的关注词以及环境变量 MCP_TOKENIZER_DICT 指定的
+  词典文件（每行一个词，多个文件用系统路径分隔符分隔）组成
+- 词典未覆盖的连续汉字：2~3 个字整体作为一个词（多为人名、地名、简称），
+  更长的依次按两字切分（长度为奇数时最后一段三个字）；常见虚词单字作为分隔符，
+  疑问词、连词等虚词在词典中匹配后丢弃
+- 汉字以外的文字（字母、数字、假名、带重音的拉丁字母等）按连续的 \w 片段切分，
+  与原先的 [\w]+ 一致；纯数字同样保留，是否丢弃由调用方决定
+
+切分结果按文本缓存（LRU，容量可通过环境变量 MCP_TOKENIZER_CACHE 设置），
+各工具共用同一个分词器实例，同一标题只切分一次。
+
+分词器可替换：set_tokenizer() 传入任意带有 segment(text) 方法和 version 属性的对象。
+"""
+
+import hashlib
+import os
+import re
+from functools import lru_cache
+from pathlib import Path
+from threading import Lock
+from typing import Iterable, Optional, Tuple
+
+
+# 分词算法版本，切分规则变化时递增（词典变化会自动体现在 version 中）
+SEGMENTER_VERSION = "2"
+
+# 默认切分结果缓存容量（条）
+DEFAULT_CACHE_SIZE = 65536
+
+# 词典词最大长度，更长的词不参与匹配
+MAX_WORD_LENGTH = 8
+
+_URL_RE = re.compile(r'http[s]?://\S+')
+_CJK = r'\u3400-\u4dbf\u4e00-\u9fff\uf900-\ufaff'
+_CHUNK_RE = re.compile(rf'([{_CJK}]+)|([^\W{_CJK}]+)')
+
+# 不在词典词中时视为分隔符的虚词单字
+BREAK_CHARS = frozenset(
+    "的了在是和与及等被把对将从以于为也都就又还而或但吗呢吧啊呀么"
+    "之其该这那你我他她它们个让给向称曾再已并着过得地很更最才却仍"
+    "获遭致因至由令使据请当跟同替比叫像后"
+)
+
+# 词典中匹配但不输出的虚词（疑问词、连词、代词等）
+FUNCTION_WORDS = frozenset("""
+什么 为什么 为何 如何 怎么 怎么办 怎样 哪些 哪个 是否 可能 或将 这个 那个 这些 那些
+这样 那样 还是 就是 不是 但是 因为 所以 如果 虽然 然而 可以 已经 没有 自己 一个 我们
+你们 他们 她们 大家 如何评价 如何看待 怎么看 有没有 是不是 会不会 能不能 要不要
+""".split())
+
+# 内置词典文件（相对项目根目录）
+BUILTIN_DICT = Path("config") / "tokenizer_words.txt"
+
+
+class Tokenizer:
+    """词典最大匹配 + 两字切分回退的分词器"""
+
+    def __init__(self, words: Iterable[str] = (), cache_size: int = DEFAULT_CACHE_SIZE):
+        """
+        初始化分词器
+
+        Args:
+            words: 词典词（单字和超过 MAX_WORD_LENGTH 的词会被忽略，FUNCTION_WORDS 总是包含在内）
+            cache_size: 切分结果缓存容量（条）
+        """
+        self.words = frozenset(
+            word for word in FUNCTION_WORDS.union(words)
+            if 2 <= len(word) <= MAX_WORD_LENGTH
+        )
+        # 按词的前两个字分组，记录各组中存在的词长（从长到短），没有词以该两字开头时直接跳过
+        self._lengths = {}
+        for word in self.words:
+            self._lengths.setdefault(word[:2], set()).add(len(word))
+        self._lengths = {prefix: sorted(lengths, reverse=True) for prefix, lengths in self._lengths.items()}
+
+        digest = hashlib.md5("\n".join(sorted(self.words)).encode("utf-8")).hexdigest()[:12]
+        self.version = f"dict-{SEGMENTER_VERSION}-{digest}"
+
+        self.segment = lru_cache(maxsize=cache_size)(self._segment)
+
+    def _segment(self, text: str) -> Tuple[str, ...]:
+        """
+        切分文本（未缓存）
+
+        Args:
+            text: 输入文本
+
+        Returns:
+            词元组（按出现顺序，保留重复）
+        """
+        tokens = []
+        for cjk, other in _CHUNK_RE.findall(_URL_RE.sub('', text)):
+            if cjk:
+                self._segment_cjk(cjk, tokens)
+            else:
+                tokens.append(other)
+        return tuple(tokens)
+
+    def _segment_cjk(self, run: str, tokens: list) -> None:
+        """对连续汉字做正向最大匹配，结果追加到 tokens"""
+        gap_start = None
+        i = 0
+        n = len(run)
+
+        while i < n:
+            matched = 0
+            for length in self._lengths.get(run[i:i + 2], ()):
+                if length <= n - i and run[i:i + length] in self.words:
+                    matched = length
+                    break
+
+            if matched:
+                if gap_start is not None:
+                    self._emit_gap(run[gap_start:i], tokens)
+                    gap_start = None
+                word = run[i:i + matched]
+                if word not in FUNCTION_WORDS:
+                    tokens.append(word)
+                i += matched
+            elif run[i] in BREAK_CHARS:
+                if gap_start is not None:
+                    self._emit_gap(run[gap_start:i], tokens)
+                    gap_start = None
+                i += 1
+            else:
+                if gap_start is None:
+                    gap_start = i
+                i += 1
+
+        if gap_start is not None:
+            self._emit_gap(run[gap_start:], tokens)
+
+    @staticmethod
+    def _emit_gap(gap: str, tokens: list) -> None:
+        """处理词典未覆盖的连续汉字"""
+        if len(gap) < 2:
+            return
+        if len(gap) <= 3:
+            tokens.append(gap)
+            return
+        # 按两字切分，奇数长度时最后一段保留三个字
+        end = len(gap) - 3 if len(gap) % 2 else len(gap)
+        tokens.extend(gap[i:i + 2] for i in range(0, end, 2))
+        if end < len(gap):
+            tokens.append(gap[end:])
+
+    def cache_info(self):
+        """切分结果缓存统计"""
+        return self.segment.cache_info()
+
+
+def load_words(path: Path) -> list:
+    """
+    读取词典文件
+
+    每行一个或多个词（以 |、逗号分隔），忽略空行和 # 开头的注释；
+    兼容关注词文件的 +、! 前后缀写法。
+
+    Args:
+        path: 词典文件路径
+
+    Returns:
+        词列表，文件不存在或读取失败时返回空列表
+    """
+    words = []
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if not line or line.startswith("#"):
+                    continue
+                for word in re.split(r'[|,，]', line):
+                    word = word.strip().strip("+!！")
+                    if word:
+                        words.append(word)
+    except OSError as e:
+        print(f"Warning: 读取分词词典 {path} 失败: {e}")
+    return words
+
+
+# 全局分词器
+_tokenizer = None
+_tokenizer_lock = Lock()
+
+
+def get_tokenizer(project_root: Optional[str] = None):
+    """
+    获取全局分词器（懒加载，词典在首次调用时加载）
+
+    Args:
+        project_root: 项目根目录，用于读取 config/ 下的词典文件，默认与 ParserService 一致
+
+    Returns:
+        分词器实例
+    """
+    global _tokenizer
+    if _tokenizer is not None:
+        return _tokenizer
+
+    with _tokenizer_lock:
+        if _tokenizer is None:
+            if project_root is None:
+                root = Path(__file__).parent.parent.parent
+            else:
+                root = Path(project_root)
+
+            words = []
+            for dict_file in (root / BUILTIN_DICT, root / "config" / "frequency_words.txt"):
+                if dict_file.exists():
+                    words.extend(load_words(dict_file))
+            for path in filter(None, os.environ.get("MCP_TOKENIZER_DICT", "").split(os.pathsep)):
+                words.extend(load_words(Path(path)))
+
+            _tokenizer = Tokenizer(
+                words,
+                cache_size=int(os.environ.get("MCP_TOKENIZER_CACHE", DEFAULT_CACHE_SIZE))
+            )
+        return _tokenizer
+
+
+def set_tokenizer(tokenizer) -> None:
+    """
+    替换全局分词器
+
+    Args:
+        tokenizer: 带有 segment(text) -> Tuple[str, ...] 方法和 version 属性的对象，
+            切分规则或词典变化时 version 必须随之变化（用于使持久化的关键词汇总失效）
+    """
+    global _tokenizer
+    with _tokenizer_lock:
+        _tokenizer = tokenizer
@@ -7,10 +7,13 @@
 import re
 from collections import Counter, defaultdict
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional
-from difflib import SequenceMatcher
+from typing import Dict, List, Optional, Tuple
 
 from ..services.data_service import DataService
+from ..services.keyword_rollup import KeywordRollup, get_keyword_rollup
+from ..services.parallel_scan import scan_dates
+from ..services.similarity import get_similarity_index, text_similarity
+from ..services.tokenizer import get_tokenizer
 from ..utils.validators import (
     validate_platforms,
     validate_limit,
@@ -21,57 +24,102 @@ from ..utils.validators import (
 from ..utils.errors import MCPError, InvalidParameterError, DataNotFoundError
 
 
-def calculate_news_weight(news_data: Dict, rank_threshold: int = 5) -> float:
+# 权重配置（与 config.yaml 保持一致）
+RANK_WEIGHT = 0.6
+FREQUENCY_WEIGHT = 0.3
+HOTNESS_WEIGHT = 0.1
+
+# 频次权重只有 min(出现次数, 10) 这几种取值，预先算好加权结果
+_FREQUENCY_TERMS = [min(count, 10) * 10 * FREQUENCY_WEIGHT for count in range(11)]
+
+# _extract_keywords 的版本号，过滤规则变化时必须修改（与分词器版本一起用于使已持久化的关键词汇总失效）
+KEYWORD_TOKENIZER_VERSION = "seg-2"
+
+# 关键词停用词
+KEYWORD_STOPWORDS = frozenset({
+    '的', '了', '在', '是', '我', '有', '和', '就', '不', '人', '都', '一', '一个', '上', '也', '很',
+    '到', '说', '要', '去', '你', '会', '着', '没有', '看', '好', '自己', '这'
+})
+
+
+def calculate_news_weights(news_list: List[Dict], rank_threshold: int = 5) -> List[float]:
     """
-    计算新闻权重（用于排序）
+    批量计算新闻权重（用于排序）
 
     基于 main.py 的权重算法实现，综合考虑：
     - 排名权重 (60%)：新闻在榜单中的排名
     - 频次权重 (30%)：新闻出现的次数
     - 热度权重 (10%)：高排名出现的比例
 
+    排名分数按整数累加后只做一次除法，结果与逐条计算完全一致。
+
     Args:
-        news_data: 新闻数据字典，包含 ranks 和 count 字段
+        news_list: 新闻数据字典列表，每项包含 ranks 和 count 字段
         rank_threshold: 高排名阈值，默认5
 
     Returns:
-        权重分数（0-100之间的浮点数）
+        与 news_list 顺序对应的权重分数列表（0-100之间的浮点数）
     """
-    ranks = news_data.get("ranks", [])
-    if not ranks:
-        return 0.0
+    weights = []
+    for news_data in news_list:
+        ranks = news_data.get("ranks", [])
+        total = len(ranks)
+        if not total:
+            weights.append(0.0)
+            continue
+
+        count = news_data.get("count", total)
+
+        # 1. 排名权重：Σ(11 - min(rank, 10)) / 出现次数
+        rank_weight = (
+            11 * total - sum([rank if rank < 10 else 10 for rank in ranks])
+        ) / total
+
+        # 2. 频次权重：min(出现次数, 10) × 10
+        if 0 <= count <= 10:
+            frequency_term = _FREQUENCY_TERMS[count]
+        else:
+            frequency_term = min(count, 10) * 10 * FREQUENCY_WEIGHT
 
-    count = news_data.get("count", len(ranks))
+        # 3. 热度加成：高排名次数 / 总出现次数 × 100
+        high_rank_count = len([rank for rank in ranks if rank <= rank_threshold])
+        hotness_weight = high_rank_count / total * 100
 
-    # 权重配置（与 config.yaml 保持一致）
-    RANK_WEIGHT = 0.6
-    FREQUENCY_WEIGHT = 0.3
-    HOTNESS_WEIGHT = 0.1
+        # 综合权重
+        weights.append(
+            rank_weight * RANK_WEIGHT + frequency_term + hotness_weight * HOTNESS_WEIGHT
+        )
 
-    # 1. 排名权重：Σ(11 - min(rank, 10)) / 出现次数
-    rank_scores = []
-    for rank in ranks:
-        score = 11 - min(rank, 10)
-        rank_scores.append(score)
+    return weights
 
-    rank_weight = sum(rank_scores) / len(ranks) if ranks else 0
 
-    # 2. 频次权重：min(出现次数, 10) × 10
-    frequency_weight = min(count, 10) * 10
+def calculate_news_weight(news_data: Dict, rank_threshold: int = 5) -> float:
+    """
+    计算新闻权重（用于排序）
 
-    # 3. 热度加成：高排名次数 / 总出现次数 × 100
-    high_rank_count = sum(1 for rank in ranks if rank <= rank_threshold)
-    hotness_ratio = high_rank_count / len(ranks) if ranks else 0
-    hotness_weight = hotness_ratio * 100
+    Args:
+        news_data: 新闻数据字典，包含 ranks 和 count 字段
+        rank_threshold: 高排名阈值，默认5
 
-    # 综合权重
-    total_weight = (
-        rank_weight * RANK_WEIGHT
-        + frequency_weight * FREQUENCY_WEIGHT
-        + hotness_weight * HOTNESS_WEIGHT
-    )
+    Returns:
+        权重分数（0-100之间的浮点数）
+    """
+    return calculate_news_weights([news_data], rank_threshold)[0]
 
-    return total_weight
+
+def sort_news_by_weight(news_list: List[Dict]) -> List[Dict]:
+    """
+    按权重从高到低排序新闻（权重相同时保持原顺序）
+
+    Args:
+        news_list: 新闻数据字典列表
+
+    Returns:
+        排序后的新列表
+    """
+    weights = calculate_news_weights(news_list)
+    order = sorted(range(len(news_list)), key=weights.__getitem__, reverse=True)
+    return [news_list[i] for i in order]
 
 
 class AnalyticsTools:
@@ -85,6 +133,7 @@ class AnalyticsTools:
             project_root: 项目根目录
         """
         self.data_service = DataService(project_root)
+        self.tokenizer = get_tokenizer(project_root)
 
     def analyze_data_insights_unified(
         self,
@@ -306,38 +355,23 @@ class AnalyticsTools:
                 end_date = datetime.now()
                 start_date = end_date - timedelta(days=6)
 
-            # 收集趋势数据
+            # 收集趋势数据（一次历史库查询，按日期分组）
+            titles_by_date = self.data_service.get_topic_titles_by_date(
+                topic, start_date, end_date
+            )
+
             trend_data = []
             current_date = start_date
 
             while current_date <= end_date:
-                try:
-                    all_titles, _, _ = self.data_service.parser.read_all_titles_for_date(
-                        date=current_date
-                    )
-
-                    # 统计该时间点的话题出现次数
-                    count = 0
-                    matched_titles = []
-
-                    for _, titles in all_titles.items():
-                        for title in titles.keys():
-                            if topic.lower() in title.lower():
-                                count += 1
-                                matched_titles.append(title)
-
-                    trend_data.append({
-                        "date": current_date.strftime("%Y-%m-%d"),
-                        "count": count,
-                        "sample_titles": matched_titles[:3]  # 只保留前3个样本
-                    })
+                date_key = current_date.strftime("%Y-%m-%d")
+                matched_titles = titles_by_date.get(date_key, [])
 
-                except DataNotFoundError:
-                    trend_data.append({
-                        "date": current_date.strftime("%Y-%m-%d"),
-                        "count": 0,
-                        "sample_titles": []
-                    })
+                trend_data.append({
+                    "date": date_key,
+                    "count": len(matched_titles),
+                    "sample_titles": matched_titles[:3]  # 只保留前3个样本
+                })
 
                 # 按天增加时间
                 current_date += timedelta(days=1)
@@ -448,33 +482,14 @@ class AnalyticsTools:
                 "top_keywords": Counter()
             })
 
-            # 遍历日期范围
-            current_date = start_date
-            while current_date <= end_date:
-                try:
-                    all_titles, id_to_name, _ = self.data_service.parser.read_all_titles_for_date(
-                        date=current_date
-                    )
-
-                    for platform_id, titles in all_titles.items():
-                        platform_name = id_to_name.get(platform_id, platform_id)
-
-                        for title in titles.keys():
-                            platform_stats[platform_name]["total_news"] += 1
-                            platform_stats[platform_name]["unique_titles"].add(title)
-
-                            # 如果指定了话题，统计包含话题的新闻
-                            if topic and topic.lower() in title.lower():
-                                platform_stats[platform_name]["topic_mentions"] += 1
-
-                            # 提取关键词（简单分词）
-                            keywords = self._extract_keywords(title)
-                            platform_stats[platform_name]["top_keywords"].update(keywords)
-
-                except DataNotFoundError:
-                    pass
-
-                current_date += timedelta(days=1)
+            # 逐日统计（可并行），按日期顺序合并
+            for _, day_stats in scan_dates(self, start_date, end_date, "_platform_day_stats", topic):
+                for platform_name, partial in day_stats.items():
+                    stats = platform_stats[platform_name]
+                    stats["total_news"] += partial["total_news"]
+                    stats["topic_mentions"] += partial["topic_mentions"]
+                    stats["unique_titles"].update(partial["titles"])
+                    stats["top_keywords"].update(partial["top_keywords"])
 
             # 转换为可序列化的格式
             result_stats = {}
@@ -523,6 +538,44 @@ class AnalyticsTools:
                 }
             }
 
+    def _platform_day_stats(
+        self,
+        date: datetime,
+        all_titles: Dict,
+        id_to_name: Dict,
+        timestamps: Dict,
+        topic: Optional[str]
+    ) -> Dict:
+        """
+        统计单日各平台的新闻数、话题提及数与关键词（compare_platforms 的逐日部分）
+
+        Returns:
+            {platform_name: {total_news, topic_mentions, titles, top_keywords}}
+        """
+        day_stats = {}
+        for platform_id, titles in all_titles.items():
+            platform_name = id_to_name.get(platform_id, platform_id)
+            stats = day_stats.setdefault(platform_name, {
+                "total_news": 0,
+                "topic_mentions": 0,
+                "titles": [],
+                "top_keywords": Counter()
+            })
+
+            for title in titles.keys():
+                stats["total_news"] += 1
+                stats["titles"].append(title)
+
+                # 如果指定了话题，统计包含话题的新闻
+                if topic and topic.lower() in title.lower():
+                    stats["topic_mentions"] += 1
+
+                # 提取关键词（简单分词）
+                keywords = self._extract_keywords(title)
+                stats["top_keywords"].update(keywords)
+
+        return day_stats
+
     def analyze_keyword_cooccurrence(
         self,
         min_frequency: int = 3,
@@ -557,29 +610,9 @@ class AnalyticsTools:
             min_frequency = validate_limit(min_frequency, default=3, max_limit=100)
             top_n = validate_top_n(top_n, default=20)
 
-            # 读取今天的数据
-            all_titles, _, _ = self.data_service.parser.read_all_titles_for_date()
-
-            # 关键词共现统计
-            cooccurrence = Counter()
-            keyword_titles = defaultdict(list)
-
-            for platform_id, titles in all_titles.items():
-                for title in titles.keys():
-                    # 提取关键词
-                    keywords = self._extract_keywords(title)
-
-                    # 记录每个关键词出现的标题
-                    for kw in keywords:
-                        keyword_titles[kw].append(title)
-
-                    # 计算两两共现
-                    if len(keywords) >= 2:
-                        for i, kw1 in enumerate(keywords):
-                            for kw2 in keywords[i+1:]:
-                                # 统一排序，避免重复
-                                pair = tuple(sorted([kw1, kw2]))
-                                cooccurrence[pair] += 1
+            # 读取今天预先计算的关键词共现统计
+            rollup = self._get_keyword_rollup()
+            cooccurrence = rollup.cooccurrence
 
             # 过滤低频共现
             filtered_pairs = [
@@ -594,10 +627,7 @@ class AnalyticsTools:
             result_pairs = []
             for (kw1, kw2), count in top_pairs:
                 # 找出同时包含两个关键词的标题样本
-                titles_with_both = [
-                    title for title in keyword_titles[kw1]
-                    if kw2 in self._extract_keywords(title)
-                ]
+                titles_with_both = rollup.titles_with_both(kw1, kw2)
 
                 result_pairs.append({
                     "keyword1": kw1,
@@ -691,46 +721,13 @@ class AnalyticsTools:
                 # 默认今天
                 start_date = end_date = datetime.now()
 
-            # 收集新闻数据（支持多天）
+            # 收集新闻数据（支持多天，逐日收集可并行，按日期顺序合并）
             all_news_items = []
-            current_date = start_date
-
-            while current_date <= end_date:
-                try:
-                    all_titles, id_to_name, _ = self.data_service.parser.read_all_titles_for_date(
-                        date=current_date,
-                        platform_ids=platforms
-                    )
-
-                    # 收集该日期的新闻
-                    for platform_id, titles in all_titles.items():
-                        platform_name = id_to_name.get(platform_id, platform_id)
-                        for title, info in titles.items():
-                            # 如果指定了话题，只收集包含话题的标题
-                            if topic and topic.lower() not in title.lower():
-                                continue
-
-                            news_item = {
-                                "platform": platform_name,
-                                "title": title,
-                                "ranks": info.get("ranks", []),
-                                "count": len(info.get("ranks", [])),
-                                "date": current_date.strftime("%Y-%m-%d")
-                            }
-
-                            # 条件性添加 URL 字段
-                            if include_url:
-                                news_item["url"] = info.get("url", "")
-                                news_item["mobileUrl"] = info.get("mobileUrl", "")
-
-                            all_news_items.append(news_item)
-
-                except DataNotFoundError:
-                    # 该日期没有数据，继续下一天
-                    pass
-
-                # 下一天
-                current_date += timedelta(days=1)
+            for _, day_items in scan_dates(
+                self, start_date, end_date, "_sentiment_day_news", topic, include_url,
+                platform_ids=platforms
+            ):
+                all_news_items.extend(day_items)
 
             if not all_news_items:
                 time_desc = "今天" if start_date == end_date else f"{start_date.strftime('%Y-%m-%d')} 至 {end_date.strftime('%Y-%m-%d')}"
@@ -755,10 +752,7 @@ class AnalyticsTools:
 
             # 按权重排序（如果启用）
             if sort_by_weight:
-                deduplicated_news.sort(
-                    key=lambda x: calculate_news_weight(x),
-                    reverse=True
-                )
+                deduplicated_news = sort_news_by_weight(deduplicated_news)
 
             # 限制返回数量
             selected_news = deduplicated_news[:limit]
@@ -815,6 +809,47 @@ class AnalyticsTools:
                 }
             }
 
+    def _sentiment_day_news(
+        self,
+        date: datetime,
+        all_titles: Dict,
+        id_to_name: Dict,
+        timestamps: Dict,
+        topic: Optional[str],
+        include_url: bool
+    ) -> List[Dict]:
+        """
+        收集单日待分析的新闻（analyze_sentiment 的逐日部分）
+
+        Returns:
+            新闻列表
+        """
+        news_items = []
+        for platform_id, titles in all_titles.items():
+            platform_name = id_to_name.get(platform_id, platform_id)
+            for title, info in titles.items():
+                # 如果指定了话题，只收集包含话题的标题
+                if topic and topic.lower() not in title.lower():
+                    continue
+
+                news_item = {
+                    "platform": platform_name,
+                    "title": title,
+                    # 复制排名列表：后续去重合并会原地扩展，不能改动解析缓存
+                    "ranks": list(info.get("ranks", [])),
+                    "count": len(info.get("ranks", [])),
+                    "date": date.strftime("%Y-%m-%d")
+                }
+
+                # 条件性添加 URL 字段
+                if include_url:
+                    news_item["url"] = info.get("url", "")
+                    news_item["mobileUrl"] = info.get("mobileUrl", "")
+
+                news_items.append(news_item)
+
+        return news_items
+
     def _create_sentiment_analysis_prompt(
         self,
         news_data: List[Dict],
@@ -956,33 +991,33 @@ class AnalyticsTools:
             # 读取数据
             all_titles, id_to_name, _ = self.data_service.parser.read_all_titles_for_date()
 
-            # 计算相似度
+            # 通过相似度索引召回候选并计算相似度
             similar_items = []
+            similarity_index = get_similarity_index(
+                self.data_service.parser.get_date_folder_name(), all_titles, ignore_case=False
+            )
+            scores = similarity_index.query(reference_title, threshold)
 
-            for platform_id, titles in all_titles.items():
+            for entry_id in sorted(scores):
+                platform_id, title, info = similarity_index.entries[entry_id]
                 platform_name = id_to_name.get(platform_id, platform_id)
 
-                for title, info in titles.items():
-                    if title == reference_title:
-                        continue
-
-                    # 计算相似度
-                    similarity = self._calculate_similarity(reference_title, title)
+                if title == reference_title:
+                    continue
 
-                    if similarity >= threshold:
-                        news_item = {
-                            "title": title,
-                            "platform": platform_id,
-                            "platform_name": platform_name,
-                            "similarity": round(similarity, 3),
-                            "rank": info["ranks"][0] if info["ranks"] else 0
-                        }
+                news_item = {
+                    "title": title,
+                    "platform": platform_id,
+                    "platform_name": platform_name,
+                    "similarity": round(scores[entry_id], 3),
+                    "rank": info["ranks"][0] if info["ranks"] else 0
+                }
 
-                        # 条件性添加 URL 字段
-                        if include_url:
-                            news_item["url"] = info.get("url", "")
+                # 条件性添加 URL 字段
+                if include_url:
+                    news_item["url"] = info.get("url", "")
 
-                        similar_items.append(news_item)
+                similar_items.append(news_item)
 
             # 按相似度排序
             similar_items.sort(key=lambda x: x["similarity"], reverse=True)
@@ -1116,10 +1151,7 @@ class AnalyticsTools:
 
             # 按权重排序（如果启用）
             if sort_by_weight:
-                related_news.sort(
-                    key=lambda x: calculate_news_weight(x),
-                    reverse=True
-                )
+                related_news = sort_news_by_weight(related_news)
             else:
                 # 按排名排序
                 related_news.sort(key=lambda x: x["rank"])
@@ -1207,32 +1239,14 @@ class AnalyticsTools:
             all_platforms_news = defaultdict(int)
             all_titles_list = []
 
-            current_date = start_date
-            while current_date <= end_date:
-                try:
-                    all_titles, id_to_name, _ = self.data_service.parser.read_all_titles_for_date(
-                        date=current_date
-                    )
-
-                    for platform_id, titles in all_titles.items():
-                        platform_name = id_to_name.get(platform_id, platform_id)
-                        all_platforms_news[platform_name] += len(titles)
-
-                        for title in titles.keys():
-                            all_titles_list.append({
-                                "title": title,
-                                "platform": platform_name,
-                                "date": current_date.strftime("%Y-%m-%d")
-                            })
-
-                            # 提取关键词
-                            keywords = self._extract_keywords(title)
-                            all_keywords.update(keywords)
-
-                except DataNotFoundError:
-                    pass
-
-                current_date += timedelta(days=1)
+            # 逐日统计（可并行），按日期顺序合并
+            for _, (platform_counts, day_titles, day_keywords) in scan_dates(
+                self, start_date, end_date, "_summary_day_stats"
+            ):
+                for platform_name, count in platform_counts:
+                    all_platforms_news[platform_name] += count
+                all_titles_list.extend(day_titles)
+                all_keywords.update(day_keywords)
 
             # 生成报告
             report_title = f"{'每日' if report_type == 'daily' else '每周'}新闻热点摘要"
@@ -1284,13 +1298,14 @@ class AnalyticsTools:
             # 这样相同输入总是返回相同结果
             if all_titles_list:
                 # 计算每条新闻的权重分数（基于关键词出现次数）
+                top_keyword_counts = [(keyword.lower(), count) for keyword, count in all_keywords.most_common(10)]
                 news_with_scores = []
                 for news in all_titles_list:
                     # 简单权重：统计包含TOP关键词的次数
                     score = 0
                     title_lower = news['title'].lower()
-                    for keyword, count in all_keywords.most_common(10):
-                        if keyword.lower() in title_lower:
+                    for keyword_lower, count in top_keyword_counts:
+                        if keyword_lower in title_lower:
                             score += count
                     news_with_scores.append((news, score))
 
@@ -1335,6 +1350,39 @@ class AnalyticsTools:
                 }
             }
 
+    def _summary_day_stats(
+        self,
+        date: datetime,
+        all_titles: Dict,
+        id_to_name: Dict,
+        timestamps: Dict
+    ) -> Tuple[List[Tuple[str, int]], List[Dict], Counter]:
+        """
+        统计单日各平台新闻数、标题与关键词（generate_summary_report 的逐日部分）
+
+        Returns:
+            ([(平台名称, 新闻数)], 标题列表, 关键词计数)
+        """
+        platform_counts = []
+        day_titles = []
+        date_str = date.strftime("%Y-%m-%d")
+
+        for platform_id, titles in all_titles.items():
+            platform_name = id_to_name.get(platform_id, platform_id)
+            platform_counts.append((platform_name, len(titles)))
+
+            for title in titles.keys():
+                day_titles.append({
+                    "title": title,
+                    "platform": platform_name,
+                    "date": date_str
+                })
+
+        # 关键词使用预先计算的当日统计
+        day_keywords = self._get_keyword_rollup(date).keyword_counts
+
+        return platform_counts, day_titles, day_keywords
+
     def get_platform_activity_stats(
         self,
         date_range: Optional[Dict[str, str]] = None
@@ -1379,35 +1427,21 @@ class AnalyticsTools:
                 "hourly_distribution": Counter()
             })
 
-            # 遍历日期范围
-            current_date = start_date
-            while current_date <= end_date:
-                try:
-                    all_titles, id_to_name, timestamps = self.data_service.parser.read_all_titles_for_date(
-                        date=current_date
-                    )
-
-                    for platform_id, titles in all_titles.items():
-                        platform_name = id_to_name.get(platform_id, platform_id)
-
-                        platform_activity[platform_name]["news_count"] += len(titles)
-                        platform_activity[platform_name]["days_active"].add(current_date.strftime("%Y-%m-%d"))
-
-                        # 统计更新次数（基于文件数量）
-                        platform_activity[platform_name]["total_updates"] += len(timestamps)
+            # 逐日统计（可并行），按日期顺序合并
+            for date, (platform_counts, total_updates, hours) in scan_dates(
+                self, start_date, end_date, "_activity_day_stats"
+            ):
+                date_str = date.strftime("%Y-%m-%d")
+                for platform_name, news_count in platform_counts:
+                    platform_activity[platform_name]["news_count"] += news_count
+                    platform_activity[platform_name]["days_active"].add(date_str)
 
-                        # 统计时间分布（基于文件名中的时间）
-                        for filename in timestamps.keys():
-                            # 解析文件名中的小时（格式：HHMM.txt）
-                            match = re.match(r'(\d{2})(\d{2})\.txt', filename)
-                            if match:
-                                hour = int(match.group(1))
-                                platform_activity[platform_name]["hourly_distribution"][hour] += 1
-
-                except DataNotFoundError:
-                    pass
+                    # 统计更新次数（基于文件数量）
+                    platform_activity[platform_name]["total_updates"] += total_updates
 
-                current_date += timedelta(days=1)
+                    # 统计时间分布（基于文件名中的时间）
+                    for hour in hours:
+                        platform_activity[platform_name]["hourly_distribution"][hour] += 1
 
             # 转换为可序列化的格式
             result_activity = {}
@@ -1462,6 +1496,33 @@ class AnalyticsTools:
                 }
             }
 
+    def _activity_day_stats(
+        self,
+        date: datetime,
+        all_titles: Dict,
+        id_to_name: Dict,
+        timestamps: Dict
+    ) -> Tuple[List[Tuple[str, int]], int, List[int]]:
+        """
+        统计单日各平台新闻数与抓取时间分布（get_platform_activity_stats 的逐日部分）
+
+        Returns:
+            ([(平台名称, 新闻数)], 文件数量, 文件名中解析出的小时列表)
+        """
+        platform_counts = [
+            (id_to_name.get(platform_id, platform_id), len(titles))
+            for platform_id, titles in all_titles.items()
+        ]
+
+        hours = []
+        for filename in timestamps.keys():
+            # 解析文件名中的小时（格式：HHMM.txt）
+            match = re.match(r'(\d{2})(\d{2})\.txt', filename)
+            if match:
+                hours.append(int(match.group(1)))
+
+        return platform_counts, len(timestamps), hours
+
     def analyze_topic_lifecycle(
         self,
         topic: str,
@@ -1507,32 +1568,19 @@ class AnalyticsTools:
                 end_date = datetime.now()
                 start_date = end_date - timedelta(days=6)
 
-            # 收集话题历史数据
+            # 收集话题历史数据（一次历史库查询，按日期分组）
+            titles_by_date = self.data_service.get_topic_titles_by_date(
+                topic, start_date, end_date
+            )
+
             lifecycle_data = []
             current_date = start_date
             while current_date <= end_date:
-                try:
-                    all_titles, _, _ = self.data_service.parser.read_all_titles_for_date(
-                        date=current_date
-                    )
-
-                    # 统计该日的话题出现次数
-                    count = 0
-                    for _, titles in all_titles.items():
-                        for title in titles.keys():
-                            if topic.lower() in title.lower():
-                                count += 1
-
-                    lifecycle_data.append({
-                        "date": current_date.strftime("%Y-%m-%d"),
-                        "count": count
-                    })
-
-                except DataNotFoundError:
-                    lifecycle_data.append({
-                        "date": current_date.strftime("%Y-%m-%d"),
-                        "count": 0
-                    })
+                date_key = current_date.strftime("%Y-%m-%d")
+                lifecycle_data.append({
+                    "date": date_key,
+                    "count": len(titles_by_date.get(date_key, []))
+                })
 
                 current_date += timedelta(days=1)
 
@@ -1660,36 +1708,16 @@ class AnalyticsTools:
             time_window = validate_limit(time_window, default=24, max_limit=72)
 
             # 读取当前和之前的数据
-            current_all_titles, _, _ = self.data_service.parser.read_all_titles_for_date()
+            # 当前的关键词频率（预先计算的当日统计）
+            current_rollup = self._get_keyword_rollup()
+            current_keywords = current_rollup.keyword_counts
 
-            # 读取昨天的数据作为基准
+            # 读取昨天的关键词频率作为基准
             yesterday = datetime.now() - timedelta(days=1)
             try:
-                previous_all_titles, _, _ = self.data_service.parser.read_all_titles_for_date(
-                    date=yesterday
-                )
+                previous_keywords = self._get_keyword_rollup(yesterday).keyword_counts
             except DataNotFoundError:
-                previous_all_titles = {}
-
-            # 统计当前的关键词频率
-            current_keywords = Counter()
-            current_keyword_titles = defaultdict(list)
-
-            for _, titles in current_all_titles.items():
-                for title in titles.keys():
-                    keywords = self._extract_keywords(title)
-                    current_keywords.update(keywords)
-
-                    for kw in keywords:
-                        current_keyword_titles[kw].append(title)
-
-            # 统计之前的关键词频率
-            previous_keywords = Counter()
-
-            for _, titles in previous_all_titles.items():
-                for title in titles.keys():
-                    keywords = self._extract_keywords(title)
-                    previous_keywords.update(keywords)
+                previous_keywords = Counter()
 
             # 检测异常热度
             viral_topics = []
@@ -1715,7 +1743,7 @@ class AnalyticsTools:
                         "current_count": current_count,
                         "previous_count": previous_count,
                         "growth_rate": round(growth_rate, 2) if growth_rate != float('inf') else "新话题",
-                        "sample_titles": current_keyword_titles[keyword][:3],
+                        "sample_titles": current_rollup.keyword_titles(keyword)[:3],
                         "alert_level": "高" if growth_rate > threshold * 2 else "中"
                     })
 
@@ -1802,16 +1830,8 @@ class AnalyticsTools:
                 date = datetime.now() - timedelta(days=days_ago)
 
                 try:
-                    all_titles, _, _ = self.data_service.parser.read_all_titles_for_date(
-                        date=date
-                    )
-
-                    # 统计关键词
-                    keywords_count = Counter()
-                    for _, titles in all_titles.items():
-                        for title in titles.keys():
-                            keywords = self._extract_keywords(title)
-                            keywords_count.update(keywords)
+                    # 预先计算的当日关键词统计
+                    keywords_count = self._get_keyword_rollup(date).keyword_counts
 
                     # 记录每个关键词的历史数据
                     for keyword, count in keywords_count.items():
@@ -1822,20 +1842,9 @@ class AnalyticsTools:
 
             # 添加今天的数据
             try:
-                all_titles, _, _ = self.data_service.parser.read_all_titles_for_date()
-
-                keywords_count = Counter()
-                keyword_titles = defaultdict(list)
+                today_rollup = self._get_keyword_rollup()
 
-                for _, titles in all_titles.items():
-                    for title in titles.keys():
-                        keywords = self._extract_keywords(title)
-                        keywords_count.update(keywords)
-
-                        for kw in keywords:
-                            keyword_titles[kw].append(title)
-
-                for keyword, count in keywords_count.items():
+                for keyword, count in today_rollup.keyword_counts.items():
                     keyword_trends[keyword].append(count)
 
             except DataNotFoundError:
@@ -1885,7 +1894,7 @@ class AnalyticsTools:
                             "confidence": round(confidence, 2),
                             "trend_data": trend_data,
                             "prediction": "上升趋势，可能成为热点",
-                            "sample_titles": keyword_titles.get(keyword, [])[:3]
+                            "sample_titles": today_rollup.keyword_titles(keyword)[:3]
                         })
 
             # 按置信度和增长率排序
@@ -1920,9 +1929,27 @@ class AnalyticsTools:
 
     # ==================== 辅助方法 ====================
 
+    def _get_keyword_rollup(self, date: Optional[datetime] = None) -> KeywordRollup:
+        """
+        获取某天（所有平台）预先计算的关键词统计
+
+        Args:
+            date: 日期，None 表示今天
+
+        Returns:
+            关键词统计表
+
+        Raises:
+            DataNotFoundError: 该日期没有数据
+        """
+        return get_keyword_rollup(
+            self.data_service.parser, date, self._extract_keywords,
+            f"{KEYWORD_TOKENIZER_VERSION}:{self.tokenizer.version}"
+        )
+
     def _extract_keywords(self, title: str, min_length: int = 2) -> List[str]:
         """
-        从标题中提取关键词（简单实现）
+        从标题中提取关键词
 
         Args:
             title: 标题文本
@@ -1931,23 +1958,12 @@ class AnalyticsTools:
         Returns:
             关键词列表
         """
-        # 移除URL和特殊字符
-        title = re.sub(r'http[s]?://\S+', '', title)
-        title = re.sub(r'[^\w\s]', ' ', title)
-
-        # 简单分词（按空格和常见分隔符）
-        words = re.split(r'[\s，。！？、]+', title)
-
-        # 过滤停用词和短词
-        stopwords = {'的', '了', '在', '是', '我', '有', '和', '就', '不', '人', '都', '一', '一个', '上', '也', '很', '到', '说', '要', '去', '你', '会', '着', '没有', '看', '好', '自己', '这'}
-
-        keywords = [
-            word.strip() for word in words
-            if word.strip() and len(word.strip()) >= min_length and word.strip() not in stopwords
+        # 分词结果按标题缓存，各工具共用；纯数字（年份、期数等）不作为话题关键词
+        return [
+            word for word in self.tokenizer.segment(title)
+            if len(word) >= min_length and word not in KEYWORD_STOPWORDS and not word.isdigit()
         ]
 
-        return keywords
-
     def _calculate_similarity(self, text1: str, text2: str) -> float:
         """
         计算两个文本的相似度
@@ -1960,7 +1976,7 @@ class AnalyticsTools:
             相似度分数（0-1之间）
         """
         # 使用 SequenceMatcher 计算相似度
-        return SequenceMatcher(None, text1, text2).ratio()
+        return text_similarity(text1, text2, ignore_case=False)
 
     def _find_unique_topics(self, platform_stats: Dict) -> Dict[str, List[str]]:
         """
@@ -7,10 +7,13 @@
 import re
 from collections import Counter
 from datetime import datetime, timedelta
-from difflib import SequenceMatcher
 from typing import Dict, List, Optional, Tuple
 
 from ..services.data_service import DataService
+from ..services.parallel_scan import scan_dates
+from ..services.search_index import TitleSearchIndex, get_search_index
+from ..services.similarity import get_similarity_index, text_similarity
+from ..services.tokenizer import get_tokenizer
 from ..utils.validators import validate_keyword, validate_limit
 from ..utils.errors import MCPError, InvalidParameterError, DataNotFoundError
 
@@ -26,6 +29,7 @@ class SearchTools:
             project_root: 项目根目录
         """
         self.data_service = DataService(project_root)
+        self.tokenizer = get_tokenizer(project_root)
         # 中文停用词列表
         self.stopwords = {
             '的', '了', '在', '是', '我', '有', '和', '就', '不', '人', '都', '一',
@@ -122,37 +126,21 @@ class SearchTools:
 
             # 收集所有匹配的新闻
             all_matches = []
-            current_date = start_date
-
-            while current_date <= end_date:
-                try:
-                    all_titles, id_to_name, timestamps = self.data_service.parser.read_all_titles_for_date(
-                        date=current_date,
-                        platform_ids=platforms
-                    )
-
-                    # 根据搜索模式执行不同的搜索逻辑
-                    if search_mode == "keyword":
-                        matches = self._search_by_keyword_mode(
-                            query, all_titles, id_to_name, current_date, include_url
-                        )
-                    elif search_mode == "fuzzy":
-                        matches = self._search_by_fuzzy_mode(
-                            query, all_titles, id_to_name, current_date, threshold, include_url
-                        )
-                    else:  # entity
-                        matches = self._search_by_entity_mode(
-                            query, all_titles, id_to_name, current_date, include_url
-                        )
 
+            if search_mode == "keyword":
+                # 精确匹配直接查询历史库，无需逐日解析文件
+                all_matches = self._search_by_keyword_mode(
+                    query, start_date, end_date, platforms, include_url
+                )
+            else:
+                # 逐日搜索（可并行），按日期顺序合并
+                for _, matches in scan_dates(
+                    self, start_date, end_date, "_search_day",
+                    search_mode, query, threshold, include_url,
+                    platform_ids=platforms
+                ):
                     all_matches.extend(matches)
 
-                except DataNotFoundError:
-                    # 该日期没有数据，继续下一天
-                    pass
-
-                current_date += timedelta(days=1)
-
             if not all_matches:
                 # 获取可用日期范围用于错误提示
                 earliest, latest = self.data_service.get_available_date_range()
@@ -187,8 +175,8 @@ class SearchTools:
             if sort_by == "relevance":
                 all_matches.sort(key=lambda x: x.get("similarity_score", 1.0), reverse=True)
             elif sort_by == "weight":
-                from .analytics import calculate_news_weight
-                all_matches.sort(key=lambda x: calculate_news_weight(x), reverse=True)
+                from .analytics import sort_news_by_weight
+                all_matches = sort_news_by_weight(all_matches)
             elif sort_by == "date":
                 all_matches.sort(key=lambda x: x.get("date", ""), reverse=True)
 
@@ -242,9 +230,9 @@ class SearchTools:
     def _search_by_keyword_mode(
         self,
         query: str,
-        all_titles: Dict,
-        id_to_name: Dict,
-        current_date: datetime,
+        start_date: datetime,
+        end_date: datetime,
+        platforms: Optional[List[str]],
         include_url: bool
     ) -> List[Dict]:
         """
@@ -252,42 +240,64 @@ class SearchTools:
 
         Args:
             query: 搜索关键词
-            all_titles: 所有标题字典
-            id_to_name: 平台ID到名称映射
-            current_date: 当前日期
+            start_date: 开始日期
+            end_date: 结束日期
+            platforms: 平台过滤列表
 
         Returns:
             匹配的新闻列表
         """
         matches = []
-        query_lower = query.lower()
-
-        for platform_id, titles in all_titles.items():
-            platform_name = id_to_name.get(platform_id, platform_id)
 
-            for title, info in titles.items():
-                # 精确包含判断
-                if query_lower in title.lower():
-                    news_item = {
-                        "title": title,
-                        "platform": platform_id,
-                        "platform_name": platform_name,
-                        "date": current_date.strftime("%Y-%m-%d"),
-                        "similarity_score": 1.0,  # 精确匹配，相似度为1
-                        "ranks": info.get("ranks", []),
-                        "count": len(info.get("ranks", [])),
-                        "rank": info["ranks"][0] if info["ranks"] else 999
-                    }
+        for item in self.data_service.history.search_titles(query, start_date, end_date, platforms):
+            ranks = item["ranks"]
+            news_item = {
+                "title": item["title"],
+                "platform": item["platform_id"],
+                "platform_name": item["platform_name"],
+                "date": item["date"],
+                "similarity_score": 1.0,  # 精确匹配，相似度为1
+                "ranks": ranks,
+                "count": len(ranks),
+                "rank": ranks[0] if ranks else 999
+            }
 
-                    # 条件性添加 URL 字段
-                    if include_url:
-                        news_item["url"] = info.get("url", "")
-                        news_item["mobileUrl"] = info.get("mobileUrl", "")
+            # 条件性添加 URL 字段
+            if include_url:
+                news_item["url"] = item["url"]
+                news_item["mobileUrl"] = item["mobileUrl"]
 
-                    matches.append(news_item)
+            matches.append(news_item)
 
         return matches
 
+    def _search_day(
+        self,
+        date: datetime,
+        all_titles: Dict,
+        id_to_name: Dict,
+        timestamps: Dict,
+        search_mode: str,
+        query: str,
+        threshold: float,
+        include_url: bool
+    ) -> List[Dict]:
+        """
+        搜索单日数据（search_news_unified 的逐日部分）
+
+        Returns:
+            匹配的新闻列表
+        """
+        # 根据搜索模式执行不同的搜索逻辑
+        if search_mode == "fuzzy":
+            return self._search_by_fuzzy_mode(
+                query, all_titles, id_to_name, date, threshold, include_url
+            )
+        # entity
+        return self._search_by_entity_mode(
+            query, all_titles, id_to_name, date, include_url
+        )
+
     def _search_by_fuzzy_mode(
         self,
         query: str,
@@ -311,32 +321,34 @@ class SearchTools:
             匹配的新闻列表
         """
         matches = []
+        index = self._get_search_index(current_date, all_titles)
 
-        for platform_id, titles in all_titles.items():
+        # 先用倒排索引和相似度索引筛选候选，再逐条匹配
+        for entry_id in sorted(self._fuzzy_candidates(index, current_date, query, threshold)):
+            platform_id, title, info = index.entries[entry_id]
             platform_name = id_to_name.get(platform_id, platform_id)
 
-            for title, info in titles.items():
-                # 模糊匹配
-                is_match, similarity = self._fuzzy_match(query, title, threshold)
-
-                if is_match:
-                    news_item = {
-                        "title": title,
-                        "platform": platform_id,
-                        "platform_name": platform_name,
-                        "date": current_date.strftime("%Y-%m-%d"),
-                        "similarity_score": round(similarity, 4),
-                        "ranks": info.get("ranks", []),
-                        "count": len(info.get("ranks", [])),
-                        "rank": info["ranks"][0] if info["ranks"] else 999
-                    }
+            # 模糊匹配
+            is_match, similarity = self._fuzzy_match(query, title, threshold)
+
+            if is_match:
+                news_item = {
+                    "title": title,
+                    "platform": platform_id,
+                    "platform_name": platform_name,
+                    "date": current_date.strftime("%Y-%m-%d"),
+                    "similarity_score": round(similarity, 4),
+                    "ranks": info.get("ranks", []),
+                    "count": len(info.get("ranks", [])),
+                    "rank": info["ranks"][0] if info["ranks"] else 999
+                }
 
-                    # 条件性添加 URL 字段
-                    if include_url:
-                        news_item["url"] = info.get("url", "")
-                        news_item["mobileUrl"] = info.get("mobileUrl", "")
+                # 条件性添加 URL 字段
+                if include_url:
+                    news_item["url"] = info.get("url", "")
+                    news_item["mobileUrl"] = info.get("mobileUrl", "")
 
-                    matches.append(news_item)
+                matches.append(news_item)
 
         return matches
 
@@ -361,33 +373,97 @@ class SearchTools:
             匹配的新闻列表
         """
         matches = []
+        index = self._get_search_index(current_date, all_titles)
 
-        for platform_id, titles in all_titles.items():
+        for entry_id in sorted(index.substring_candidates(query.lower())):
+            platform_id, title, info = index.entries[entry_id]
             platform_name = id_to_name.get(platform_id, platform_id)
 
-            for title, info in titles.items():
-                # 实体搜索：精确包含实体名称
-                if query in title:
-                    news_item = {
-                        "title": title,
-                        "platform": platform_id,
-                        "platform_name": platform_name,
-                        "date": current_date.strftime("%Y-%m-%d"),
-                        "similarity_score": 1.0,
-                        "ranks": info.get("ranks", []),
-                        "count": len(info.get("ranks", [])),
-                        "rank": info["ranks"][0] if info["ranks"] else 999
-                    }
+            # 实体搜索：精确包含实体名称
+            if query in title:
+                news_item = {
+                    "title": title,
+                    "platform": platform_id,
+                    "platform_name": platform_name,
+                    "date": current_date.strftime("%Y-%m-%d"),
+                    "similarity_score": 1.0,
+                    "ranks": info.get("ranks", []),
+                    "count": len(info.get("ranks", [])),
+                    "rank": info["ranks"][0] if info["ranks"] else 999
+                }
 
-                    # 条件性添加 URL 字段
-                    if include_url:
-                        news_item["url"] = info.get("url", "")
-                        news_item["mobileUrl"] = info.get("mobileUrl", "")
+                # 条件性添加 URL 字段
+                if include_url:
+                    news_item["url"] = info.get("url", "")
+                    news_item["mobileUrl"] = info.get("mobileUrl", "")
 
-                    matches.append(news_item)
+                matches.append(news_item)
 
         return matches
 
+    def _get_search_index(self, date: datetime, all_titles: Dict) -> TitleSearchIndex:
+        """
+        获取某天标题数据的倒排索引
+
+        Args:
+            date: 日期
+            all_titles: 该日期的标题数据
+
+        Returns:
+            标题倒排索引
+        """
+        return get_search_index(
+            self.data_service.parser.get_date_folder_name(date),
+            all_titles,
+            self._extract_keywords
+        )
+
+    def _fuzzy_candidates(
+        self,
+        index: TitleSearchIndex,
+        date: datetime,
+        query: str,
+        threshold: float
+    ) -> set:
+        """
+        筛选可能被 _fuzzy_match 判定为匹配的标题
+
+        候选为以下三类的并集：包含查询串的标题、相似度上界达到阈值的标题、
+        查询关键词命中一半以上的标题，覆盖 _fuzzy_match 的全部命中条件。
+
+        Args:
+            index: 标题倒排索引
+            date: 标题数据所属日期
+            query: 查询文本
+            threshold: 相似度阈值
+
+        Returns:
+            候选标题编号集合
+        """
+        if threshold <= 0:
+            return index.all_candidates()
+
+        query_lower = query.lower()
+        candidates = index.substring_candidates(query_lower)
+        similarity_index = get_similarity_index(
+            self.data_service.parser.get_date_folder_name(date), index.source
+        )
+        candidates.update(
+            entry_id
+            for entry_id, bound in similarity_index.upper_bounds(query_lower).items()
+            if bound >= threshold
+        )
+
+        query_words = set(self._extract_keywords(query))
+        if query_words:
+            candidates.update(
+                entry_id
+                for entry_id, hits in index.token_hits(query_words).items()
+                if hits / len(query_words) >= 0.5
+            )
+
+        return candidates
+
     def _calculate_similarity(self, text1: str, text2: str) -> float:
         """
         计算两个文本的相似度
@@ -399,8 +475,8 @@ class SearchTools:
         Returns:
             相似度分数 (0-1之间)
         """
-        # 使用 difflib.SequenceMatcher 计算序列相似度
-        return SequenceMatcher(None, text1.lower(), text2.lower()).ratio()
+        # 使用 difflib.SequenceMatcher 计算序列相似度（忽略大小写）
+        return text_similarity(text1, text2)
 
     def _fuzzy_match(self, query: str, text: str, threshold: float = 0.3) -> Tuple[bool, float]:
         """
@@ -450,17 +526,14 @@ class SearchTools:
         Returns:
             关键词列表
         """
-        # 移除URL和特殊字符
-        text = re.sub(r'http[s]?://\S+', '', text)
-        text = re.sub(r'\[.*?\]', '', text)  # 移除方括号内容
+        # 移除方括号内容（URL 由分词器移除）
+        if '[' in text:
+            text = re.sub(r'\[.*?\]', '', text)
 
-        # 使用正则表达式分词（中文和英文）
-        words = re.findall(r'[\w]+', text)
-
-        # 过滤停用词和短词
+        # 分词结果按文本缓存，各工具共用
         keywords = [
-            word for word in words
-            if word and len(word) >= min_length and word not in self.stopwords
+            word for word in self.tokenizer.segment(text)
+            if len(word) >= min_length and word not in self.stopwords
         ]
 
         return keywords
@@ -581,45 +654,63 @@ class SearchTools:
                     # 读取该日期的数据
                     all_titles, id_to_name, _ = self.data_service.parser.read_all_titles_for_date(current_date)
 
+                    # 筛选候选：与参考文本有共同关键词，或文本相似度可能达到阈值
+                    index = self._get_search_index(current_date, all_titles)
+                    if threshold <= 0:
+                        candidates = index.all_candidates()
+                    else:
+                        candidates = set(index.token_hits(set(reference_keywords)))
+                        # 没有共同关键词时综合得分只剩 30% 的文本相似度
+                        if threshold <= 0.3:
+                            similarity_index = get_similarity_index(
+                                self.data_service.parser.get_date_folder_name(current_date),
+                                all_titles
+                            )
+                            candidates.update(
+                                entry_id
+                                for entry_id, bound in similarity_index.upper_bounds(reference_text.lower()).items()
+                                if bound * 0.3 >= threshold
+                            )
+
                     # 搜索相关新闻
-                    for platform_id, titles in all_titles.items():
+                    for entry_id in sorted(candidates):
+                        platform_id, title, info = index.entries[entry_id]
                         platform_name = id_to_name.get(platform_id, platform_id)
 
-                        for title, info in titles.items():
-                            # 计算标题相似度
-                            title_similarity = self._calculate_similarity(reference_text, title)
+                        # 计算标题相似度
+                        title_similarity = self._calculate_similarity(reference_text, title)
 
-                            # 提取标题关键词
-                            title_keywords = self._extract_keywords(title)
+                        # 提取标题关键词
+                        title_keywords = self._extract_keywords(title)
 
-                            # 计算关键词重合度
-                            keyword_overlap = self._calculate_keyword_overlap(
-                                reference_keywords,
-                                title_keywords
-                            )
+                        # 计算关键词重合度
+                        keyword_overlap = self._calculate_keyword_overlap(
+                            reference_keywords,
+                            title_keywords
+                        )
 
-                            # 综合相似度 (70% 关键词重合 + 30% 文本相似度)
-                            combined_score = keyword_overlap * 0.7 + title_similarity * 0.3
-
-                            if combined_score >= threshold:
-                                news_item = {
-                                    "title": title,
-                                    "platform": platform_id,
-                                    "platform_name": platform_name,
-                                    "date": current_date.strftime("%Y-%m-%d"),
-                                    "similarity_score": round(combined_score, 4),
-                                    "keyword_overlap": round(keyword_overlap, 4),
-                                    "text_similarity": round(title_similarity, 4),
-                                    "common_keywords": list(set(reference_keywords) & set(title_keywords)),
-                                    "rank": info["ranks"][0] if info["ranks"] else 0
-                                }
-
-                                # 条件性添加 URL 字段
-                                if include_url:
-                                    news_item["url"] = info.get("url", "")
-                                    news_item["mobileUrl"] = info.get("mobileUrl", "")
-
-                                all_related_news.append(news_item)
+                        # 综合相似度 (70% 关键词重合 + 30% 文本相似度)
+                        combined_score = keyword_overlap * 0.7 + title_similarity * 0.3
+
+                        if combined_score >= threshold:
+                            news_item = {
+                                "title": title,
+                                "platform": platform_id,
+                                "platform_name": platform_name,
+                                "date": current_date.strftime("%Y-%m-%d"),
+                                "similarity_score": round(combined_score, 4),
+                                "keyword_overlap": round(keyword_overlap, 4),
+                                "text_similarity": round(title_similarity, 4),
+                                "common_keywords": list(set(reference_keywords) & set(title_keywords)),
+                                "rank": info["ranks"][0] if info["ranks"] else 0
+                            }
+
+                            # 条件性添加 URL 字段
+                            if include_url:
+                                news_item["url"] = info.get("url", "")
+                                news_item["mobileUrl"] = info.get("mobileUrl", "")
+
+                            all_related_news.append(news_item)
 
                 except DataNotFoundError:
                     # 该日期没有数据，继续下一天
@@ -8,6 +8,7 @@ from pathlib import Path
 from typing import Dict, List, Optional
 
 from ..services.data_service import DataService
+from ..services.http_service import get_http_service
 from ..utils.validators import validate_platforms
 from ..utils.errors import MCPError, CrawlTaskError
 
@@ -90,7 +91,6 @@ class SystemManagementTools:
             import json
             import time
             import random
-            import requests
             from datetime import datetime
             import pytz
             import yaml
@@ -129,8 +129,15 @@ class SystemManagementTools:
             else:
                 target_platforms = all_platforms
 
-            # 获取请求间隔
-            request_interval = config_data.get("crawler", {}).get("request_interval", 100)
+            # 获取请求间隔和代理配置
+            crawler_config = config_data.get("crawler", {})
+            request_interval = crawler_config.get("request_interval", 100)
+            proxy_url = (
+                crawler_config.get("default_proxy")
+                if crawler_config.get("use_proxy")
+                else None
+            )
+            http = get_http_service()
 
             # 构建平台ID列表
             ids = []
@@ -174,7 +181,7 @@ class SystemManagementTools:
 
                 while retries <= max_retries and not success:
                     try:
-                        response = requests.get(url, headers=headers, timeout=10)
+                        response = http.get(url, headers=headers, proxy_url=proxy_url)
                         response.raise_for_status()
 
                         data_text = response.text